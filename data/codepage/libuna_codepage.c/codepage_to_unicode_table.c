@@ -1,5 +0,0 @@
-/* Extended ASCII to Unicode character lookup table for the ${codepage_description} codepage
- * Unknown are filled with the Unicode replacement character 0xfffd
- */
-${codepage_to_unicode_table}
-
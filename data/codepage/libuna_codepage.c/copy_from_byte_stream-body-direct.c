@@ -0,0 +1 @@
+	safe_unicode_character = byte_stream_character;
@@ -0,0 +1,27 @@
+	if( ( byte_stream_character >= ${first_lead_byte} )
+	 && ( byte_stream_character <= ${last_lead_byte} )
+	 && ( libuna_codepage_${codepage_name}_lead_byte_last_trail_byte[ byte_stream_character - ${first_lead_byte} ] != 0 ) )
+	{
+		size_t lead_byte_index = (size_t) byte_stream_character - ${first_lead_byte};
+
+		if( safe_byte_stream_index >= byte_stream_size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: byte stream too small.",
+			 function );
+
+			return( -1 );
+		}
+		byte_stream_character = byte_stream[ safe_byte_stream_index++ ];
+
+		if( ( byte_stream_character >= libuna_codepage_${codepage_name}_lead_byte_first_trail_byte[ lead_byte_index ] )
+		 && ( byte_stream_character <= libuna_codepage_${codepage_name}_lead_byte_last_trail_byte[ lead_byte_index ] ) )
+		{
+			byte_stream_character -= libuna_codepage_${codepage_name}_lead_byte_first_trail_byte[ lead_byte_index ];
+
+			safe_unicode_character = libuna_codepage_${codepage_name}_double_byte_to_unicode_data[ libuna_codepage_${codepage_name}_lead_byte_offset[ lead_byte_index ] + byte_stream_character ];
+		}
+	}
@@ -0,0 +1,4 @@
+	${lower_condition}
+	{
+		safe_unicode_character = byte_stream_character;
+	}
@@ -0,0 +1,5 @@
+	${lookup_condition}
+	{
+		safe_unicode_character = libuna_codepage_${codepage_name}_byte_stream_to_unicode_search(
+		                          (uint32_t) byte_stream_character );
+	}
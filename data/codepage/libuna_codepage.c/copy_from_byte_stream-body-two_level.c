@@ -0,0 +1,6 @@
+	${lookup_condition}
+	{
+		byte_stream_character -= ${table_base};
+
+		safe_unicode_character = libuna_codepage_${codepage_name}_byte_stream_to_unicode_data[ ( (size_t) libuna_codepage_${codepage_name}_byte_stream_to_unicode_index[ byte_stream_character >> ${page_bits} ] << ${page_bits} ) | ( byte_stream_character & ${page_mask} ) ];
+	}
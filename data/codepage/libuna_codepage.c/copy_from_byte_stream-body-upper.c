@@ -0,0 +1,4 @@
+	else
+	{
+		safe_unicode_character = byte_stream_character;
+	}
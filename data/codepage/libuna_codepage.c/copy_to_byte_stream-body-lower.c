@@ -1,4 +1,4 @@
-	if( unicode_character < 0x0080 )
+	${lower_condition}
 	{
 		byte_stream_value = (uint16_t) unicode_character;
 	}
@@ -0,0 +1,5 @@
+	${lookup_condition}
+	{
+		byte_stream_value = libuna_codepage_${codepage_name}_unicode_to_byte_stream_search(
+		                     (uint32_t) unicode_character );
+	}
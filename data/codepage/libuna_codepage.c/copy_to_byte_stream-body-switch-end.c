@@ -1,4 +0,0 @@
-		default:
-			byte_stream_value = 0x1a;
-			break;
-	}
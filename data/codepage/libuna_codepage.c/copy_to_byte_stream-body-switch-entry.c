@@ -1,4 +0,0 @@
-		case ${unicode_value}:
-			byte_stream_value = ${codepage_value};
-			break;
-
@@ -1,2 +0,0 @@
-	else switch( unicode_character )
-	{
@@ -0,0 +1,6 @@
+	${lookup_condition}
+	{
+		unicode_character -= ${table_base};
+
+		byte_stream_value = libuna_codepage_${codepage_name}_unicode_to_byte_stream_data[ ( (size_t) libuna_codepage_${codepage_name}_unicode_to_byte_stream_index[ unicode_character >> ${page_bits} ] << ${page_bits} ) | ( unicode_character & ${page_mask} ) ];
+	}
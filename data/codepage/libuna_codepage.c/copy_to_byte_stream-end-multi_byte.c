@@ -0,0 +1,22 @@
+	if( byte_stream_value > 0x00ff )
+	{
+		if( ( byte_stream_size - safe_byte_stream_index ) < 2 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: byte stream too small.",
+			 function );
+
+			return( -1 );
+		}
+		byte_stream[ safe_byte_stream_index++ ] = (uint8_t) ( byte_stream_value >> 8 );
+	}
+	byte_stream[ safe_byte_stream_index++ ] = (uint8_t) ( byte_stream_value & 0x00ff );
+
+	*byte_stream_index = safe_byte_stream_index;
+
+	return( 1 );
+}
+
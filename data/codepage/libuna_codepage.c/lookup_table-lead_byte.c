@@ -0,0 +1,23 @@
+/* Lead byte lookup tables for the ${codepage_description} codepage
+ * Contains per lead byte the first and last trail byte and the offset of its values in the double byte data
+ * The last trail byte of a value that is not a lead byte is 0
+ */
+const uint8_t libuna_codepage_${codepage_name}_lead_byte_first_trail_byte[ ${number_of_lead_bytes} ] = {
+${first_trail_byte_entries}
+};
+
+const uint8_t libuna_codepage_${codepage_name}_lead_byte_last_trail_byte[ ${number_of_lead_bytes} ] = {
+${last_trail_byte_entries}
+};
+
+const ${offset_type} libuna_codepage_${codepage_name}_lead_byte_offset[ ${number_of_lead_bytes} ] = {
+${offset_entries}
+};
+
+/* Double byte to Unicode character lookup table for the ${codepage_description} codepage
+ * Unknown are filled with the Unicode replacement character 0xfffd
+ */
+const uint16_t libuna_codepage_${codepage_name}_double_byte_to_unicode_data[ ${number_of_data_entries} ] = {
+${data_entries}
+};
+
@@ -0,0 +1,40 @@
+/* ${table_description} lookup table for the ${codepage_description} codepage
+ * The table contains sorted ranges of consecutively mapped values, stored as: first, number of values, base
+ * Unknown are mapped to the ${default_description} ${default_value}
+ */
+const uint16_t libuna_codepage_${codepage_name}_${table_name}_ranges[ ${number_of_range_values} ] = {
+${range_entries}
+};
+
+/* Searches the ${table_description} lookup table for the ${codepage_description} codepage
+ * Returns the mapped value or the ${default_description} if not found
+ */
+static uint16_t libuna_codepage_${codepage_name}_${table_name}_search(
+                 uint32_t key )
+{
+	const uint16_t *range = NULL;
+	size_t lower_index    = 0;
+	size_t range_index    = 0;
+	size_t upper_index    = ${number_of_ranges};
+
+	while( lower_index < upper_index )
+	{
+		range_index = lower_index + ( ( upper_index - lower_index ) / 2 );
+		range       = &( libuna_codepage_${codepage_name}_${table_name}_ranges[ range_index * 3 ] );
+
+		if( key < (uint32_t) range[ 0 ] )
+		{
+			upper_index = range_index;
+		}
+		else if( ( key - range[ 0 ] ) >= (uint32_t) range[ 1 ] )
+		{
+			lower_index = range_index + 1;
+		}
+		else
+		{
+			return( (uint16_t) ( range[ 2 ] + ( key - range[ 0 ] ) ) );
+		}
+	}
+	return( ${default_value} );
+}
+
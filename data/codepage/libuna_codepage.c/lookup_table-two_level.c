@@ -0,0 +1,12 @@
+/* ${table_description} lookup table for the ${codepage_description} codepage
+ * The index contains the page number per page of ${page_size} values of the data
+ * Unknown are filled with the ${default_description} ${default_value}
+ */
+const ${index_type} libuna_codepage_${codepage_name}_${table_name}_index[ ${number_of_index_entries} ] = {
+${index_entries}
+};
+
+const ${value_type} libuna_codepage_${codepage_name}_${table_name}_data[ ${number_of_data_entries} ] = {
+${data_entries}
+};
+
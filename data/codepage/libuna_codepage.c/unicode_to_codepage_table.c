@@ -1,4 +0,0 @@
-const uint8_t libuna_codepage_${codepage_name}_unicode_to_byte_stream_base_${entries_base_offset}[ ${number_of_entries} ] = {
-${table_entries}
-};
-
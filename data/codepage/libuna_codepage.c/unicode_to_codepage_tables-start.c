@@ -1,3 +0,0 @@
-/* Unicode to ASCII character lookup tables for the ${codepage_description} codepage
- * Unknown are filled with the ASCII replacement character 0x1a
- */
@@ -35,6 +35,10 @@ una_test_byte_stream_to_unicode_t una_test_codepage_${codepage_name}_byte_stream
 ${test_mappings}
 };
 
+una_test_byte_stream_to_unicode_t una_test_codepage_${codepage_name}_unicode_to_byte_stream[ ${number_of_reverse_test_mappings} ] = {
+${reverse_test_mappings}
+};
+
 #if defined( __cplusplus )
 }
 #endif
@@ -0,0 +1,151 @@
+/*
+ * ${codepage_description} codepage conversion benchmark
+ *
+ * Copyright (C) ${copyright}, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include <time.h>
+
+#include "una_test_codepage_${codepage_name}.h"
+#include "una_test_types.h"
+#include "una_test_unused.h"
+
+#include "../libuna/libuna_codepage_${codepage_name}.h"
+
+#define UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS	${number_of_iterations}
+
+/* Checksum of the converted values, that prevents the conversions from being optimized away
+ */
+volatile uint32_t una_test_codepage_benchmark_checksum = 0;
+
+/* Determines the throughput in characters per second
+ * Returns the throughput
+ */
+double una_test_codepage_benchmark_get_throughput(
+        size_t number_of_characters,
+        clock_t start_time,
+        clock_t end_time )
+{
+	double elapsed_time = (double) ( end_time - start_time ) / CLOCKS_PER_SEC;
+
+	if( elapsed_time <= 0.0 )
+	{
+		return( 0.0 );
+	}
+	return( (double) number_of_characters / elapsed_time );
+}
+
+/* Benchmarks the libuna_codepage_${codepage_name}_copy_from_byte_stream function
+ * Returns the throughput in characters per second or -1.0 on error
+ */
+double una_test_codepage_${codepage_name}_benchmark_copy_from_byte_stream(
+        void )
+{
+	libuna_unicode_character_t unicode_character = 0;
+	clock_t start_time                           = 0;
+	size_t byte_stream_index                     = 0;
+	size_t iteration                             = 0;
+	size_t mapping_index                         = 0;
+	uint32_t checksum                            = 0;
+
+	start_time = clock();
+
+	for( iteration = 0;
+	     iteration < UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS;
+	     iteration++ )
+	{
+		for( mapping_index = 0;
+		     mapping_index < ${number_of_test_mappings};
+		     mapping_index++ )
+		{
+			byte_stream_index = 0;
+
+			if( libuna_codepage_${codepage_name}_copy_from_byte_stream(
+			     &unicode_character,
+			     una_test_codepage_${codepage_name}_byte_stream_to_unicode[ mapping_index ].byte_stream,
+			     una_test_codepage_${codepage_name}_byte_stream_to_unicode[ mapping_index ].byte_stream_size,
+			     &byte_stream_index,
+			     NULL ) != 1 )
+			{
+				return( -1.0 );
+			}
+			checksum += (uint32_t) unicode_character;
+		}
+	}
+	una_test_codepage_benchmark_checksum += checksum;
+
+	return( una_test_codepage_benchmark_get_throughput(
+	         UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS * ${number_of_test_mappings},
+	         start_time,
+	         clock() ) );
+}
+
+/* Benchmarks the libuna_codepage_${codepage_name}_copy_to_byte_stream function
+ * Returns the throughput in characters per second or -1.0 on error
+ */
+double una_test_codepage_${codepage_name}_benchmark_copy_to_byte_stream(
+        void )
+{
+	uint8_t byte_stream[ 4 ];
+
+	clock_t start_time       = 0;
+	size_t byte_stream_index = 0;
+	size_t iteration         = 0;
+	size_t mapping_index     = 0;
+	uint32_t checksum        = 0;
+
+	start_time = clock();
+
+	for( iteration = 0;
+	     iteration < UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS;
+	     iteration++ )
+	{
+		for( mapping_index = 0;
+		     mapping_index < ${number_of_reverse_test_mappings};
+		     mapping_index++ )
+		{
+			byte_stream_index = 0;
+
+			if( libuna_codepage_${codepage_name}_copy_to_byte_stream(
+			     una_test_codepage_${codepage_name}_unicode_to_byte_stream[ mapping_index ].unicode_character,
+			     byte_stream,
+			     4,
+			     &byte_stream_index,
+			     NULL ) != 1 )
+			{
+				return( -1.0 );
+			}
+			checksum += byte_stream[ 0 ];
+		}
+	}
+	una_test_codepage_benchmark_checksum += checksum;
+
+	return( una_test_codepage_benchmark_get_throughput(
+	         UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS * ${number_of_reverse_test_mappings},
+	         start_time,
+	         clock() ) );
+}
+
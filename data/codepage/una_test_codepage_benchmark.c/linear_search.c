@@ -0,0 +1,103 @@
+extern const uint16_t libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ ${number_of_range_values} ];
+
+/* Copies an Unicode character to a byte stream using a linear scan of the ranges, as done by the previous lookup table layout
+ * Returns 1 if successful or -1 on error
+ */
+int una_test_codepage_${codepage_name}_linear_search_copy_to_byte_stream(
+     libuna_unicode_character_t unicode_character,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     size_t *byte_stream_index )
+{
+	size_t range_index         = 0;
+	uint16_t byte_stream_value = 0x001a;
+
+	if( *byte_stream_index >= byte_stream_size )
+	{
+		return( -1 );
+	}
+	if( unicode_character < ${first_key} )
+	{
+		byte_stream_value = (uint16_t) unicode_character;
+	}
+	else if( unicode_character <= ${last_key} )
+	{
+		for( range_index = 0;
+		     range_index < ${number_of_range_values};
+		     range_index += 3 )
+		{
+			if( unicode_character < libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ range_index ] )
+			{
+				break;
+			}
+			if( ( unicode_character - libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ range_index ] ) < libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ range_index + 1 ] )
+			{
+				byte_stream_value = (uint16_t) ( libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ range_index + 2 ]
+				                  + ( unicode_character - libuna_codepage_${codepage_name}_unicode_to_byte_stream_ranges[ range_index ] ) );
+
+				break;
+			}
+		}
+	}
+	if( byte_stream_value > 0x00ff )
+	{
+		if( ( byte_stream_size - *byte_stream_index ) < 2 )
+		{
+			return( -1 );
+		}
+		byte_stream[ *byte_stream_index ] = (uint8_t) ( byte_stream_value >> 8 );
+
+		*byte_stream_index += 1;
+	}
+	byte_stream[ *byte_stream_index ] = (uint8_t) ( byte_stream_value & 0x00ff );
+
+	*byte_stream_index += 1;
+
+	return( 1 );
+}
+
+/* Benchmarks the una_test_codepage_${codepage_name}_linear_search_copy_to_byte_stream function
+ * Returns the throughput in characters per second or -1.0 on error
+ */
+double una_test_codepage_${codepage_name}_benchmark_linear_search(
+        void )
+{
+	uint8_t byte_stream[ 4 ];
+
+	clock_t start_time       = 0;
+	size_t byte_stream_index = 0;
+	size_t iteration         = 0;
+	size_t mapping_index     = 0;
+	uint32_t checksum        = 0;
+
+	start_time = clock();
+
+	for( iteration = 0;
+	     iteration < UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS;
+	     iteration++ )
+	{
+		for( mapping_index = 0;
+		     mapping_index < ${number_of_reverse_test_mappings};
+		     mapping_index++ )
+		{
+			byte_stream_index = 0;
+
+			if( una_test_codepage_${codepage_name}_linear_search_copy_to_byte_stream(
+			     una_test_codepage_${codepage_name}_unicode_to_byte_stream[ mapping_index ].unicode_character,
+			     byte_stream,
+			     4,
+			     &byte_stream_index ) != 1 )
+			{
+				return( -1.0 );
+			}
+			checksum += byte_stream[ 0 ];
+		}
+	}
+	una_test_codepage_benchmark_checksum += checksum;
+
+	return( una_test_codepage_benchmark_get_throughput(
+	         UNA_TEST_CODEPAGE_BENCHMARK_NUMBER_OF_ITERATIONS * ${number_of_reverse_test_mappings},
+	         start_time,
+	         clock() ) );
+}
+
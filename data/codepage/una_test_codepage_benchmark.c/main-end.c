@@ -0,0 +1,10 @@
+	return( EXIT_SUCCESS );
+
+on_error:
+	fprintf(
+	 stderr,
+	 "Unable to benchmark ${codepage_description} codepage conversion.\n" );
+
+	return( EXIT_FAILURE );
+}
+
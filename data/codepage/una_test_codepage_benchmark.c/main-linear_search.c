@@ -0,0 +1,11 @@
+	throughput = una_test_codepage_${codepage_name}_benchmark_linear_search();
+
+	if( throughput < 0.0 )
+	{
+		goto on_error;
+	}
+	fprintf(
+	 stdout,
+	 "copy to byte stream:\t%.0f characters per second (linear search of ranges)\n",
+	 throughput );
+
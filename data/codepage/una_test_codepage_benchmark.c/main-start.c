@@ -0,0 +1,37 @@
+/* The main program
+ */
+int main(
+     int argc UNA_TEST_ATTRIBUTE_UNUSED,
+     char *argv[] UNA_TEST_ATTRIBUTE_UNUSED )
+{
+	double throughput = 0.0;
+
+	UNA_TEST_UNREFERENCED_PARAMETER( argc )
+	UNA_TEST_UNREFERENCED_PARAMETER( argv )
+
+	fprintf(
+	 stdout,
+	 "${codepage_description} codepage conversion benchmark\n" );
+
+	throughput = una_test_codepage_${codepage_name}_benchmark_copy_from_byte_stream();
+
+	if( throughput < 0.0 )
+	{
+		goto on_error;
+	}
+	fprintf(
+	 stdout,
+	 "copy from byte stream:\t%.0f characters per second\n",
+	 throughput );
+
+	throughput = una_test_codepage_${codepage_name}_benchmark_copy_to_byte_stream();
+
+	if( throughput < 0.0 )
+	{
+		goto on_error;
+	}
+	fprintf(
+	 stdout,
+	 "copy to byte stream:\t%.0f characters per second (${unicode_to_byte_stream_layout} lookup table)\n",
+	 throughput );
+
@@ -0,0 +1,5 @@
+		entry_data += sizeof( ${prefix}_${structure_name}_t );
+	}
+	return( 1 );
+}
+
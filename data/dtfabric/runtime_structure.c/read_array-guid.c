@@ -0,0 +1,15 @@
+		if( memory_copy(
+		     ${structure_name}->${structure_member.name},
+		     ( (${prefix}_${structure_name}_t *) entry_data )->${structure_member.name},
+		     16 ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+			 "%s: unable to copy ${structure_member.description} of entry: %" PRIzd ".",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
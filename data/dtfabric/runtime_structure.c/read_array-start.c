@@ -0,0 +1,68 @@
+/* Reads an array of ${structure_description} data
+ * The data contains the ${structure_description}s stored contiguously
+ * Returns 1 if successful or -1 on error
+ */
+int ${library_name}_${structure_name}_read_array(
+     ${library_name}_${structure_name}_t *${structure_name}_array,
+     size_t number_of_entries,
+     const uint8_t *data,
+     size_t data_size,
+     libcerror_error_t **error )
+{
+	${library_name}_${structure_name}_t *${structure_name} = NULL;
+	const uint8_t *entry_data = NULL;
+	static char *function = "${library_name}_${structure_name}_read_array";
+	size_t entry_index = 0;
+
+	if( ${structure_name}_array == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid ${structure_description} array.",
+		 function );
+
+		return( -1 );
+	}
+	if( data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid data.",
+		 function );
+
+		return( -1 );
+	}
+	if( data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_entries > ( data_size / sizeof( ${prefix}_${structure_name}_t ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid number of entries value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	entry_data = data;
+
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		${structure_name} = &( ${structure_name}_array[ entry_index ] );
+
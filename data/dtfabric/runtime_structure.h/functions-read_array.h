@@ -0,0 +1,7 @@
+int ${library_name}_${structure_name}_read_array(
+     ${library_name}_${structure_name}_t *${structure_name}_array,
+     size_t number_of_entries,
+     const uint8_t *data,
+     size_t data_size,
+     libcerror_error_t **error );
+
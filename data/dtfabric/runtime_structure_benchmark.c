@@ -0,0 +1,282 @@
+/*
+ * Library ${structure_name} type benchmark program
+ *
+ * Copyright (C) ${copyright}, ${authors}
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include <time.h>
+
+#include "${prefix}_test_libcerror.h"
+#include "${prefix}_test_${library_name}.h"
+#include "${prefix}_test_unused.h"
+
+#include "../${library_name}/${library_name}_${structure_name}.h"
+
+#define ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES	${number_of_entries}
+#define ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ITERATIONS	${number_of_iterations}
+
+uint8_t ${prefix}_test_${structure_name}_data1[ ${test_data_size} ] = {
+${test_data} };
+
+#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
+
+/* Determines the throughput in entries per second
+ * Returns the throughput
+ */
+double ${prefix}_test_${structure_name}_benchmark_get_throughput(
+        size_t number_of_entries,
+        clock_t start_time,
+        clock_t end_time )
+{
+	double elapsed_time = (double) ( end_time - start_time ) / CLOCKS_PER_SEC;
+
+	if( elapsed_time <= 0.0 )
+	{
+		return( 0.0 );
+	}
+	return( (double) number_of_entries / elapsed_time );
+}
+
+/* Benchmarks the ${library_name}_${structure_name}_read_data function
+ * Returns the throughput in entries per second or -1.0 on error
+ */
+double ${prefix}_test_${structure_name}_benchmark_read_data(
+        const uint8_t *data,
+        size_t data_size )
+{
+	${library_name}_${structure_name}_t *${structure_name} = NULL;
+	libcerror_error_t *error = NULL;
+	clock_t start_time = 0;
+	size_t data_offset = 0;
+	size_t iteration = 0;
+
+	if( ${library_name}_${structure_name}_initialize(
+	     &${structure_name},
+	     &error ) != 1 )
+	{
+		goto on_error;
+	}
+	start_time = clock();
+
+	for( iteration = 0;
+	     iteration < ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ITERATIONS;
+	     iteration++ )
+	{
+		for( data_offset = 0;
+		     data_offset < data_size;
+		     data_offset += ${structure_size} )
+		{
+			if( ${library_name}_${structure_name}_read_data(
+			     ${structure_name},
+			     &( data[ data_offset ] ),
+			     ${structure_size},
+			     &error ) != 1 )
+			{
+				goto on_error;
+			}
+		}
+	}
+	if( ${library_name}_${structure_name}_free(
+	     &${structure_name},
+	     &error ) != 1 )
+	{
+		goto on_error;
+	}
+	return( ${prefix}_test_${structure_name}_benchmark_get_throughput(
+	         ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ITERATIONS * ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES,
+	         start_time,
+	         clock() ) );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( ${structure_name} != NULL )
+	{
+		${library_name}_${structure_name}_free(
+		 &${structure_name},
+		 NULL );
+	}
+	return( -1.0 );
+}
+
+/* Benchmarks the ${library_name}_${structure_name}_read_array function
+ * Returns the throughput in entries per second or -1.0 on error
+ */
+double ${prefix}_test_${structure_name}_benchmark_read_array(
+        const uint8_t *data,
+        size_t data_size )
+{
+	${library_name}_${structure_name}_t *${structure_name}_array = NULL;
+	libcerror_error_t *error = NULL;
+	clock_t start_time = 0;
+	size_t iteration = 0;
+
+	${structure_name}_array = (${library_name}_${structure_name}_t *) memory_allocate(
+	                           sizeof( ${library_name}_${structure_name}_t ) * ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES );
+
+	if( ${structure_name}_array == NULL )
+	{
+		goto on_error;
+	}
+	start_time = clock();
+
+	for( iteration = 0;
+	     iteration < ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ITERATIONS;
+	     iteration++ )
+	{
+		if( ${library_name}_${structure_name}_read_array(
+		     ${structure_name}_array,
+		     ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES,
+		     data,
+		     data_size,
+		     &error ) != 1 )
+		{
+			goto on_error;
+		}
+	}
+	memory_free(
+	 ${structure_name}_array );
+
+	return( ${prefix}_test_${structure_name}_benchmark_get_throughput(
+	         ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ITERATIONS * ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES,
+	         start_time,
+	         clock() ) );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( ${structure_name}_array != NULL )
+	{
+		memory_free(
+		 ${structure_name}_array );
+	}
+	return( -1.0 );
+}
+
+#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc ${prefix:upper_case}_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] ${prefix:upper_case}_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc ${prefix:upper_case}_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] ${prefix:upper_case}_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
+	uint8_t *data = NULL;
+	double throughput = 0.0;
+	size_t data_size = 0;
+	size_t entry_index = 0;
+#endif
+
+	${prefix:upper_case}_TEST_UNREFERENCED_PARAMETER( argc )
+	${prefix:upper_case}_TEST_UNREFERENCED_PARAMETER( argv )
+
+#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
+
+	data_size = ${structure_size} * ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES;
+
+	data = (uint8_t *) memory_allocate(
+	                    sizeof( uint8_t ) * data_size );
+
+	if( data == NULL )
+	{
+		goto on_error;
+	}
+	for( entry_index = 0;
+	     entry_index < ${prefix:upper_case}_TEST_${structure_name:upper_case}_BENCHMARK_NUMBER_OF_ENTRIES;
+	     entry_index++ )
+	{
+		if( memory_copy(
+		     &( data[ entry_index * ${structure_size} ] ),
+		     ${prefix}_test_${structure_name}_data1,
+		     ${structure_size} ) == NULL )
+		{
+			goto on_error;
+		}
+	}
+	throughput = ${prefix}_test_${structure_name}_benchmark_read_data(
+	              data,
+	              data_size );
+
+	if( throughput < 0.0 )
+	{
+		goto on_error;
+	}
+	fprintf(
+	 stdout,
+	 "${library_name}_${structure_name}_read_data:\t%.0f entries per second\n",
+	 throughput );
+
+	throughput = ${prefix}_test_${structure_name}_benchmark_read_array(
+	              data,
+	              data_size );
+
+	if( throughput < 0.0 )
+	{
+		goto on_error;
+	}
+	fprintf(
+	 stdout,
+	 "${library_name}_${structure_name}_read_array:\t%.0f entries per second\n",
+	 throughput );
+
+	memory_free(
+	 data );
+
+#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
+
+	return( EXIT_SUCCESS );
+
+#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
+
+on_error:
+	fprintf(
+	 stderr,
+	 "Unable to benchmark ${library_name}_${structure_name} functions.\n" );
+
+	if( data != NULL )
+	{
+		memory_free(
+		 data );
+	}
+	return( EXIT_FAILURE );
+
+#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
+}
+
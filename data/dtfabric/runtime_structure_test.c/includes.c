@@ -1,6 +1,7 @@
 #include <common.h>
 #include <byte_stream.h>
 #include <file_stream.h>
+#include <memory.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H ) || defined( WINAPI )
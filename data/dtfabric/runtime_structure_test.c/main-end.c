@@ -0,0 +1,12 @@
+#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
+
+	return( EXIT_SUCCESS );
+
+#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
+
+on_error:
+	return( EXIT_FAILURE );
+
+#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
+}
+
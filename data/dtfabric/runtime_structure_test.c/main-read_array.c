@@ -0,0 +1,4 @@
+	${prefix:upper_case}_TEST_RUN(
+	 "${library_name}_${structure_name}_read_array",
+	 ${prefix}_test_${structure_name}_read_array );
+
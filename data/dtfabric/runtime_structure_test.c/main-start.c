@@ -31,15 +31,3 @@ int main(
 	 "${library_name}_${structure_name}_read_file_io_handle",
 	 ${prefix}_test_${structure_name}_read_file_io_handle );
 
-#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
-
-	return( EXIT_SUCCESS );
-
-#if defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT )
-
-on_error:
-	return( EXIT_FAILURE );
-
-#endif /* defined( __GNUC__ ) && !defined( ${library_name:upper_case}_DLL_IMPORT ) */
-}
-
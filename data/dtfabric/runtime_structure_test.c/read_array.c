@@ -0,0 +1,212 @@
+/* Tests the ${library_name}_${structure_name}_read_array function
+ * Returns 1 if successful or 0 if not
+ */
+int ${prefix}_test_${structure_name}_read_array(
+     void )
+{
+	${library_name}_${structure_name}_t ${structure_name}_array[ 1 ];
+
+	libcerror_error_t *error          = NULL;
+	${library_name}_${structure_name}_t *${structure_name} = NULL;
+	int result                        = 0;
+
+	/* Initialize test
+	 */
+	result = ${library_name}_${structure_name}_initialize(
+	          &${structure_name},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NOT_NULL(
+	 "${structure_name}",
+	 ${structure_name} );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = ${library_name}_${structure_name}_read_data(
+	          ${structure_name},
+	          ${prefix}_test_${structure_name}_data1,
+	          ${test_data_size},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	if( memory_set(
+	     ${structure_name}_array,
+	     0,
+	     sizeof( ${library_name}_${structure_name}_t ) ) == NULL )
+	{
+		goto on_error;
+	}
+
+	/* Test regular cases
+	 */
+	result = ${library_name}_${structure_name}_read_array(
+	          ${structure_name}_array,
+	          1,
+	          ${prefix}_test_${structure_name}_data1,
+	          ${test_data_size},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          &( ${structure_name}_array[ 0 ] ),
+	          ${structure_name},
+	          sizeof( ${library_name}_${structure_name}_t ) );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = ${library_name}_${structure_name}_read_array(
+	          ${structure_name}_array,
+	          0,
+	          ${prefix}_test_${structure_name}_data1,
+	          0,
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = ${library_name}_${structure_name}_read_array(
+	          NULL,
+	          1,
+	          ${prefix}_test_${structure_name}_data1,
+	          ${test_data_size},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = ${library_name}_${structure_name}_read_array(
+	          ${structure_name}_array,
+	          1,
+	          NULL,
+	          ${test_data_size},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = ${library_name}_${structure_name}_read_array(
+	          ${structure_name}_array,
+	          1,
+	          ${prefix}_test_${structure_name}_data1,
+	          (size_t) SSIZE_MAX + 1,
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = ${library_name}_${structure_name}_read_array(
+	          ${structure_name}_array,
+	          ( ${test_data_size} / ${structure_size} ) + 1,
+	          ${prefix}_test_${structure_name}_data1,
+	          ${test_data_size},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = ${library_name}_${structure_name}_free(
+	          &${structure_name},
+	          &error );
+
+	${prefix:upper_case}_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "${structure_name}",
+	 ${structure_name} );
+
+	${prefix:upper_case}_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( ${structure_name} != NULL )
+	{
+		${library_name}_${structure_name}_free(
+		 &${structure_name},
+		 NULL );
+	}
+	return( 0 );
+}
+
@@ -0,0 +1,5 @@
+/* Retrieves the ${structure_member.description} from the stored ${structure_description}
+ */
+#define ${prefix}_${structure_name}_get_${structure_member.name}( data, value ) \
+	( value ) = ( (const ${prefix}_${structure_name}_t *) ( data ) )->${structure_member.name}
+
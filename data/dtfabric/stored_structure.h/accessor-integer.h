@@ -0,0 +1,7 @@
+/* Retrieves the ${structure_member.description} from the stored ${structure_description}
+ */
+#define ${prefix}_${structure_name}_get_${structure_member.name}( data, value ) \
+	byte_stream_copy_to_${structure_member.data_type}_${structure_member.byte_order}( \
+	 ( (const ${prefix}_${structure_name}_t *) ( data ) )->${structure_member.name}, \
+	 value )
+
@@ -22,10 +22,3 @@
 #if !defined( _${prefix:upper_case}_${structure_name:upper_case}_H )
 #define _${prefix:upper_case}_${structure_name:upper_case}_H
 
-#include <common.h>
-#include <types.h>
-
-#if defined( __cplusplus )
-extern "C" {
-#endif
-
@@ -0,0 +1,8 @@
+#include <common.h>
+#include <byte_stream.h>
+#include <types.h>
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
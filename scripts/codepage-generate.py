@@ -5,11 +5,238 @@
 import argparse
 import datetime
 import logging
+import multiprocessing
 import os
 import re
 import sys
 
 from yaldevtools import template_string
+from yaldevtools.source_generators import interface
+
+
+class LookupTable:
+    """Lookup table of a codepage conversion direction.
+
+    Attributes:
+      byte_size (int): size of the table in bytes.
+      default_value (int): value of keys without a mapping.
+      first_key (int): first key that is not mapped to itself.
+      last_key (int): last key of the table.
+    """
+
+    LAYOUT = None
+
+    def __init__(self, first_key, last_key, default_value):
+        """Initializes a lookup table.
+
+        Args:
+          first_key (int): first key that is not mapped to itself.
+          last_key (int): last key of the table.
+          default_value (int): value of keys without a mapping.
+        """
+        super().__init__()
+        self.byte_size = 0
+        self.default_value = default_value
+        self.first_key = first_key
+        self.last_key = last_key
+
+
+class LeadByteLookupTable(LookupTable):
+    """Lead byte lookup table of the double byte values of a codepage.
+
+    Per lead byte the table contains the values of the trail bytes from the
+    first to the last mapped trail byte, so that a double byte value can be
+    looked up in constant time without storing unused lead and trail bytes.
+
+    Attributes:
+      data (list[int]): values of the trail bytes of all lead bytes.
+      first_trail_bytes (list[int]): first trail byte per lead byte.
+      last_trail_bytes (list[int]): last trail byte per lead byte, where 0
+          represents a value that is not a lead byte.
+      offset_value_size (int): size of an offset value in bytes.
+      offsets (list[int]): offset of the values in the data per lead byte.
+    """
+
+    LAYOUT = "lead_byte"
+
+    def __init__(self, mappings, lead_bytes, default_value):
+        """Initializes a lead byte lookup table.
+
+        Args:
+          mappings (dict[int, int]): mapped values per double byte value.
+          lead_bytes (list[int]): lead bytes in ascending order.
+          default_value (int): value of double byte values without a mapping.
+        """
+        super().__init__(lead_bytes[0], lead_bytes[-1], default_value)
+        self.data = []
+        self.first_trail_bytes = []
+        self.last_trail_bytes = []
+        self.offsets = []
+
+        trail_bytes_per_lead_byte = {}
+        for value in mappings:
+            if value > 0xFF:
+                trail_bytes_per_lead_byte.setdefault(value >> 8, []).append(
+                    value & 0xFF
+                )
+
+        for lead_byte in range(lead_bytes[0], lead_bytes[-1] + 1):
+            trail_bytes = trail_bytes_per_lead_byte.get(lead_byte, None)
+            if not trail_bytes:
+                self.first_trail_bytes.append(0)
+                self.last_trail_bytes.append(0)
+                self.offsets.append(0)
+                continue
+
+            first_trail_byte = min(trail_bytes)
+            last_trail_byte = max(trail_bytes)
+
+            self.first_trail_bytes.append(first_trail_byte)
+            self.last_trail_bytes.append(last_trail_byte)
+            self.offsets.append(len(self.data))
+
+            lead_byte_value = lead_byte << 8
+            self.data.extend(
+                [
+                    mappings.get(lead_byte_value | trail_byte, default_value)
+                    for trail_byte in range(first_trail_byte, last_trail_byte + 1)
+                ]
+            )
+
+        self.offset_value_size = 2
+        if len(self.data) > 0xFFFF:
+            self.offset_value_size = 4
+
+        number_of_lead_bytes = len(self.offsets)
+        self.byte_size = (
+            number_of_lead_bytes * (2 + self.offset_value_size) + len(self.data) * 2
+        )
+
+
+class RangeLookupTable(LookupTable):
+    """Range lookup table.
+
+    The table consists of sorted ranges of consecutive keys that are mapped to
+    consecutive values, which are searched with a binary search. Keys that are
+    not in a range are mapped to the default value.
+
+    Attributes:
+      ranges (list[tuple[int, int, int]]): first key, number of keys and value
+          of the first key per range.
+    """
+
+    LAYOUT = "range"
+
+    # The number of keys of a range is stored as a 16-bit value.
+    _MAXIMUM_NUMBER_OF_KEYS = 0xFFFF
+
+    def __init__(self, mappings, first_key, last_key, default_value):
+        """Initializes a range lookup table.
+
+        Args:
+          mappings (dict[int, int]): mapped values per key.
+          first_key (int): first key that is not mapped to itself.
+          last_key (int): last key of the table.
+          default_value (int): value of keys without a mapping.
+        """
+        super().__init__(first_key, last_key, default_value)
+        self.ranges = []
+
+        range_first_key = None
+        range_number_of_keys = 0
+        range_base_value = None
+        for key in range(first_key, last_key + 1):
+            value = mappings.get(key, None)
+            if value is None:
+                continue
+
+            if (
+                range_first_key is not None
+                and key == range_first_key + range_number_of_keys
+                and value == range_base_value + range_number_of_keys
+                and range_number_of_keys < self._MAXIMUM_NUMBER_OF_KEYS
+            ):
+                range_number_of_keys += 1
+                continue
+
+            if range_first_key is not None:
+                self.ranges.append(
+                    (range_first_key, range_number_of_keys, range_base_value)
+                )
+
+            range_first_key = key
+            range_number_of_keys = 1
+            range_base_value = value
+
+        if range_first_key is not None:
+            self.ranges.append(
+                (range_first_key, range_number_of_keys, range_base_value)
+            )
+
+        # Every range is stored as 3 16-bit values.
+        self.byte_size = len(self.ranges) * 6
+
+
+class TwoLevelLookupTable(LookupTable):
+    """Two-level lookup table.
+
+    The keys of the table are divided into pages, where the index contains
+    the page number in the data per page. Pages with the same values are
+    stored once.
+
+    Attributes:
+      data (list[int]): values of the pages.
+      index (list[int]): page number per page.
+      index_value_size (int): size of an index value in bytes.
+      page_bits (int): number of bits of the page size.
+      table_base (int): first key of the first page.
+      value_size (int): size of a value in bytes.
+    """
+
+    LAYOUT = "two_level"
+
+    def __init__(
+        self, mappings, first_key, last_key, default_value, value_size, page_bits
+    ):
+        """Initializes a two-level lookup table.
+
+        Args:
+          mappings (dict[int, int]): mapped values per key.
+          first_key (int): first key that is not mapped to itself.
+          last_key (int): last key of the table.
+          default_value (int): value of keys without a mapping.
+          value_size (int): size of a value in bytes.
+          page_bits (int): number of bits of the page size.
+        """
+        super().__init__(first_key, last_key, default_value)
+        self.data = []
+        self.index = []
+        self.page_bits = page_bits
+        self.table_base = first_key & ~((1 << page_bits) - 1)
+        self.value_size = value_size
+
+        page_size = 1 << page_bits
+        page_numbers = {}
+        for page_first_key in range(self.table_base, last_key + 1, page_size):
+            page = tuple(
+                mappings.get(key, default_value)
+                for key in range(page_first_key, page_first_key + page_size)
+            )
+            page_number = page_numbers.get(page, None)
+            if page_number is None:
+                page_number = len(page_numbers)
+                page_numbers[page] = page_number
+                self.data.extend(page)
+
+            self.index.append(page_number)
+
+        self.index_value_size = 1
+        if len(page_numbers) > 0x100:
+            self.index_value_size = 2
+
+        self.byte_size = (
+            len(self.index) * self.index_value_size + len(self.data) * value_size
+        )
 
 
 class SourceGenerator:
@@ -19,26 +246,58 @@ class SourceGenerator:
         "([0-9A-F]{2,4}) = U\\+([0-9A-F]{4}) : ", re.IGNORECASE
     )
 
-    def __init__(self, templates_path):
+    # Mapping files in the format of the Unicode Consortium, such as CP932.TXT.
+    _UNICODE_MAPPINGS_REGEX = re.compile(
+        "0x([0-9A-F]{2,4})\\s+0x([0-9A-F]{4})\\s", re.IGNORECASE
+    )
+
+    _UNICODE_LEAD_BYTE_REGEX = re.compile(
+        "0x([0-9A-F]{2})\\s+#DBCS LEAD BYTE", re.IGNORECASE
+    )
+
+    # Number of conversions of every benchmark.
+    _BENCHMARK_NUMBER_OF_CONVERSIONS = 1000000
+
+    # Number of bits of the page sizes of two-level lookup tables to consider.
+    _PAGE_BITS = range(2, 9)
+
+    def __init__(self, templates_path, generate_benchmark=False, output_directory=None):
         """Initializes a source generator.
 
         Args:
           templates_path (str): templates path.
+          generate_benchmark (Optional[bool]): True if a benchmark program
+              should be generated.
+          output_directory (Optional[str]): path of the directory that contains
+              the libuna and tests directories to write the output files to,
+              where None represents the current working directory.
         """
         super().__init__()
         self._codepage_name = None
+        self._generate_benchmark = generate_benchmark
         self._codepage_mappings = {}
         self._codepage_values = {}
+        self._lead_bytes = []
+        self._output_directory = output_directory or ""
         self._templates_path = templates_path
-        self._template_string_generator = template_string.TemplateStringGenerator()
+        self._template_string_generator = template_string.TemplateStringGenerator(
+            template_class=interface.TemplateString
+        )
         self._unicode_mappings = {}
         self._unicode_values = {}
 
+        self.codepage_name = None
+        self.lookup_tables = {}
+        self.number_of_mappings = 0
+        self.table_sizes = {}
+
     def _GenerateSection(
         self, template_filename, template_mappings, output_filename, access_mode="w"
     ):
         """Generates a section from template filename.
 
+        The section is written to the output file when the output is flushed.
+
         Args:
           template_filename (str): name of the template file.
           template_mappings (dict[str, str]): template mappings, where the key
@@ -46,280 +305,528 @@ class SourceGenerator:
           output_filename (str): name of the output file.
           access_mode (Optional[str]): output file access mode.
         """
-        output_data = self._template_string_generator.Generate(
-            template_filename, template_mappings
+        self._template_string_generator.GenerateSection(
+            template_filename,
+            template_mappings,
+            output_filename,
+            access_mode=access_mode,
         )
-        with open(output_filename, access_mode, encoding="utf8") as file_object:
-            file_object.write(output_data)
 
-    def _GenerateSourceFile(self):
-        """Generates a source file."""
-        templates_path = os.path.join(self._templates_path, "libuna_codepage.c")
+    def _BuildLookupTable(self, mappings, first_key, last_key, default_value):
+        """Builds the smallest lookup table of a conversion direction.
+
+        Args:
+          mappings (dict[int, int]): mapped values per key.
+          first_key (int): first key that is not mapped to itself.
+          last_key (int): last key of the table.
+          default_value (int): value of keys without a mapping.
+
+        Returns:
+          LookupTable: lookup table with the smallest size in bytes, where a
+              two-level lookup table is preferred over a range lookup
+              table of the same size.
+        """
+        values = [
+            mappings.get(key, default_value) for key in range(first_key, last_key + 1)
+        ]
+        value_size = 1
+        if max(values) > 0xFF:
+            value_size = 2
+
+        lookup_tables = [
+            TwoLevelLookupTable(
+                mappings, first_key, last_key, default_value, value_size, page_bits
+            )
+            for page_bits in self._PAGE_BITS
+        ]
+        range_lookup_table = RangeLookupTable(
+            mappings, first_key, last_key, default_value
+        )
+        # A table without ranges would be an empty array, which C does not
+        # support.
+        if range_lookup_table.ranges:
+            lookup_tables.append(range_lookup_table)
+
+        return min(lookup_tables, key=lambda lookup_table: lookup_table.byte_size)
+
+    def _FormatTableEntries(self, values, value_size, values_per_line=8):
+        """Formats the entries of a table.
+
+        Args:
+          values (list[int]): values of the table.
+          value_size (int): size of a value in bytes.
+          values_per_line (Optional[int]): number of values per line.
+
+        Returns:
+          str: table entries.
+        """
+        lines = []
+        for index in range(0, len(values), values_per_line):
+            values_string = ", ".join(
+                [
+                    f"0x{value:0{value_size * 2:d}x}"
+                    for value in values[index : index + values_per_line]
+                ]
+            )
+            lines.append(f"\t{values_string:s},")
+
+        if lines:
+            # Remove the trailing comma in the last line.
+            lines[-1] = lines[-1][:-1]
+
+        return "\n".join(lines)
+
+    def _GenerateBenchmarkSourceFile(self):
+        """Generates a benchmark source file.
+
+        The benchmark program measures the conversion throughput of the
+        codepage using the test mappings. If the Unicode to byte stream lookup
+        table is a range lookup table, the throughput of the binary search is
+        compared against a linear scan of the ranges.
+        """
+        templates_path = os.path.join(
+            self._templates_path, "una_test_codepage_benchmark.c"
+        )
 
         output_filename = os.path.join(
-            "libuna", f"libuna_codepage_{self._codepage_name:s}.c"
+            self._output_directory,
+            "tests",
+            f"una_test_codepage_{self._codepage_name:s}_benchmark.c",
+        )
+        number_of_mappings = max(
+            len(self._codepage_values), len(self._unicode_values), 1
+        )
+        number_of_iterations = max(
+            self._BENCHMARK_NUMBER_OF_CONVERSIONS // number_of_mappings, 1
         )
+        unicode_to_byte_stream_table = self.lookup_tables.get(
+            "unicode_to_byte_stream", None
+        )
+
         template_mappings = self._GetTemplateMappings()
+        template_mappings["number_of_iterations"] = number_of_iterations
+        template_mappings["number_of_reverse_test_mappings"] = len(self._unicode_values)
+        template_mappings["number_of_test_mappings"] = len(self._codepage_values)
+
+        if unicode_to_byte_stream_table:
+            template_mappings["unicode_to_byte_stream_layout"] = (
+                unicode_to_byte_stream_table.LAYOUT.replace("_", "-")
+            )
+        else:
+            template_mappings["unicode_to_byte_stream_layout"] = "no"
 
         template_filename = os.path.join(templates_path, "header.c")
 
         self._GenerateSection(template_filename, template_mappings, output_filename)
 
-        template_filename = os.path.join(templates_path, "includes.c")
-
-        self._GenerateSection(
-            template_filename, template_mappings, output_filename, access_mode="a"
+        is_range_lookup_table = bool(
+            unicode_to_byte_stream_table
+            and unicode_to_byte_stream_table.LAYOUT == "range"
         )
-        number_of_table_values = 0
-        first_codepage_value = None
-        last_codepage_value = None
-        lines = []
-        table_values = []
+        if is_range_lookup_table:
+            template_mappings["first_key"] = (
+                f"0x{unicode_to_byte_stream_table.first_key:04x}"
+            )
+            template_mappings["last_key"] = (
+                f"0x{unicode_to_byte_stream_table.last_key:04x}"
+            )
+            template_mappings["number_of_range_values"] = (
+                len(unicode_to_byte_stream_table.ranges) * 3
+            )
 
-        # TODO: group values in small tables
-        # TODO: add suport for undefined codepage values
-        # TODO: add suport for MSC
-        for codepage_value in sorted(self._codepage_mappings):
-
-            if last_codepage_value is not None:
-                while last_codepage_value < codepage_value - 1:
-                    last_codepage_value += 1
-                    unicode_value = self._codepage_values.get(
-                        last_codepage_value, 0xFFFD
-                    )
-                    table_values.append(f"0x{unicode_value:04x}")
-                    number_of_table_values += 1
-
-                    if last_codepage_value % 8 == 7:
-                        values_string = ", ".join(table_values)
-                        lines.append(f"\t{values_string:s},")
-                        table_values = []
-
-            unicode_value = self._codepage_values[codepage_value]
-            table_values.append(f"0x{unicode_value:04x}")
-            number_of_table_values += 1
-
-            if codepage_value % 8 == 7:
-                values_string = ", ".join(table_values)
-                lines.append(f"\t{values_string:s},")
-                table_values = []
-
-            if first_codepage_value is None:
-                first_codepage_value = codepage_value
-            last_codepage_value = codepage_value
+            template_filename = os.path.join(templates_path, "linear_search.c")
 
-        if table_values:
-            while len(table_values) < 8:
-                last_codepage_value += 1
-                unicode_value = self._codepage_values.get(last_codepage_value, 0xFFFD)
-                table_values.append(f"0x{unicode_value:04x}")
-                number_of_table_values += 1
+            self._GenerateSection(
+                template_filename, template_mappings, output_filename, access_mode="a"
+            )
 
-            values_string = ", ".join(table_values)
-            lines.append(f"\t{values_string:s}")
-            table_values = []
-        else:
-            lines[-1] = lines[-1][:-1]
+        template_filename = os.path.join(templates_path, "main-start.c")
 
-        line = (
-            f"const uint16_t libuna_codepage_{self._codepage_name:s}_byte_stream_to_"
-            f"unicode_base_0x{first_codepage_value:02x}[ {number_of_table_values:d} ] "
-            f"= {{"
-        )
-        lines.insert(
-            0,
-            line,
+        self._GenerateSection(
+            template_filename, template_mappings, output_filename, access_mode="a"
         )
-        lines.append("};")
 
-        template_mappings["codepage_to_unicode_table"] = "\n".join(lines)
+        if is_range_lookup_table:
+            template_filename = os.path.join(templates_path, "main-linear_search.c")
 
-        template_filename = os.path.join(templates_path, "codepage_to_unicode_table.c")
+            self._GenerateSection(
+                template_filename, template_mappings, output_filename, access_mode="a"
+            )
+
+        template_filename = os.path.join(templates_path, "main-end.c")
 
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
-        del template_mappings["codepage_to_unicode_table"]
+
+    def _GenerateLookupTable(
+        self, lookup_table, table_name, template_mappings, output_filename
+    ):
+        """Generates a lookup table.
+
+        Args:
+          lookup_table (LookupTable): lookup table.
+          table_name (str): name of the table, either "byte_stream_to_unicode"
+              or "unicode_to_byte_stream".
+          template_mappings (dict[str, str]): template mappings, where the key
+              maps to the name of a template variable.
+          output_filename (str): name of the output file.
+        """
+        templates_path = os.path.join(self._templates_path, "libuna_codepage.c")
+
+        if lookup_table.LAYOUT == "lead_byte":
+            table_description = "Double byte to Unicode character"
+            default_description = "Unicode replacement character"
+            default_value = f"0x{lookup_table.default_value:04x}"
+        elif table_name == "byte_stream_to_unicode":
+            table_description = "Extended ASCII to Unicode character"
+            default_description = "Unicode replacement character"
+            default_value = f"0x{lookup_table.default_value:04x}"
+        else:
+            table_description = "Unicode to ASCII character"
+            default_description = "ASCII replacement character"
+            default_value = f"0x{lookup_table.default_value:02x}"
+
+        table_mappings = dict(template_mappings)
+        table_mappings["default_description"] = default_description
+        table_mappings["default_value"] = default_value
+        table_mappings["table_description"] = table_description
+        table_mappings["table_name"] = table_name
+
+        table_prefix = f"libuna_codepage_{self._codepage_name:s}_{table_name:s}"
+
+        if lookup_table.LAYOUT == "two_level":
+            index_value_size = lookup_table.index_value_size
+            table_mappings["data_entries"] = self._FormatTableEntries(
+                lookup_table.data, lookup_table.value_size
+            )
+            table_mappings["index_entries"] = self._FormatTableEntries(
+                lookup_table.index, index_value_size
+            )
+            table_mappings["index_type"] = f"uint{index_value_size * 8:d}_t"
+            table_mappings["number_of_data_entries"] = len(lookup_table.data)
+            table_mappings["number_of_index_entries"] = len(lookup_table.index)
+            table_mappings["page_size"] = 1 << lookup_table.page_bits
+            table_mappings["value_type"] = f"uint{lookup_table.value_size * 8:d}_t"
+
+            self.table_sizes[f"{table_prefix:s}_index"] = (
+                len(lookup_table.index) * index_value_size
+            )
+            self.table_sizes[f"{table_prefix:s}_data"] = (
+                len(lookup_table.data) * lookup_table.value_size
+            )
+
+        elif lookup_table.LAYOUT == "lead_byte":
+            offset_value_size = lookup_table.offset_value_size
+            table_mappings["data_entries"] = self._FormatTableEntries(
+                lookup_table.data, 2
+            )
+            table_mappings["first_trail_byte_entries"] = self._FormatTableEntries(
+                lookup_table.first_trail_bytes, 1
+            )
+            table_mappings["last_trail_byte_entries"] = self._FormatTableEntries(
+                lookup_table.last_trail_bytes, 1
+            )
+            table_mappings["number_of_data_entries"] = len(lookup_table.data)
+            table_mappings["number_of_lead_bytes"] = len(lookup_table.offsets)
+            table_mappings["offset_entries"] = self._FormatTableEntries(
+                lookup_table.offsets, offset_value_size
+            )
+            table_mappings["offset_type"] = f"uint{offset_value_size * 8:d}_t"
+
+            number_of_lead_bytes = len(lookup_table.offsets)
+            lead_byte_prefix = f"libuna_codepage_{self._codepage_name:s}_lead_byte"
+            self.table_sizes[f"{lead_byte_prefix:s}_first_trail_byte"] = (
+                number_of_lead_bytes
+            )
+            self.table_sizes[f"{lead_byte_prefix:s}_last_trail_byte"] = (
+                number_of_lead_bytes
+            )
+            self.table_sizes[f"{lead_byte_prefix:s}_offset"] = (
+                number_of_lead_bytes * offset_value_size
+            )
+            self.table_sizes[f"{table_prefix:s}_data"] = len(lookup_table.data) * 2
+
+        else:
+            range_values = []
+            for first_key, number_of_keys, base_value in lookup_table.ranges:
+                range_values.extend([first_key, number_of_keys, base_value])
+
+            table_mappings["number_of_range_values"] = len(range_values)
+            table_mappings["number_of_ranges"] = len(lookup_table.ranges)
+            table_mappings["range_entries"] = self._FormatTableEntries(range_values, 2)
+
+            self.table_sizes[f"{table_prefix:s}_ranges"] = len(range_values) * 2
 
         template_filename = os.path.join(
-            templates_path, "unicode_to_codepage_tables-start.c"
+            templates_path, f"lookup_table-{lookup_table.LAYOUT:s}.c"
         )
         self._GenerateSection(
-            template_filename, template_mappings, output_filename, access_mode="a"
+            template_filename, table_mappings, output_filename, access_mode="a"
         )
-        first_unicode_value = None
-        last_unicode_value = None
-
-        unicode_mappings_groups = {}
-        for unicode_value in sorted(self._unicode_mappings):
-            if first_unicode_value is None:
-                first_unicode_value = unicode_value
-            elif (
-                last_unicode_value is not None
-                and last_unicode_value + 16 < unicode_value
-            ):
-                first_unicode_value = unicode_value
 
-            base_unicode_value = first_unicode_value & ~(0x0007)
-            if base_unicode_value not in unicode_mappings_groups:
-                unicode_mappings_groups[base_unicode_value] = [unicode_value]
-            else:
-                unicode_mappings_groups[base_unicode_value].append(unicode_value)
+    def _GenerateLookupTableBody(
+        self,
+        lookup_table,
+        function_name,
+        key_name,
+        maximum_key,
+        template_mappings,
+        output_filename,
+        is_chained=False,
+    ):
+        """Generates the body of a conversion function that uses a lookup table.
 
-            last_unicode_value = unicode_value
+        Keys before the first key of the lookup table are mapped to themselves.
+        Keys after the last key of the lookup table and up to the maximum key
+        are mapped to themselves if an upper template is available.
 
-        for base_unicode_value, unicode_values in sorted(
-            unicode_mappings_groups.items()
-        ):
-            if len(unicode_values) < 8:
-                continue
+        Args:
+          lookup_table (LookupTable): lookup table.
+          function_name (str): name of the conversion function, either
+              "copy_from_byte_stream" or "copy_to_byte_stream".
+          key_name (str): name of the variable that contains the key.
+          maximum_key (int): maximum key supported by the key variable.
+          template_mappings (dict[str, str]): template mappings, where the key
+              maps to the name of a template variable.
+          output_filename (str): name of the output file.
+          is_chained (Optional[bool]): True if the body continues a preceding
+              if statement.
+        """
+        templates_path = os.path.join(self._templates_path, "libuna_codepage.c")
 
-            number_of_table_values = 0
-            last_unicode_value = base_unicode_value - 1
-            lines = []
-            table_values = []
-
-            for unicode_value in sorted(unicode_values):
-                while last_unicode_value < unicode_value - 1:
-                    last_unicode_value += 1
-                    codepage_value = self._unicode_values.get(last_unicode_value, 0x1A)
-                    table_values.append(f"0x{codepage_value:02x}")
-                    number_of_table_values += 1
-
-                    if last_unicode_value % 8 == 7:
-                        values_string = ", ".join(table_values)
-                        lines.append(f"\t{values_string:s},")
-                        table_values = []
-
-                codepage_value = self._unicode_values[unicode_value]
-                table_values.append(f"0x{codepage_value:02x}")
-                number_of_table_values += 1
-
-                if unicode_value % 8 == 7:
-                    values_string = ", ".join(table_values)
-                    lines.append(f"\t{values_string:s},")
-                    table_values = []
-
-                last_unicode_value = unicode_value
-
-            if table_values:
-                while len(table_values) < 8:
-                    last_unicode_value += 1
-                    codepage_value = self._unicode_values.get(last_unicode_value, 0x1A)
-                    table_values.append(f"0x{codepage_value:02x}")
-                    number_of_table_values += 1
-
-                values_string = ", ".join(table_values)
-                lines.append(f"\t{values_string:s}")
-                table_values = []
-            else:
-                lines[-1] = lines[-1][:-1]
+        body_mappings = dict(template_mappings)
 
-            template_mappings["entries_base_offset"] = f"0x{base_unicode_value:04x}"
-            template_mappings["number_of_entries"] = number_of_table_values
-            template_mappings["table_entries"] = "\n".join(lines)
+        lookup_condition = "else if" if is_chained else "if"
 
+        if lookup_table.first_key > 0:
+            body_mappings["lower_condition"] = (
+                f"{lookup_condition:s}( {key_name:s} < "
+                f"0x{lookup_table.first_key:02x} )"
+            )
             template_filename = os.path.join(
-                templates_path, "unicode_to_codepage_table.c"
+                templates_path, f"{function_name:s}-body-lower.c"
             )
             self._GenerateSection(
-                template_filename, template_mappings, output_filename, access_mode="a"
+                template_filename, body_mappings, output_filename, access_mode="a"
             )
-            del template_mappings["entries_base_offset"]
-            del template_mappings["number_of_entries"]
-            del template_mappings["table_entries"]
+            lookup_condition = "else if"
+
+        if lookup_table.last_key < maximum_key:
+            lookup_condition = (
+                f"{lookup_condition:s}( {key_name:s} <= "
+                f"0x{lookup_table.last_key:02x} )"
+            )
+        elif lookup_condition == "else if":
+            lookup_condition = "else"
+        else:
+            lookup_condition = ""
+
+        body_mappings["lookup_condition"] = lookup_condition
+
+        if lookup_table.LAYOUT == "two_level":
+            body_mappings["page_bits"] = lookup_table.page_bits
+            body_mappings["page_mask"] = f"0x{(1 << lookup_table.page_bits) - 1:02x}"
+            body_mappings["table_base"] = f"0x{lookup_table.table_base:02x}"
 
         template_filename = os.path.join(
-            templates_path, "copy_from_byte_stream-start.c"
+            templates_path, f"{function_name:s}-body-{lookup_table.LAYOUT:s}.c"
         )
         self._GenerateSection(
-            template_filename, template_mappings, output_filename, access_mode="a"
+            template_filename, body_mappings, output_filename, access_mode="a"
         )
-        template_filename = os.path.join(templates_path, "copy_from_byte_stream-body.c")
 
-        self._GenerateSection(
-            template_filename, template_mappings, output_filename, access_mode="a"
+        template_filename = os.path.join(
+            templates_path, f"{function_name:s}-body-upper.c"
         )
-        template_filename = os.path.join(templates_path, "copy_from_byte_stream-end.c")
+        if lookup_table.last_key < maximum_key and os.path.exists(template_filename):
+            self._GenerateSection(
+                template_filename, body_mappings, output_filename, access_mode="a"
+            )
 
-        self._GenerateSection(
-            template_filename, template_mappings, output_filename, access_mode="a"
+    def _GenerateSourceFile(self):
+        """Generates a source file."""
+        templates_path = os.path.join(self._templates_path, "libuna_codepage.c")
+
+        output_filename = os.path.join(
+            self._output_directory,
+            "libuna",
+            f"libuna_codepage_{self._codepage_name:s}.c",
         )
-        template_filename = os.path.join(templates_path, "copy_to_byte_stream-start.c")
+        template_mappings = self._GetTemplateMappings()
+
+        template_filename = os.path.join(templates_path, "header.c")
+
+        self._GenerateSection(template_filename, template_mappings, output_filename)
+
+        template_filename = os.path.join(templates_path, "includes.c")
 
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
-        unmapped_values = {}
-        for base_unicode_value, unicode_values in sorted(
-            unicode_mappings_groups.items()
-        ):
-            if len(unicode_values) < 8:
-                for unicode_value in sorted(unicode_values):
-                    unmapped_values[unicode_value] = self._unicode_mappings[
-                        unicode_value
-                    ]
-
-        # TODO: determine directly mapped values.
+
+        # TODO: add suport for MSC
+        self.lookup_tables = {}
+
+        single_byte_values = {
+            codepage_value: unicode_value
+            for codepage_value, unicode_value in self._codepage_values.items()
+            if codepage_value <= 0xFF
+        }
+
+        # Lead bytes with trail bytes are handled by the lead byte lookup table.
+        handled_lead_bytes = set(
+            codepage_value >> 8
+            for codepage_value in self._codepage_values
+            if codepage_value > 0xFF
+        )
+
+        # Byte stream values after the last remapped value are mapped to
+        # themselves.
+        remapped_codepage_values = [
+            codepage_value
+            for codepage_value in range(0, 0x100)
+            if codepage_value not in handled_lead_bytes
+            and single_byte_values.get(codepage_value, 0xFFFD) != codepage_value
+        ]
+        byte_stream_to_unicode_table = None
+        if remapped_codepage_values:
+            byte_stream_to_unicode_table = self._BuildLookupTable(
+                single_byte_values,
+                remapped_codepage_values[0],
+                remapped_codepage_values[-1],
+                0xFFFD,
+            )
+            self.lookup_tables["byte_stream_to_unicode"] = byte_stream_to_unicode_table
+
+            self._GenerateLookupTable(
+                byte_stream_to_unicode_table,
+                "byte_stream_to_unicode",
+                template_mappings,
+                output_filename,
+            )
+
+        double_byte_to_unicode_table = None
+        if self._lead_bytes:
+            double_byte_to_unicode_table = LeadByteLookupTable(
+                self._codepage_values, self._lead_bytes, 0xFFFD
+            )
+            self.lookup_tables["double_byte_to_unicode"] = double_byte_to_unicode_table
+
+            self._GenerateLookupTable(
+                double_byte_to_unicode_table,
+                "double_byte_to_unicode",
+                template_mappings,
+                output_filename,
+            )
+
+        # Unicode values after the last mapped value are mapped to the ASCII
+        # replacement character.
+        last_unicode_value = max(self._unicode_values)
+        first_unicode_value = last_unicode_value + 1
+        for unicode_value in range(0, last_unicode_value + 1):
+            if self._unicode_values.get(unicode_value, 0x1A) != unicode_value:
+                first_unicode_value = unicode_value
+                break
+
+        unicode_to_byte_stream_table = None
+        if first_unicode_value <= last_unicode_value:
+            unicode_to_byte_stream_table = self._BuildLookupTable(
+                self._unicode_values, first_unicode_value, last_unicode_value, 0x1A
+            )
+            self.lookup_tables["unicode_to_byte_stream"] = unicode_to_byte_stream_table
+
+            self._GenerateLookupTable(
+                unicode_to_byte_stream_table,
+                "unicode_to_byte_stream",
+                template_mappings,
+                output_filename,
+            )
+
         template_filename = os.path.join(
-            templates_path, "copy_to_byte_stream-body-direct.c"
+            templates_path, "copy_from_byte_stream-start.c"
         )
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
-        for base_unicode_value, unicode_values in sorted(
-            unicode_mappings_groups.items()
-        ):
-            if len(unicode_values) > 8:
-                first_unicode_value = unicode_values[0] & ~(0x0007)
-                template_mappings["first_unicode_value"] = (
-                    f"0x{first_unicode_value:04x}"
-                )
-                last_unicode_value = (unicode_values[-1] & ~(0x0007)) + 8
-                template_mappings["last_unicode_value"] = f"0x{last_unicode_value:04x}"
-                template_filename = os.path.join(
-                    templates_path, "copy_to_byte_stream-body-mapped.c"
-                )
-                self._GenerateSection(
-                    template_filename,
-                    template_mappings,
-                    output_filename,
-                    access_mode="a",
-                )
-                del template_mappings["first_unicode_value"]
-                del template_mappings["last_unicode_value"]
+        if double_byte_to_unicode_table:
+            body_mappings = dict(template_mappings)
+            body_mappings["first_lead_byte"] = (
+                f"0x{double_byte_to_unicode_table.first_key:02x}"
+            )
+            body_mappings["last_lead_byte"] = (
+                f"0x{double_byte_to_unicode_table.last_key:02x}"
+            )
 
-        if unmapped_values:
             template_filename = os.path.join(
-                templates_path, "copy_to_byte_stream-body-switch-start.c"
+                templates_path, "copy_from_byte_stream-body-lead_byte.c"
             )
             self._GenerateSection(
-                template_filename, template_mappings, output_filename, access_mode="a"
+                template_filename, body_mappings, output_filename, access_mode="a"
             )
-            for unicode_value, codepage_value in sorted(unmapped_values.items()):
-                template_mappings["codepage_value"] = f"0x{codepage_value:02x}"
-                template_mappings["unicode_value"] = f"0x{unicode_value:04x}"
 
+        if byte_stream_to_unicode_table:
+            self._GenerateLookupTableBody(
+                byte_stream_to_unicode_table,
+                "copy_from_byte_stream",
+                "byte_stream_character",
+                0xFF,
+                template_mappings,
+                output_filename,
+                is_chained=bool(double_byte_to_unicode_table),
+            )
+        else:
+            if double_byte_to_unicode_table:
                 template_filename = os.path.join(
-                    templates_path, "copy_to_byte_stream-body-switch-entry.c"
+                    templates_path, "copy_from_byte_stream-body-upper.c"
                 )
-                self._GenerateSection(
-                    template_filename,
-                    template_mappings,
-                    output_filename,
-                    access_mode="a",
+            else:
+                template_filename = os.path.join(
+                    templates_path, "copy_from_byte_stream-body-direct.c"
                 )
-                del template_mappings["codepage_value"]
-                del template_mappings["unicode_value"]
+            self._GenerateSection(
+                template_filename, template_mappings, output_filename, access_mode="a"
+            )
+
+        template_filename = os.path.join(templates_path, "copy_from_byte_stream-end.c")
+
+        self._GenerateSection(
+            template_filename, template_mappings, output_filename, access_mode="a"
+        )
+        template_filename = os.path.join(templates_path, "copy_to_byte_stream-start.c")
 
+        self._GenerateSection(
+            template_filename, template_mappings, output_filename, access_mode="a"
+        )
+        if unicode_to_byte_stream_table:
+            self._GenerateLookupTableBody(
+                unicode_to_byte_stream_table,
+                "copy_to_byte_stream",
+                "unicode_character",
+                0xFFFFFFFF,
+                template_mappings,
+                output_filename,
+            )
+        else:
+            body_mappings = dict(template_mappings)
+            body_mappings["lower_condition"] = (
+                f"if( unicode_character < 0x{first_unicode_value:02x} )"
+            )
             template_filename = os.path.join(
-                templates_path, "copy_to_byte_stream-body-switch-end.c"
+                templates_path, "copy_to_byte_stream-body-lower.c"
             )
             self._GenerateSection(
-                template_filename, template_mappings, output_filename, access_mode="a"
+                template_filename, body_mappings, output_filename, access_mode="a"
             )
 
-        template_filename = os.path.join(templates_path, "copy_to_byte_stream-end.c")
+        if self._lead_bytes:
+            template_filename = os.path.join(
+                templates_path, "copy_to_byte_stream-end-multi_byte.c"
+            )
+        else:
+            template_filename = os.path.join(
+                templates_path, "copy_to_byte_stream-end.c"
+            )
 
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
@@ -328,7 +835,9 @@ class SourceGenerator:
     def _GenerateSourceHeaderFile(self):
         """Generates a source header file."""
         output_filename = os.path.join(
-            "libuna", f"libuna_codepage_{self._codepage_name:s}.h"
+            self._output_directory,
+            "libuna",
+            f"libuna_codepage_{self._codepage_name:s}.h",
         )
         template_mappings = self._GetTemplateMappings()
 
@@ -336,37 +845,55 @@ class SourceGenerator:
 
         self._GenerateSection(template_filename, template_mappings, output_filename)
 
+    def _FormatTestMapping(self, codepage_value, unicode_value):
+        """Formats a test mapping.
+
+        Args:
+          codepage_value (int): codepage value.
+          unicode_value (int): Unicode value.
+
+        Returns:
+          str: test mapping.
+        """
+        if codepage_value == 0:
+            byte_stream = ["0x00"]
+        else:
+            byte_stream = []
+            value = codepage_value
+            while value > 0:
+                byte_value = value & 0xFF
+                value >>= 8
+
+                byte_stream.insert(0, f"0x{byte_value:02x}")
+
+        bytes_string = ", ".join(byte_stream)
+        number_of_bytes = len(byte_stream)
+        return (
+            f"\t{{ {{ {bytes_string:s} }}, {number_of_bytes:d}, "
+            f"0x{unicode_value:04x}, 0 }},"
+        )
+
     def _GenerateTestHeaderFile(self):
-        """Generates a test header file."""
+        """Generates a test header file.
+
+        The test header file contains the byte stream to Unicode mappings,
+        including the double byte values of a multi-byte codepage, and the
+        Unicode to byte stream mappings, so that every mapping can be tested in
+        both directions.
+        """
         output_filename = os.path.join(
-            "tests", f"una_test_codepage_{self._codepage_name:s}.h"
+            self._output_directory,
+            "tests",
+            f"una_test_codepage_{self._codepage_name:s}.h",
         )
-        number_of_test_mappings = 0
         test_mappings = []
         last_codepage_value = -1
         for codepage_value, unicode_value in sorted(self._codepage_values.items()):
-            if codepage_value == 0:
-                byte_stream = ["0x00"]
-            else:
-                byte_stream = []
-                value = codepage_value
-                while value > 0:
-                    byte_value = value & 0xFF
-                    value >>= 8
-
-                    byte_stream.insert(0, f"0x{byte_value:02x}")
-
             # Add an empty line between non-consecutive values.
             if codepage_value > last_codepage_value + 1:
                 test_mappings.append("")
 
-            bytes_string = ", ".join(byte_stream)
-            number_of_bytes = len(byte_stream)
-            test_mappings.append(
-                f"\t{{ {{ {bytes_string:s} }}, {number_of_bytes:d}, "
-                f"0x{unicode_value:04x}, 0 }},"
-            )
-            number_of_test_mappings += 1
+            test_mappings.append(self._FormatTestMapping(codepage_value, unicode_value))
 
             last_codepage_value = codepage_value
 
@@ -374,17 +901,33 @@ class SourceGenerator:
             # Remove the trailing comma in the last test mapping.
             test_mappings[-1] = test_mappings[-1][:-1]
 
+        reverse_test_mappings = []
+        last_unicode_value = -1
+        for unicode_value, codepage_value in sorted(self._unicode_values.items()):
+            # Add an empty line between non-consecutive values.
+            if unicode_value > last_unicode_value + 1:
+                reverse_test_mappings.append("")
+
+            reverse_test_mappings.append(
+                self._FormatTestMapping(codepage_value, unicode_value)
+            )
+
+            last_unicode_value = unicode_value
+
+        if reverse_test_mappings:
+            # Remove the trailing comma in the last test mapping.
+            reverse_test_mappings[-1] = reverse_test_mappings[-1][:-1]
+
         template_mappings = self._GetTemplateMappings()
-        template_mappings["number_of_test_mappings"] = number_of_test_mappings
+        template_mappings["number_of_reverse_test_mappings"] = len(self._unicode_values)
+        template_mappings["number_of_test_mappings"] = len(self._codepage_values)
+        template_mappings["reverse_test_mappings"] = "\n".join(reverse_test_mappings)
         template_mappings["test_mappings"] = "\n".join(test_mappings)
 
         template_filename = os.path.join(self._templates_path, "una_test_codepage.h")
 
         self._GenerateSection(template_filename, template_mappings, output_filename)
 
-        del template_mappings["number_of_test_mappings"]
-        del template_mappings["test_mappings"]
-
     def _GetTemplateMappings(self):
         """Retrieves the template mappings.
 
@@ -411,46 +954,186 @@ class SourceGenerator:
         return template_mappings
 
     def Generate(self):
-        """Generates source code from the codepage definitions."""
-        self._GenerateSourceFile()
-        self._GenerateSourceHeaderFile()
-        self._GenerateTestHeaderFile()
+        """Generates source code from the codepage definitions.
+
+        Raises:
+          OSError: if the output directories cannot be created or the source
+              files cannot be written.
+        """
+        for directory_name in ("libuna", "tests"):
+            path = os.path.join(self._output_directory, directory_name)
+            os.makedirs(path, exist_ok=True)
+
+        self.table_sizes = {}
+
+        # The generated sections are only written when all of them were
+        # generated successfully, so that a failure leaves no partial files.
+        result = False
+        try:
+            self._GenerateSourceFile()
+            self._GenerateSourceHeaderFile()
+            self._GenerateTestHeaderFile()
+
+            if self._generate_benchmark:
+                self._GenerateBenchmarkSourceFile()
+
+            result = True
+
+        finally:
+            if result:
+                self._template_string_generator.Flush()
+            else:
+                self._template_string_generator.Discard()
 
     def ReadDefinitions(self, definitions_file):
         """Reads the definitions form file or directory.
 
         Args:
           definitions_file (str): path to the codepage definition file.
+
+        Raises:
+          RuntimeError: if the codepage definition file contains no mappings.
         """
         codepage_name = os.path.basename(definitions_file)
         codepage_name, _, _ = codepage_name.rpartition(".")
         self._codepage_name = codepage_name.replace("-", "_")
 
-        # TODO: add support for multi-byte characters
-
         self._codepage_values = {}
         self._unicode_values = {}
 
+        lead_bytes = set()
         with open(definitions_file, encoding="utf-8") as file_object:
             for line in file_object.readlines():
-                match_groups = self._CODEPAGE_MAPPINGS_REGEX.match(line)
-                if match_groups:
-                    try:
-                        codepage_value = int(match_groups[1], 16)
-                        unicode_value = int(match_groups[2], 16)
-
-                        self._codepage_values[codepage_value] = unicode_value
-                        self._unicode_values[unicode_value] = codepage_value
-                    except (ValueError, TypeError):
-                        pass
+                match_groups = self._CODEPAGE_MAPPINGS_REGEX.match(
+                    line
+                ) or self._UNICODE_MAPPINGS_REGEX.match(line)
+                if not match_groups:
+                    match_groups = self._UNICODE_LEAD_BYTE_REGEX.match(line)
+                    if match_groups:
+                        lead_bytes.add(int(match_groups[1], 16))
+                    continue
+
+                try:
+                    codepage_value = int(match_groups[1], 16)
+                    unicode_value = int(match_groups[2], 16)
+
+                    self._codepage_values[codepage_value] = unicode_value
+                except (ValueError, TypeError):
+                    pass
+
+        # The lead byte of a double byte value is the most significant byte.
+        for codepage_value in self._codepage_values:
+            if codepage_value > 0xFF:
+                lead_bytes.add(codepage_value >> 8)
+
+        # A lead byte cannot represent a single byte value.
+        for lead_byte in lead_bytes:
+            self._codepage_values.pop(lead_byte, None)
+
+        if not self._codepage_values:
+            raise RuntimeError(f"Missing mappings in file: {definitions_file:s}")
+
+        self._lead_bytes = sorted(lead_bytes)
+
+        # When multiple byte sequences map to the same Unicode character, the
+        # first one in the definitions file is used to convert the Unicode
+        # character, as Windows does.
+        for codepage_value, unicode_value in self._codepage_values.items():
+            self._unicode_values.setdefault(unicode_value, codepage_value)
 
         self._codepage_mappings = {}
-        self._unicode_mappings = {}
         for codepage_value, unicode_value in sorted(self._codepage_values.items()):
             if codepage_value != unicode_value:
                 self._codepage_mappings[codepage_value] = unicode_value
+
+        self._unicode_mappings = {}
+        for unicode_value, codepage_value in sorted(self._unicode_values.items()):
+            if codepage_value != unicode_value:
                 self._unicode_mappings[unicode_value] = codepage_value
 
+        self.codepage_name = self._codepage_name
+        self.number_of_mappings = len(self._codepage_values)
+
+
+def GetDefinitionsFilePaths(paths):
+    """Retrieves the paths of codepage definition files.
+
+    Args:
+      paths (list[str]): paths of codepage definition files or directories
+          that contain codepage definition files (*.txt).
+
+    Returns:
+      list[str]: paths of the codepage definition files.
+    """
+    definitions_file_paths = []
+    for path in paths:
+        if not os.path.isdir(path):
+            definitions_file_paths.append(path)
+            continue
+
+        for filename in sorted(os.listdir(path)):
+            file_path = os.path.join(path, filename)
+            if filename.endswith(".txt") and os.path.isfile(file_path):
+                definitions_file_paths.append(file_path)
+
+    return definitions_file_paths
+
+
+# The source generator of a worker process.
+_worker_source_generator = None
+
+
+def _InitializeWorker(templates_path, generate_benchmark, output_directory):
+    """Initializes a worker process.
+
+    Args:
+      templates_path (str): templates path.
+      generate_benchmark (bool): True if a benchmark program should be
+          generated.
+      output_directory (str): path of the directory that contains the libuna
+          and tests directories to write the output files to.
+    """
+    global _worker_source_generator  # pylint: disable=global-statement
+    _worker_source_generator = SourceGenerator(
+        templates_path,
+        generate_benchmark=generate_benchmark,
+        output_directory=output_directory,
+    )
+
+
+def _GenerateInWorker(definitions_file):
+    """Generates the source files of a codepage in a worker process.
+
+    Args:
+      definitions_file (str): path to the codepage definition file.
+
+    Returns:
+      tuple[str, str, int, dict[str, int], dict[str, str], str]: path to the
+          codepage definition file, name of the codepage, number of mappings,
+          size in bytes per generated table name, layout per conversion
+          direction and an error message or None if the source files were
+          generated successfully.
+    """
+    try:
+        _worker_source_generator.ReadDefinitions(definitions_file)
+        _worker_source_generator.Generate()
+
+    except (OSError, RuntimeError) as exception:
+        return definitions_file, None, 0, {}, {}, f"{exception!s}"
+
+    layouts = {
+        direction: lookup_table.LAYOUT
+        for direction, lookup_table in _worker_source_generator.lookup_tables.items()
+    }
+    return (
+        definitions_file,
+        _worker_source_generator.codepage_name,
+        _worker_source_generator.number_of_mappings,
+        dict(_worker_source_generator.table_sizes),
+        layouts,
+        None,
+    )
+
 
 def Main():
     """Entry point of console script.
@@ -462,11 +1145,27 @@ def Main():
         description=("Generates libuna source files base on a codepage definition.")
     )
     argument_parser.add_argument(
-        "definitions_file",
+        "--benchmark",
+        dest="generate_benchmark",
+        action="store_true",
+        default=False,
+        help=(
+            "generate a benchmark program per codepage, that measures the "
+            "conversion throughput."
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
         action="store",
-        metavar="PATH",
-        default="windows-1252.txt",
-        help="Path to the codepage definition file.",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help=(
+            "number of codepages to generate in parallel, where the default is "
+            "the number of CPUs."
+        ),
     )
     argument_parser.add_argument(
         "-o",
@@ -475,7 +1174,10 @@ def Main():
         action="store",
         metavar="OUTPUT_DIRECTORY",
         default=None,
-        help="Path of the output files to write to.",
+        help=(
+            "Path of the output directory, that contains the libuna and tests "
+            "directories, to write the output files to."
+        ),
     )
     argument_parser.add_argument(
         "--templates-path",
@@ -486,20 +1188,32 @@ def Main():
         default=None,
         help=("Path to the template files."),
     )
+    argument_parser.add_argument(
+        "definitions_files",
+        action="store",
+        metavar="PATH",
+        nargs="+",
+        help=(
+            "Path to a codepage definition file, such as windows-1252.txt, or "
+            "a directory containing codepage definition files."
+        ),
+    )
     options = argument_parser.parse_args()
 
-    if not options.definitions_file:
+    for path in options.definitions_files:
+        if not os.path.exists(path):
+            print(f"No such codepage definition file: {path:s}")
+            print("")
+            return 1
+
+    definitions_file_paths = GetDefinitionsFilePaths(options.definitions_files)
+    if not definitions_file_paths:
         print("Missing codepage definition file.")
         print("")
         argument_parser.print_help()
         print("")
         return 1
 
-    if not os.path.exists(options.definitions_file):
-        print(f"No such codepage definition file: {options.definitions_file:s}")
-        print("")
-        return 1
-
     if options.output_directory and not os.path.exists(options.output_directory):
         print(f"No such output directory: {options.output_directory:s}")
         print("")
@@ -513,12 +1227,56 @@ def Main():
         templates_path = os.path.dirname(templates_path)
         templates_path = os.path.join(templates_path, "data", "codepage")
 
-    source_generator = SourceGenerator(templates_path)
-    source_generator.ReadDefinitions(options.definitions_file)
-    if not source_generator.Generate():
-        return 1
+    if len(definitions_file_paths) > 1 and options.number_of_jobs != 1:
+        with multiprocessing.Pool(
+            processes=options.number_of_jobs,
+            initializer=_InitializeWorker,
+            initargs=(
+                templates_path,
+                options.generate_benchmark,
+                options.output_directory,
+            ),
+        ) as pool:
+            results = pool.map(_GenerateInWorker, definitions_file_paths)
+    else:
+        _InitializeWorker(
+            templates_path, options.generate_benchmark, options.output_directory
+        )
+        results = [_GenerateInWorker(path) for path in definitions_file_paths]
+
+    result = 0
+    total_table_size = 0
+    for (
+        definitions_file,
+        codepage_name,
+        number_of_mappings,
+        table_sizes,
+        layouts,
+        error_message,
+    ) in results:
+        if error_message:
+            logging.error(
+                f"Unable to generate codepage: {definitions_file:s} with error: "
+                f"{error_message:s}"
+            )
+            result = 1
+            continue
+
+        table_size = sum(table_sizes.values())
+        total_table_size += table_size
+
+        layouts_string = ", ".join(
+            [f"{direction:s}: {layout:s}" for direction, layout in layouts.items()]
+        )
+        logging.info(
+            f"Codepage: {codepage_name:s} mappings: {number_of_mappings:d} "
+            f"tables: {len(table_sizes):d} size: {table_size:d} bytes "
+            f"({layouts_string:s})"
+        )
+
+    logging.info(f"Total tables size: {total_table_size:d} bytes")
 
-    return 0
+    return result
 
 
 if __name__ == "__main__":
@@ -4,14 +4,21 @@
 
 import argparse
 import datetime
+import hashlib
 import logging
 import os
+import pickle
 import sys
 
+import dtfabric
+
 from dtfabric import errors
 from dtfabric import reader
 from dtfabric import registry
 
+import yaldevtools
+
+from yaldevtools import cache
 from yaldevtools import template_string
 
 
@@ -26,11 +33,16 @@ class AsciidocFormatDocumentGenerator:
     def __init__(self, templates_path):
         """Initializes a generator.
 
+        The generator can be used to generate the documents of multiple format
+        definitions files, in which case the template files are only read once.
+
         Args:
           templates_path (str): templates path.
         """
         super().__init__()
+        self._definitions_registries = {}
         self._definitions_registry = registry.DataTypeDefinitionsRegistry()
+        self._output_data = []
         self._templates_path = templates_path
         self._template_string_generator = template_string.TemplateStringGenerator()
 
@@ -44,7 +56,7 @@ class AsciidocFormatDocumentGenerator:
         output_data = self._template_string_generator.Generate(
             template_filename, template_mappings
         )
-        print(output_data)
+        self._output_data.append(output_data)
 
         # TODO: generate references
         # TODO: generate GFDL
@@ -58,7 +70,7 @@ class AsciidocFormatDocumentGenerator:
         output_data = self._template_string_generator.Generate(
             template_filename, template_mappings
         )
-        print(output_data)
+        self._output_data.append(output_data)
 
         self._GenerateOverview()
 
@@ -90,7 +102,9 @@ class AsciidocFormatDocumentGenerator:
         """Generates the overview chapter."""
         format_definition = self._GetFormatDefinitions()
 
-        template_mappings = {}
+        template_mappings = {
+            "byte_order": format_definition.metadata.get("byte_order", "")
+        }
 
         summary = format_definition.metadata.get("summary", None)
         if summary:
@@ -102,7 +116,7 @@ class AsciidocFormatDocumentGenerator:
         output_data = self._template_string_generator.Generate(
             template_filename, template_mappings
         )
-        print(output_data)
+        self._output_data.append(output_data)
 
         # TODO: generate characteristics table
         # TODO: generate overview description
@@ -128,7 +142,7 @@ class AsciidocFormatDocumentGenerator:
             template_mappings["authors"] = ", ".join(authors)
 
         keywords = format_definition.metadata.get("keywords", None)
-        if authors:
+        if keywords:
             template_mappings["keywords"] = ", ".join(keywords)
 
         year = format_definition.metadata.get("year", None)
@@ -147,22 +161,136 @@ class AsciidocFormatDocumentGenerator:
         output_data = self._template_string_generator.Generate(
             template_filename, template_mappings
         )
-        print(output_data)
+        self._output_data.append(output_data)
+
+    def _GetCacheFilePath(self, file_data, cache_directory):
+        """Retrieves the path of the cache file of a definitions file.
+
+        Args:
+          file_data (bytes): data of the definitions file.
+          cache_directory (str): path of the cache directory.
+
+        Returns:
+          str: path of the cache file.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(yaldevtools.__version__.encode("ascii"))
+        hasher.update(dtfabric.__version__.encode("ascii"))
+        hasher.update(file_data)
+
+        return os.path.join(
+            cache_directory, f"definitions_registry-{hasher.hexdigest():s}.pickle"
+        )
+
+    def _ReadFromCacheFile(self, path):
+        """Reads a definitions registry from a cache file.
+
+        Args:
+          path (str): path of the cache file.
+
+        Returns:
+          DataTypeDefinitionsRegistry: definitions registry or None if the cache
+              file does not exist or cannot be read.
+        """
+        # Unpickling an incompatible or corrupted cache file can raise various
+        # exceptions, which are all handled as a cache miss.
+        try:
+            with open(path, "rb") as file_object:
+                definitions_registry = pickle.load(file_object)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if not isinstance(definitions_registry, registry.DataTypeDefinitionsRegistry):
+            return None
+
+        return definitions_registry
+
+    def _WriteToCacheFile(self, path, definitions_registry):
+        """Writes a definitions registry to a cache file.
+
+        Args:
+          path (str): path of the cache file.
+          definitions_registry (DataTypeDefinitionsRegistry): definitions
+              registry.
+        """
+        cache.WriteCacheFile(
+            path, pickle.dumps(definitions_registry, protocol=pickle.HIGHEST_PROTOCOL)
+        )
 
     def Generate(self):
-        """Generates a format document."""
+        """Generates a format document.
+
+        Returns:
+          str: format document.
+        """
+        self._output_data = []
+
         self._GeneratePreface()
         self._GenerateBody()
         self._GenerateAppendices()
 
-    def ReadDefinitions(self, path):
-        """Reads the definitions form file or directory.
+        output_data = "\n".join(self._output_data)
+        self._output_data = []
+
+        return f"{output_data:s}\n"
+
+    def GetFormatName(self):
+        """Retrieves the name of the format definition.
+
+        Returns:
+          str: name of the format definition.
+
+        Raises:
+          RuntimeError: if the format definition is missing or if there are more
+              than 1 format definitions.
+        """
+        format_definition = self._GetFormatDefinitions()
+        return format_definition.name
+
+    def ReadDefinitions(self, path, cache_directory=None):
+        """Reads the definitions form file.
+
+        The definitions replace those of a previously read definitions file.
+        Definitions registries are cached by the hash of the definitions file.
 
         Args:
           path (str): path of the definition file.
+          cache_directory (Optional[str]): path of the directory that contains
+              the cache files, where None represents the definitions should
+              only be cached in memory.
+
+        Raises:
+          FormatError: if the definitions file cannot be read.
         """
-        definitions_reader = reader.YAMLDataTypeDefinitionsFileReader()
-        definitions_reader.ReadFile(self._definitions_registry, path)
+        try:
+            with open(path, "rb") as file_object:
+                file_data = file_object.read()
+        except OSError as exception:
+            raise errors.FormatError(
+                f"Unable to read file: {path:s} with error: {exception!s}"
+            )
+
+        hash_value = hashlib.sha256(file_data).hexdigest()
+
+        definitions_registry = self._definitions_registries.get(hash_value, None)
+        if not definitions_registry:
+            cache_file_path = None
+            if cache_directory:
+                cache_file_path = self._GetCacheFilePath(file_data, cache_directory)
+                definitions_registry = self._ReadFromCacheFile(cache_file_path)
+
+            if not definitions_registry:
+                definitions_registry = registry.DataTypeDefinitionsRegistry()
+
+                definitions_reader = reader.YAMLDataTypeDefinitionsFileReader()
+                definitions_reader.ReadFile(definitions_registry, path)
+
+                if cache_file_path:
+                    self._WriteToCacheFile(cache_file_path, definitions_registry)
+
+            self._definitions_registries[hash_value] = definitions_registry
+
+        self._definitions_registry = definitions_registry
 
 
 def Main():
@@ -174,6 +302,19 @@ def Main():
     argument_parser = argparse.ArgumentParser(
         description=("Generates documentation based on dtFabric format definitions.")
     )
+    argument_parser.add_argument(
+        "-o",
+        "--output-directory",
+        "--output_directory",
+        dest="output_directory",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of the directory to write the documents to, named after "
+            "the format definitions, instead of writing them to stdout."
+        ),
+    )
     argument_parser.add_argument(
         "--templates-path",
         "--templates_path",
@@ -184,24 +325,38 @@ def Main():
         help=("Path to the template files."),
     )
     argument_parser.add_argument(
-        "source",
-        nargs="?",
+        "sources",
+        nargs="*",
         action="store",
         metavar="PATH",
         default=None,
-        help="name of the file containing the dtFabric format definitions.",
+        help=(
+            "names of the files containing the dtFabric format definitions, "
+            "where multiple files require an output directory."
+        ),
     )
     options = argument_parser.parse_args()
 
-    if not options.source:
+    if not options.sources:
         print("Source value is missing.")
         print("")
         argument_parser.print_help()
         print("")
         return 1
 
-    if not os.path.isfile(options.source):
-        print(f"No such file: {options.source:s}")
+    if len(options.sources) > 1 and not options.output_directory:
+        print("Output directory value is missing for multiple sources.")
+        print("")
+        return 1
+
+    for source in options.sources:
+        if not os.path.isfile(source):
+            print(f"No such file: {source:s}")
+            print("")
+            return 1
+
+    if options.output_directory and not os.path.isdir(options.output_directory):
+        print(f"No such directory: {options.output_directory:s}")
         print("")
         return 1
 
@@ -211,17 +366,54 @@ def Main():
     if not templates_path:
         templates_path = os.path.dirname(__file__)
         templates_path = os.path.dirname(templates_path)
-        templates_path = os.path.join(templates_path, "data")
+        templates_path = os.path.join(templates_path, "data", "dtfabric")
+
+    cache_directory = cache.GetCacheDirectory()
 
     source_generator = AsciidocFormatDocumentGenerator(templates_path)
 
-    try:
-        source_generator.ReadDefinitions(options.source)
-    except errors.FormatError as exception:
-        print(f"Unable to read definitions with error: {exception!s}")
-        return 1
+    output_filenames = {}
+    result = True
+
+    for source in options.sources:
+        try:
+            source_generator.ReadDefinitions(source, cache_directory=cache_directory)
+            output_data = source_generator.Generate()
+
+        except (RuntimeError, errors.FormatError) as exception:
+            print(
+                f"Unable to generate document of: {source:s} with error: "
+                f"{exception!s}"
+            )
+            result = False
+            continue
+
+        if not options.output_directory:
+            print(output_data, end="")
+            continue
+
+        format_name = source_generator.GetFormatName()
+        output_filename = os.path.join(
+            options.output_directory, f"{format_name:s}.asciidoc"
+        )
+        if output_filename in output_filenames:
+            print(
+                f"Unable to write document of: {source:s} since: "
+                f"{output_filename:s} was already written for: "
+                f"{output_filenames[output_filename]:s}"
+            )
+            result = False
+            continue
 
-    source_generator.Generate()
+        output_filenames[output_filename] = source
+
+        logging.info(f"Writing: {output_filename:s}")
+
+        with open(output_filename, "w", encoding="utf8") as file_object:
+            file_object.write(output_data)
+
+    if not result:
+        return 1
 
     return 0
 
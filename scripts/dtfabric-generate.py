@@ -5,6 +5,7 @@
 import argparse
 import datetime
 import logging
+import multiprocessing
 import os
 import sys
 
@@ -13,6 +14,7 @@ from dtfabric import errors
 from dtfabric import reader
 from dtfabric import registry
 
+from yaldevtools import cache
 from yaldevtools import configuration
 from yaldevtools import source_formatter
 from yaldevtools.source_generators import interface
@@ -24,6 +26,7 @@ class TemplateRuntimeStructureMember:
     """Runtime structure member.
 
     Attributes:
+      byte_order (str): byte order.
       data_size (str): data size.
       data_type (str): data type.
       description (str): description.
@@ -34,6 +37,7 @@ class TemplateRuntimeStructureMember:
     def __init__(self):
         """Initializes a runtime structure member."""
         super().__init__()
+        self.byte_order = None
         self.data_size = None
         self.data_type = None
         self.description = None
@@ -92,25 +96,44 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         4: "uint32_t",
         8: "uint64_t",
     }
+    _BYTE_ORDERS = {
+        definitions.BYTE_ORDER_BIG_ENDIAN: "big_endian",
+        definitions.BYTE_ORDER_LITTLE_ENDIAN: "little_endian",
+    }
+
     _UNSIGNED_INTEGER_FORMAT_INDICATORS = {
         1: '%" PRIu8 "',
         2: '%" PRIu16 "',
         4: '%" PRIu32 "',
         8: '%" PRIu64 "',
     }
+
+    # Value types of the members in the runtime struct supported by the
+    # read_array function.
+    _READ_ARRAY_VALUE_TYPES = frozenset(["filetime", "integer", "posix_time", "uuid"])
+
+    # Number of entries and iterations of the read_array benchmark.
+    _BENCHMARK_NUMBER_OF_ENTRIES = 4096
+    _BENCHMARK_NUMBER_OF_ITERATIONS = 1000
+
     _NON_PRINTABLE_CHARACTERS = list(range(0, 0x20)) + list(range(0x7F, 0xA0))
     _ESCAPE_CHARACTERS = str.maketrans(
         {value: f"\\x{value:02x}" for value in _NON_PRINTABLE_CHARACTERS}
     )
 
-    def __init__(self, templates_path):
+    def __init__(self, templates_path, generate_benchmark=False):
         """Initializes a source generator.
 
         Args:
           templates_path (str): path of the directory containing the template files.
+          generate_benchmark (Optional[bool]): True if a benchmark program
+              should be generated for data types with a read_array function.
         """
         super().__init__(templates_path)
         self._definitions_registry = registry.DataTypeDefinitionsRegistry()
+        self._format_definition = None
+        self._format_template_mappings = None
+        self._generate_benchmark = generate_benchmark
         self._generate_structure_member_contents_hint = True
         self._generate_structure_member_size_hint = False
         self._prefix = None
@@ -141,6 +164,50 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
 
         return "\n".join(hexadecimal_lines)
 
+    def _GenerateRuntimeStructureBenchmarkSourceFile(self, data_type_definition):
+        """Generates a runtime structure benchmark source file.
+
+        The benchmark program compares the throughput of the read_array
+        function with that of calling the read_data function per entry, on
+        entries of the stored structure size copied from the test data.
+
+        Args:
+          data_type_definition (DataTypeDefinition): structure data type definition.
+        """
+        test_data = self._ReadTestDataFile(data_type_definition.name)
+        structure_size = data_type_definition.GetByteSize()
+
+        if len(test_data) < structure_size:
+            logging.warning(
+                f"Unable to generate benchmark for data type: "
+                f"{data_type_definition.name:s} with test data smaller than "
+                f"the structure"
+            )
+            return
+
+        output_filename = os.path.join(
+            "tests", f"{self._prefix:s}_test_{data_type_definition.name:s}_benchmark.c"
+        )
+
+        logging.info(f"Writing: {output_filename:s}")
+
+        template_mappings = self._GetTemplateMappings(
+            library_name=f"lib{self._prefix:s}",
+            structure_name=data_type_definition.name,
+        )
+        template_mappings["number_of_entries"] = self._BENCHMARK_NUMBER_OF_ENTRIES
+        template_mappings["number_of_iterations"] = self._BENCHMARK_NUMBER_OF_ITERATIONS
+        template_mappings["structure_size"] = structure_size
+        template_mappings["test_data"] = self._FormatTestData(test_data)
+        template_mappings["test_data_size"] = len(test_data)
+
+        template_filename = os.path.join(
+            self._templates_path, "runtime_structure_benchmark.c"
+        )
+        self._GenerateSection(template_filename, template_mappings, output_filename)
+
+        self._VerticalAlignAssignmentStatements(output_filename)
+
     def _GenerateRuntimeStructureHeaderFile(
         self, data_type_definition, members_configuration
     ):
@@ -174,6 +241,9 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         structure_members = self._GetTemplateRuntimeStructureMembers(
             data_type_definition, members_configuration
         )
+        template_mappings["generate_read_array"] = self._SupportsReadArrayFunction(
+            data_type_definition, members_configuration
+        )
         template_mappings["structure_description_title"] = structure_description_title
         template_mappings["structure_members"] = structure_members
         template_mappings["structure_options"] = members_configuration.get(
@@ -182,6 +252,7 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         self._GenerateSectionsFromOperationsFile(
             "runtime_structure.h.yaml", "main", None, template_mappings, output_filename
         )
+        del template_mappings["generate_read_array"]
         del template_mappings["structure_description_title"]
         del template_mappings["structure_members"]
         del template_mappings["structure_options"]
@@ -351,7 +422,7 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
             member_data_type_definition = getattr(
                 member_definition, "member_data_type_definition", member_definition
             )
-            member_configuration = members_configuration.get(structure_member.name, {})
+            member_configuration = members_configuration.get(member_name, {})
 
             member_byte_order = None
             member_data_type = None
@@ -407,6 +478,8 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
 
             structure_members.append(structure_member)
 
+        read_array_structure_members = []
+
         for structure_member in structure_members:
             if structure_member.usage != self._USAGE_IN_STRUCT:
                 continue
@@ -445,6 +518,13 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
             elif structure_member.value_type == "uuid":
                 template_filename = "read_data-guid.c"
 
+            read_array_structure_members.append(
+                (
+                    structure_member,
+                    template_filename.replace("read_data-", "read_array-"),
+                )
+            )
+
             template_filename = os.path.join(template_directory, template_filename)
             self._GenerateSection(
                 template_filename, template_mappings, output_filename, access_mode="a"
@@ -488,7 +568,7 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
             member_value_type = self._GetRuntimeStructureMemberValueType(
                 member_data_type_definition
             )
-            member_configuration = members_configuration.get(structure_member.name, {})
+            member_configuration = members_configuration.get(member_name, {})
 
             member_byte_order = None
             member_format_indicator = None
@@ -629,6 +709,31 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
+        if self._SupportsReadArrayFunction(data_type_definition, members_configuration):
+            template_mappings["structure_description"] = structure_description
+
+            template_filename = os.path.join(template_directory, "read_array-start.c")
+            self._GenerateSection(
+                template_filename, template_mappings, output_filename, access_mode="a"
+            )
+            for structure_member, template_filename in read_array_structure_members:
+                template_mappings["structure_member"] = structure_member
+
+                template_filename = os.path.join(template_directory, template_filename)
+                self._GenerateSection(
+                    template_filename,
+                    template_mappings,
+                    output_filename,
+                    access_mode="a",
+                )
+                del template_mappings["structure_member"]
+
+            template_filename = os.path.join(template_directory, "read_array-end.c")
+            self._GenerateSection(
+                template_filename, template_mappings, output_filename, access_mode="a"
+            )
+            del template_mappings["structure_description"]
+
         if "file_io_handle" in structure_options:
             template_mappings["structure_description"] = structure_description
 
@@ -671,6 +776,10 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
             library_name=f"lib{self._prefix:s}",
             structure_name=data_type_definition.name,
         )
+        template_mappings["generate_read_array"] = self._SupportsReadArrayFunction(
+            data_type_definition, members_configuration
+        )
+        template_mappings["structure_size"] = data_type_definition.GetByteSize()
         template_mappings["test_data"] = self._FormatTestData(test_data)
         template_mappings["test_data_size"] = len(test_data)
 
@@ -683,6 +792,8 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
             template_mappings,
             output_filename,
         )
+        del template_mappings["generate_read_array"]
+        del template_mappings["structure_size"]
         del template_mappings["test_data"]
         del template_mappings["test_data_size"]
 
@@ -705,14 +816,40 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         )
         template_mappings["structure_members"] = structure_members
 
-        template_filename = os.path.join(
-            self._templates_path, "stored_structure.h", "structure.h"
-        )
+        template_directory = os.path.join(self._templates_path, "stored_structure.h")
+
+        template_filename = os.path.join(template_directory, "structure.h")
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
         del template_mappings["structure_members"]
 
+        structure_options = members_configuration.get("__options__", {})
+        if "accessors" in structure_options:
+            structure_description = self._GetStructureDescription(data_type_definition)
+            template_mappings["structure_description"] = structure_description
+
+            for structure_member in self._GetStoredStructureAccessorMembers(
+                data_type_definition
+            ):
+                template_mappings["structure_member"] = structure_member
+
+                if structure_member.data_size == 1:
+                    template_filename = "accessor-byte.h"
+                else:
+                    template_filename = "accessor-integer.h"
+
+                template_filename = os.path.join(template_directory, template_filename)
+                self._GenerateSection(
+                    template_filename,
+                    template_mappings,
+                    output_filename,
+                    access_mode="a",
+                )
+                del template_mappings["structure_member"]
+
+            del template_mappings["structure_description"]
+
     def _GenerateStoredStructureHeaderFile(
         self, data_type_definition, members_configuration
     ):
@@ -755,6 +892,17 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
 
         del template_mappings["structure_description"]
 
+        structure_options = members_configuration.get("__options__", {})
+        if "accessors" in structure_options:
+            template_filename = "includes-accessors.h"
+        else:
+            template_filename = "includes.h"
+
+        template_filename = os.path.join(template_directory, template_filename)
+        self._GenerateSection(
+            template_filename, template_mappings, output_filename, access_mode="a"
+        )
+
         if data_type_definition.TYPE_INDICATOR == (
             definitions.TYPE_INDICATOR_STRUCTURE_FAMILY
         ):
@@ -776,6 +924,8 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
     def _GetFormatDefinitions(self):
         """Retrieves the format definition.
 
+        The format definition is resolved once after the definitions are read.
+
         Returns:
           FormatDefinition: format definition.
 
@@ -785,15 +935,18 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         """
         # pylint: disable=protected-access
 
-        if not self._definitions_registry._format_definitions:
-            raise RuntimeError("Missing format definition.")
+        if not self._format_definition:
+            if not self._definitions_registry._format_definitions:
+                raise RuntimeError("Missing format definition.")
 
-        if len(self._definitions_registry._format_definitions) > 1:
-            raise RuntimeError("Unsupported multiple format definitions.")
+            if len(self._definitions_registry._format_definitions) > 1:
+                raise RuntimeError("Unsupported multiple format definitions.")
 
-        return self._definitions_registry.GetDefinitionByName(
-            self._definitions_registry._format_definitions[0]
-        )
+            self._format_definition = self._definitions_registry.GetDefinitionByName(
+                self._definitions_registry._format_definitions[0]
+            )
+
+        return self._format_definition
 
     def _GetRuntimeDataType(self, data_type_definition):
         """Retrieves a runtime data type.
@@ -1008,6 +1161,70 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
 
         return "\n".join(variables)
 
+    def _GetStoredStructureAccessorMembers(self, data_type_definition):
+        """Retrieves the members of a stored structure that have an accessor.
+
+        Accessors read the value of an integer, date and time member directly
+        from the stored structure data, without reading the entire structure.
+
+        Args:
+          data_type_definition (DataTypeDefinition): structure data type definition.
+
+        Returns:
+          list[TemplateRuntimeStructureMember]: structure members with an accessor.
+        """
+        structure_byte_order = getattr(data_type_definition, "byte_order", None)
+
+        structure_members = []
+
+        for member_definition in data_type_definition.members:
+            member_name = member_definition.name
+            data_type_size = member_definition.GetByteSize()
+
+            member_data_type_definition = getattr(
+                member_definition, "member_data_type_definition", member_definition
+            )
+            member_value_type = self._GetRuntimeStructureMemberValueType(
+                member_data_type_definition
+            )
+            if member_value_type not in ("filetime", "integer", "posix_time"):
+                continue
+
+            if data_type_size not in self._UNSIGNED_INTEGER_DATA_TYPES:
+                continue
+
+            byte_order = getattr(member_data_type_definition, "byte_order", None)
+            if byte_order in (None, definitions.BYTE_ORDER_NATIVE):
+                byte_order = structure_byte_order
+
+            member_byte_order = self._BYTE_ORDERS.get(byte_order, None)
+            if data_type_size > 1 and not member_byte_order:
+                logging.warning(
+                    f"Unable to generate accessor for member: {member_name:s} of "
+                    f"data type: {data_type_definition.name:s} with unsupported "
+                    f"byte order"
+                )
+                continue
+
+            if member_definition.description:
+                description = member_definition.description
+            else:
+                description = member_name.replace("_", " ")
+
+            description = "".join([description[0].lower(), description[1:]])
+
+            structure_member = TemplateRuntimeStructureMember()
+            structure_member.byte_order = member_byte_order
+            structure_member.data_size = data_type_size
+            structure_member.data_type = f"uint{data_type_size * 8:d}"
+            structure_member.description = description
+            structure_member.name = member_name
+            structure_member.value_type = member_value_type
+
+            structure_members.append(structure_member)
+
+        return structure_members
+
     def _GetStoredStructureHeaderMembers(
         self, data_type_definition, members_configuration
     ):
@@ -1103,24 +1320,26 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         Returns:
           dict[str, str]: template mappings.
         """
-        format_definition = self._GetFormatDefinitions()
+        if self._format_template_mappings is None:
+            format_definition = self._GetFormatDefinitions()
 
-        template_mappings = {}
+            self._format_template_mappings = {}
 
-        authors = format_definition.metadata.get("authors", None)
-        if authors:
-            template_mappings["authors"] = ", ".join(authors)
+            authors = format_definition.metadata.get("authors", None)
+            if authors:
+                self._format_template_mappings["authors"] = ", ".join(authors)
 
-        date = datetime.date.today()
-        year = format_definition.metadata.get("year", date.year)
-        if year:
-            if year != date.year:
-                copyright_years = f"{year:d}-{date.year:d}"
-            else:
-                copyright_years = f"{year:d}"
+            date = datetime.date.today()
+            year = format_definition.metadata.get("year", date.year)
+            if year:
+                if year != date.year:
+                    copyright_years = f"{year:d}-{date.year:d}"
+                else:
+                    copyright_years = f"{year:d}"
 
-            template_mappings["copyright"] = copyright_years
+                self._format_template_mappings["copyright"] = copyright_years
 
+        template_mappings = dict(self._format_template_mappings)
         template_mappings["prefix"] = self._prefix
 
         if library_name:
@@ -1283,6 +1502,67 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
                 else:
                     file_object.write(line)
 
+    def _SupportsReadArrayFunction(self, data_type_definition, members_configuration):
+        """Determines if a read_array function is generated for a data type.
+
+        A read_array function is generated for a structure with the "array"
+        option, that has a fixed size, no signature and only members of the
+        runtime struct of which the value type is supported.
+
+        Args:
+          data_type_definition (DataTypeDefinition): structure data type definition.
+          members_configuration (dict[dict[str: str]]): code generation
+              configuration of the structure members.
+
+        Returns:
+          bool: True if a read_array function is generated.
+        """
+        structure_options = members_configuration.get("__options__", {})
+        if "array" not in structure_options:
+            return False
+
+        name = data_type_definition.name
+
+        if (
+            data_type_definition.TYPE_INDICATOR != definitions.TYPE_INDICATOR_STRUCTURE
+            or not data_type_definition.GetByteSize()
+        ):
+            logging.warning(
+                f"Unsupported array option for data type: {name:s} without a "
+                f"fixed size"
+            )
+            return False
+
+        for member_definition in data_type_definition.members:
+            member_name = member_definition.name
+
+            if getattr(member_definition, "values", None):
+                logging.warning(
+                    f"Unsupported array option for data type: {name:s} with "
+                    f"signature member: {member_name:s}"
+                )
+                return False
+
+            member_configuration = members_configuration.get(member_name, {})
+            member_usage = member_configuration.get("usage", self._USAGE_DEBUG)
+            if member_usage != self._USAGE_IN_STRUCT:
+                continue
+
+            member_data_type_definition = getattr(
+                member_definition, "member_data_type_definition", member_definition
+            )
+            member_value_type = self._GetRuntimeStructureMemberValueType(
+                member_data_type_definition
+            )
+            if member_value_type not in self._READ_ARRAY_VALUE_TYPES:
+                logging.warning(
+                    f"Unsupported array option for data type: {name:s} with "
+                    f"member: {member_name:s} of value type: {member_value_type!s}"
+                )
+                return False
+
+        return True
+
     def _VerticalAlignAssignmentStatements(self, output_filename):
         """Vertically aligns assignment statements.
 
@@ -1335,52 +1615,84 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         Args:
           project_configuration (ProjectConfiguration): project configuration.
 
+        Returns:
+          bool: True if successful, False otherwise.
+        """
+        result = True
+
+        for name in self.GetDataTypeNames(project_configuration):
+            if not self.GenerateDataType(project_configuration, name):
+                result = False
+
+        return result
+
+    def GenerateDataType(self, project_configuration, name):
+        """Generates source code from a data type definition.
+
+        Args:
+          project_configuration (ProjectConfiguration): project configuration.
+          name (str): name of the data type.
+
         Returns:
           bool: True if successful, False otherwise.
         """
         format_definition = self._GetFormatDefinitions()
         self._prefix = format_definition.name
 
-        result = True
-
         dtfabric_configuration = project_configuration.dtfabric_configuration
-        for name, members_configuration in dtfabric_configuration.data_types.items():
-            definition = self._definitions_registry.GetDefinitionByName(name)
-            if not definition:
-                logging.error(f"Missing data type: {name:s}")
-                result = False
-                continue
+        members_configuration = dtfabric_configuration.data_types.get(name, {})
 
-            if definition.TYPE_INDICATOR not in (
-                definitions.TYPE_INDICATOR_STRUCTURE,
-                definitions.TYPE_INDICATOR_STRUCTURE_FAMILY,
-            ):
-                logging.error(f"Unsupported data type: {name:s}")
-                result = False
-                continue
+        definition = self._definitions_registry.GetDefinitionByName(name)
+        if not definition:
+            logging.error(f"Missing data type: {name:s}")
+            return False
 
-            # if definition.TYPE_INDICATOR == (
-            #     definitions.TYPE_INDICATOR_STRUCTURE):
+        if definition.TYPE_INDICATOR not in (
+            definitions.TYPE_INDICATOR_STRUCTURE,
+            definitions.TYPE_INDICATOR_STRUCTURE_FAMILY,
+        ):
+            logging.error(f"Unsupported data type: {name:s}")
+            return False
 
-            #   Skip structures that are part of a type family.
-            #   if definition.family_definition:
-            #     logging.info(f"Skipping data type: {name:s}")
-            #     continue
+        # if definition.TYPE_INDICATOR == (
+        #     definitions.TYPE_INDICATOR_STRUCTURE):
 
-            #   byte_size = definition.GetByteSize()
-            #   if byte_size is None:
-            #     continue
+        #   Skip structures that are part of a type family.
+        #   if definition.family_definition:
+        #     logging.info(f"Skipping data type: {name:s}")
+        #     continue
 
-            logging.info(f"Generating data type: {name:s}")
+        #   byte_size = definition.GetByteSize()
+        #   if byte_size is None:
+        #     continue
 
-            self._GenerateRuntimeStructureHeaderFile(definition, members_configuration)
-            self._GenerateRuntimeStructureSourceFile(definition, members_configuration)
-            self._GenerateRuntimeStructureTestSourceFile(
-                project_configuration, definition, members_configuration
-            )
-            self._GenerateStoredStructureHeaderFile(definition, members_configuration)
+        logging.info(f"Generating data type: {name:s}")
 
-        return result
+        self._GenerateRuntimeStructureHeaderFile(definition, members_configuration)
+        self._GenerateRuntimeStructureSourceFile(definition, members_configuration)
+        self._GenerateRuntimeStructureTestSourceFile(
+            project_configuration, definition, members_configuration
+        )
+        self._GenerateStoredStructureHeaderFile(definition, members_configuration)
+
+        if self._generate_benchmark and self._SupportsReadArrayFunction(
+            definition, members_configuration
+        ):
+            self._GenerateRuntimeStructureBenchmarkSourceFile(definition)
+
+        return True
+
+    def GetDataTypeNames(self, project_configuration):
+        """Retrieves the names of the data types to generate.
+
+        Args:
+          project_configuration (ProjectConfiguration): project configuration.
+
+        Returns:
+          list[str]: names of the data types.
+        """
+        dtfabric_configuration = project_configuration.dtfabric_configuration
+        return list(dtfabric_configuration.data_types.keys())
 
     def ReadDefinitions(self, definitions_file):
         """Reads the definitions form file or directory.
@@ -1391,6 +1703,55 @@ class SourceGenerator(interface.BaseSourceFileGenerator):
         definitions_reader = reader.YAMLDataTypeDefinitionsFileReader()
         definitions_reader.ReadFile(self._definitions_registry, definitions_file)
 
+        self._format_definition = None
+        self._format_template_mappings = None
+
+
+# The project configuration and source generator of a worker process.
+_worker_project_configuration = None
+_worker_source_generator = None
+
+
+def _InitializeWorker(
+    templates_path, generate_benchmark, definitions_file, configuration_file
+):
+    """Initializes a worker process.
+
+    Args:
+      templates_path (str): path of the directory containing the template files.
+      generate_benchmark (bool): True if a benchmark program should be
+          generated for data types with a read_array function.
+      definitions_file (str): path to the data format definition file.
+      configuration_file (str): path of the project configuration file.
+    """
+    # pylint: disable=global-statement
+    global _worker_project_configuration
+    global _worker_source_generator
+
+    _worker_project_configuration = configuration.ProjectConfiguration()
+    _worker_project_configuration.ReadFromFile(
+        configuration_file, cache_directory=cache.GetCacheDirectory()
+    )
+
+    _worker_source_generator = SourceGenerator(
+        templates_path, generate_benchmark=generate_benchmark
+    )
+    _worker_source_generator.ReadDefinitions(definitions_file)
+
+
+def _GenerateDataTypeInWorker(name):
+    """Generates source code from a data type definition in a worker process.
+
+    Args:
+      name (str): name of the data type.
+
+    Returns:
+      bool: True if successful, False otherwise.
+    """
+    return _worker_source_generator.GenerateDataType(
+        _worker_project_configuration, name
+    )
+
 
 def Main():
     """Entry point of console script.
@@ -1401,6 +1762,16 @@ def Main():
     argument_parser = argparse.ArgumentParser(
         description="Generates source based on dtFabric format definitions."
     )
+    argument_parser.add_argument(
+        "--benchmark",
+        dest="generate_benchmark",
+        action="store_true",
+        default=False,
+        help=(
+            "generate a benchmark program per data type with a read_array "
+            "function, that compares it with reading the entries one by one."
+        ),
+    )
     argument_parser.add_argument(
         "--definitions-file",
         "--definitions_file",
@@ -1410,6 +1781,19 @@ def Main():
         default="dtfabric.yaml",
         help=("Path to the dtFabric definitions file."),
     )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help=(
+            "number of data types to generate in parallel, where the default "
+            "is the number of CPUs."
+        ),
+    )
     argument_parser.add_argument(
         "--templates-path",
         "--templates_path",
@@ -1449,9 +1833,13 @@ def Main():
         templates_path = os.path.join(templates_path, "data", "dtfabric")
 
     project_configuration = configuration.ProjectConfiguration()
-    project_configuration.ReadFromFile(options.configuration_file)
+    project_configuration.ReadFromFile(
+        options.configuration_file, cache_directory=cache.GetCacheDirectory()
+    )
 
-    source_generator = SourceGenerator(templates_path)
+    source_generator = SourceGenerator(
+        templates_path, generate_benchmark=options.generate_benchmark
+    )
 
     try:
         source_generator.ReadDefinitions(options.definitions_file)
@@ -1462,7 +1850,27 @@ def Main():
         )
         return 1
 
-    if not source_generator.Generate(project_configuration):
+    data_type_names = source_generator.GetDataTypeNames(project_configuration)
+
+    if len(data_type_names) > 1 and options.number_of_jobs != 1:
+        with multiprocessing.Pool(
+            processes=options.number_of_jobs,
+            initializer=_InitializeWorker,
+            initargs=(
+                templates_path,
+                options.generate_benchmark,
+                options.definitions_file,
+                options.configuration_file,
+            ),
+        ) as pool:
+            results = pool.map(_GenerateDataTypeInWorker, data_type_names)
+    else:
+        results = [
+            source_generator.GenerateDataType(project_configuration, name)
+            for name in data_type_names
+        ]
+
+    if not all(results):
         return 1
 
     return 0
@@ -2,16 +2,21 @@
 """Script to convert github.com issues into CSV."""
 
 import argparse
+import concurrent.futures
 import configparser
+import hashlib
 import json
 import logging
 import os
-import re
 import sys
+import threading
 import time
 
 from urllib import error as urllib_error
-from urllib.request import urlopen
+from urllib import parse as urllib_parse
+from urllib import request as urllib_request
+
+from yaldevtools import cache
 
 
 class Project:
@@ -105,6 +110,257 @@ class ProjectsReader:
         return projects
 
 
+class RateLimiter:
+    """Token bucket that limits the number of requests to the Github API.
+
+    The number of tokens and the time the bucket is refilled are determined
+    by the X-RateLimit-Remaining and X-RateLimit-Reset headers of the
+    responses. The limiter is shared by the threads that make requests.
+    """
+
+    def __init__(self):
+        """Initializes a rate limiter."""
+        super().__init__()
+        self._condition = threading.Condition()
+        self._remaining = None
+        self._reset_timestamp = None
+
+    def Acquire(self):
+        """Acquires a token, waiting until the bucket is refilled if needed."""
+        with self._condition:
+            while self._remaining is not None and self._remaining <= 0:
+                wait_time = self._reset_timestamp - time.time()
+                if wait_time <= 0:
+                    # The rate limit has been reset, the remaining number of
+                    # requests is unknown until the next response.
+                    self._remaining = None
+                    break
+
+                logging.info(
+                    f"Rate limiting calls to Github API - sleeping for "
+                    f"{wait_time:.0f} seconds."
+                )
+                self._condition.wait(timeout=wait_time)
+
+            if self._remaining is not None:
+                self._remaining -= 1
+
+    def Release(self):
+        """Returns a token that was acquired for a request that did not count.
+
+        A 304 (Not Modified) response to a conditional request does not count
+        towards the Github API rate limit.
+        """
+        with self._condition:
+            if self._remaining is not None:
+                self._remaining += 1
+                self._condition.notify_all()
+
+    def Update(self, headers):
+        """Updates the token bucket from the rate limit response headers.
+
+        Args:
+          headers (HTTPMessage): response headers.
+        """
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining"), 10)
+            reset_timestamp = int(headers.get("X-RateLimit-Reset"), 10)
+        except (TypeError, ValueError):
+            return
+
+        with self._condition:
+            # Responses can arrive out of order, hence within the same rate
+            # limit window the lowest remaining number of requests is kept.
+            if (
+                self._remaining is None
+                or reset_timestamp != self._reset_timestamp
+                or remaining < self._remaining
+            ):
+                self._remaining = remaining
+
+            self._reset_timestamp = reset_timestamp
+            self._condition.notify_all()
+
+
+class IssuesStore:
+    """Local store of the open issues of projects.
+
+    The store is used to synchronize the issues incrementally, where only the
+    issues that were updated since the last synchronization are downloaded.
+    """
+
+    def __init__(self, path):
+        """Initializes an issues store.
+
+        Args:
+          path (str): path of the issues store file.
+        """
+        super().__init__()
+        self._path = path
+        self._projects = {}
+
+    def GetIssues(self, project_name):
+        """Retrieves the open issues of a project.
+
+        Args:
+          project_name (str): name of the project.
+
+        Returns:
+          list[dict[str, object]]: issues formatted in JSON, sorted by issue
+              number in descending order.
+        """
+        project_json = self._projects.get(project_name, None) or {}
+        issues_json = project_json.get("issues", None) or {}
+        return [
+            issue_json
+            for _, issue_json in sorted(
+                issues_json.items(), key=lambda item: int(item[0], 10), reverse=True
+            )
+        ]
+
+    def GetLastSynchronizationTime(self, project_name):
+        """Retrieves the time of the last synchronization of a project.
+
+        Args:
+          project_name (str): name of the project.
+
+        Returns:
+          str: ISO 8601 date and time of the last synchronization or None if
+              the project was not synchronized before.
+        """
+        project_json = self._projects.get(project_name, None) or {}
+        return project_json.get("last_synchronization_time", None)
+
+    def MergeIssues(self, project_name, issues_json, synchronization_time, is_full):
+        """Merges updated issues of a project into the store.
+
+        Args:
+          project_name (str): name of the project.
+          issues_json (list[dict[str, object]]): issues formatted in JSON.
+          synchronization_time (str): ISO 8601 date and time the issues were
+              requested.
+          is_full (bool): True if the issues contain all open issues of the
+              project, False if they only contain updated issues.
+        """
+        project_json = self._projects.get(project_name, None)
+        if is_full or not project_json:
+            project_json = {"issues": {}}
+            self._projects[project_name] = project_json
+
+        stored_issues_json = project_json["issues"]
+        for issue_json in issues_json:
+            issue_number = f"{issue_json['number']:d}"
+            if issue_json.get("state", None) == "open":
+                stored_issues_json[issue_number] = issue_json
+            else:
+                stored_issues_json.pop(issue_number, None)
+
+        project_json["last_synchronization_time"] = synchronization_time
+
+    def Read(self):
+        """Reads the issues store file.
+
+        A missing or unreadable issues store file results in an empty store.
+        """
+        try:
+            with open(self._path, encoding="utf8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError):
+            return
+
+        if isinstance(json_dict, dict):
+            self._projects = json_dict.get("projects", None) or {}
+
+    def Write(self):
+        """Writes the issues store file."""
+        json_string = json.dumps({"projects": self._projects})
+        if not cache.WriteCacheFile(self._path, json_string.encode("utf8")):
+            logging.warning(f"Unable to write issues store: {self._path:s}")
+
+
+class ResponseCache:
+    """On-disk cache of HTTP responses for conditional requests.
+
+    The content of a response is stored together with its ETag and
+    Last-Modified headers, which are sent in the If-None-Match and
+    If-Modified-Since headers of the next request of the same URL. A 304 (Not
+    Modified) response does not count towards the Github API rate limit.
+    """
+
+    def __init__(self, path):
+        """Initializes a response cache.
+
+        Args:
+          path (str): path of the directory in which the responses are cached.
+        """
+        super().__init__()
+        self._path = path
+
+    def _GetCacheFilePath(self, url):
+        """Retrieves the path of the cache file of an URL.
+
+        Args:
+          url (str): URL.
+
+        Returns:
+          str: path of the cache file.
+        """
+        url_hash = hashlib.sha256(url.encode("utf8")).hexdigest()
+        return os.path.join(self._path, f"{url_hash:s}.json")
+
+    def GetResponse(self, url):
+        """Retrieves a cached response.
+
+        Args:
+          url (str): URL of the response.
+
+        Returns:
+          dict[str, str]: cached response, with the keys "content", "etag",
+              "last_modified" and "link", or None if not available.
+        """
+        try:
+            with open(self._GetCacheFilePath(url), encoding="utf8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(json_dict, dict) or json_dict.get("url", None) != url:
+            return None
+
+        return json_dict
+
+    def SetResponse(self, url, content, headers):
+        """Caches a response.
+
+        Args:
+          url (str): URL of the response.
+          content (bytes): content of the response.
+          headers (HTTPMessage): response headers.
+        """
+        etag = headers.get("ETag", None)
+        last_modified = headers.get("Last-Modified", None)
+        if not etag and not last_modified:
+            return
+
+        try:
+            content_string = content.decode("utf8")
+        except UnicodeDecodeError:
+            return
+
+        json_dict = {
+            "content": content_string,
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": headers.get("Link", None),
+            "url": url,
+        }
+
+        json_string = json.dumps(json_dict)
+        cache.WriteCacheFile(self._GetCacheFilePath(url), json_string.encode("utf8"))
+
+
 class GithubIssueHelper:
     """Github issue helper."""
 
@@ -119,19 +375,38 @@ class GithubIssueHelper:
         "html_url",
     ]
 
-    _LAST_PAGE_RE = re.compile(
-        r"<(https://api.github.com/repositories/[0-9]+/issues\?"
-        r'state=open&page=)([0-9]+)>; rel="last"'
-    )
+    _MAXIMUM_NUMBER_OF_ATTEMPTS = 3
 
-    def __init__(self, organization):
+    def __init__(
+        self,
+        organization,
+        api_url="https://api.github.com",
+        cache_directory=None,
+        maximum_number_of_requests=4,
+    ):
         """Initialize a Github issue helper.
 
         Args:
           organization (str): name of the organization on Github.
+          api_url (Optional[str]): URL of the Github API.
+          cache_directory (Optional[str]): path of the directory in which the
+              responses and issues are stored, where None represents no
+              caching.
+          maximum_number_of_requests (Optional[int]): maximum number of
+              concurrent requests.
         """
         super().__init__()
+        self._api_url = api_url.rstrip("/")
+        self._cache_directory = cache_directory
+        self._maximum_number_of_requests = maximum_number_of_requests
         self._organization = organization
+        self._rate_limiter = RateLimiter()
+        self._response_cache = None
+
+        if cache_directory:
+            self._response_cache = ResponseCache(
+                os.path.join(cache_directory, "issues2csv", "responses")
+            )
 
     def _DownloadPageContent(self, download_url):
         """Downloads the page content from the URL.
@@ -146,118 +421,229 @@ class GithubIssueHelper:
         if not download_url:
             return None, None
 
-        try:
-            with urlopen(download_url) as url_object:
-                if url_object.code == 200:
-                    return url_object.read(), url_object.info()
+        # Responses of incremental requests are not cached, since the since
+        # parameter changes every run and the cached response would never be
+        # used again.
+        response_cache = self._response_cache
+        url_parts = urllib_parse.urlsplit(download_url)
+        if "since" in urllib_parse.parse_qs(url_parts.query):
+            response_cache = None
+
+        cached_response = None
+        request_headers = {}
+        if response_cache:
+            cached_response = response_cache.GetResponse(download_url)
+            if cached_response:
+                if cached_response.get("etag", None):
+                    request_headers["If-None-Match"] = cached_response["etag"]
+                if cached_response.get("last_modified", None):
+                    request_headers["If-Modified-Since"] = cached_response[
+                        "last_modified"
+                    ]
+
+        request = urllib_request.Request(download_url, headers=request_headers)
+
+        for _ in range(self._MAXIMUM_NUMBER_OF_ATTEMPTS):
+            self._rate_limiter.Acquire()
+
+            try:
+                with urllib_request.urlopen(request) as url_object:
+                    self._rate_limiter.Update(url_object.headers)
+
+                    if url_object.code == 200:
+                        content = url_object.read()
+                        if response_cache:
+                            response_cache.SetResponse(
+                                download_url, content, url_object.headers
+                            )
+
+                        return content, url_object.info()
+
+                    logging.warning(
+                        f"Unable to download URL: {download_url:s} with status "
+                        f"code: {url_object.code:d}"
+                    )
+                    return None, None
+
+            except urllib_error.HTTPError as exception:
+                self._rate_limiter.Update(exception.headers)
+
+                if exception.code == 304 and cached_response:
+                    self._rate_limiter.Release()
+
+                    # A 304 (Not Modified) response can lack the Link header.
+                    response = exception.headers
+                    if not response.get("Link") and cached_response.get("link"):
+                        response["Link"] = cached_response["link"]
+
+                    return cached_response["content"].encode("utf8"), response
+
+                # Retry when the rate limit was exceeded.
+                if exception.code in (403, 429) and (
+                    exception.headers.get("X-RateLimit-Remaining") == "0"
+                ):
+                    continue
 
                 logging.warning(
-                    f"Unable to download URL: {download_url:s} with status code: "
-                    f"{url_object.code:d}"
+                    f"Unable to download URL: {download_url:s} with error: "
+                    f"{exception!s}"
                 )
                 return None, None
 
-        except urllib_error.URLError as exception:
-            logging.warning(
-                f"Unable to download URL: {download_url:s} with error: {exception!s}"
-            )
-            return None, None
-
-    def _ListIssuesForProject(self, project_name, output_writer):
-        """Lists the issues of a specific project.
-
-        Args:
-          project_name (str): name of the project.
-          output_writer (OutputWriter): an output writer.
-        """
-        self._WaitForRateLimit()
+            except urllib_error.URLError as exception:
+                logging.warning(
+                    f"Unable to download URL: {download_url:s} with error: "
+                    f"{exception!s}"
+                )
+                return None, None
 
-        download_url = (
-            f"https://api.github.com/repos/{self._organization:s}/{project_name:s}/"
-            f"issues?state=open"
-        )
-        issues_data, response = self._DownloadPageContent(download_url)
-        if not issues_data:
-            return
+        logging.warning(f"Unable to download URL: {download_url:s} rate limited")
+        return None, None
 
-        for issue_json in json.loads(issues_data):
-            self._WriteIssue(project_name, issue_json, output_writer)
+    def _GetPageURLs(self, response):
+        """Retrieves the URLs of the subsequent pages of a multi-page response.
 
-        if not response:
-            logging.error("Missing HTTP response message.")
-            return
+        Args:
+          response (HTTPMessage): HTTP response message of the first page.
 
-        # Handle the multi-page response.
+        Returns:
+          list[str]: URLs of the second up to and including the last page.
+        """
         link_header = response.get("Link")
         if not link_header:
-            return
+            return []
 
-        matches = self._LAST_PAGE_RE.findall(link_header)
-        if len(matches) != 1 and len(matches[0]) != 2:
-            logging.error(f"Unsupported Link HTTP header: {link_header:s}")
-            return
+        last_page_url = None
+        for link in link_header.split(","):
+            url, _, parameters = link.partition(";")
+            if 'rel="last"' in parameters:
+                last_page_url = url.strip().lstrip("<").rstrip(">")
+                break
+
+        if not last_page_url:
+            return []
 
-        base_url = matches[0][0]
+        url_parts = urllib_parse.urlsplit(last_page_url)
+        query = urllib_parse.parse_qs(url_parts.query)
 
         try:
-            last_page = int(matches[0][1], 10) + 1
-        except ValueError:
+            last_page = int(query["page"][0], 10)
+        except (IndexError, KeyError, ValueError):
             logging.error(f"Unsupported Link HTTP header: {link_header:s}")
-            return
+            return []
+
+        page_urls = []
+        for page_number in range(2, last_page + 1):
+            query["page"] = [f"{page_number:d}"]
+            page_query = urllib_parse.urlencode(query, doseq=True)
+            page_urls.append(
+                urllib_parse.urlunsplit(url_parts._replace(query=page_query))
+            )
 
-        for page_number in range(2, last_page):
-            self._WaitForRateLimit()
+        return page_urls
 
-            download_url = f"{base_url:s}{page_number:d}"
-            issues_data, _ = self._DownloadPageContent(download_url)
-            if not issues_data:
-                logging.error(f"Missing issues page content: {download_url:s}")
-                continue
+    def _GetIssuesURL(self, project_name, since=None):
+        """Retrieves the URL of the first page of the issues of a project.
 
-            for issue_json in json.loads(issues_data):
-                self._WriteIssue(project_name, issue_json, output_writer)
+        Args:
+          project_name (str): name of the project.
+          since (Optional[str]): ISO 8601 date and time, where only issues
+              updated at or after this time are requested, including issues
+              that were closed, or None to request all open issues.
 
-    def _WaitForRateLimit(self):
-        """Checks and waits for the rate limit."""
-        download_url = "https://api.github.com/rate_limit"
+        Returns:
+          str: URL of the first page of the issues.
+        """
+        url = f"{self._api_url:s}/repos/{self._organization:s}/{project_name:s}/issues"
+        if not since:
+            return f"{url:s}?state=open"
 
-        remaining_count = 0
-        while remaining_count == 0:
-            rate_limit_data, _ = self._DownloadPageContent(download_url)
-            if not rate_limit_data:
-                logging.error("Missing rate limit page content.")
-                return
+        query = urllib_parse.urlencode({"state": "all", "since": since})
+        return f"{url:s}?{query:s}"
 
-            rate_limit_json = json.loads(rate_limit_data)
+    def _ListIssuesOfProjects(self, project_names, since_per_project=None):
+        """Lists the issues of projects.
 
-            rate_json = rate_limit_json.get("rate", None)
-            if not rate_json:
-                logging.error("Invalid rate limit information - missing rate.")
-                return
+        The first pages of the projects are downloaded concurrently, and the
+        subsequent pages of a project are downloaded as soon as its first page
+        indicates the number of pages.
 
-            remaining_count = rate_json.get("remaining", None)
-            if remaining_count is None:
-                logging.error("Invalid rate limit information - missing remaining.")
-                return
+        Args:
+          project_names (list[str]): names of the projects to list.
+          since_per_project (Optional[dict[str, str]]): ISO 8601 date and time
+              per project name, where only the issues updated since that time
+              are requested.
 
-            reset_timestamp = rate_json.get("reset", None)
-            if reset_timestamp is None:
-                logging.error("Invalid rate limit information - missing reset.")
-                return
+        Returns:
+          dict[str, list[dict[str, object]]]: issues formatted in JSON per
+              project name, where projects of which not all pages could be
+              downloaded are omitted.
+        """
+        failed_projects = set()
+        pages_per_project = {project_name: {} for project_name in project_names}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._maximum_number_of_requests
+        ) as executor:
+            pending_futures = {}
+            for project_name in project_names:
+                since = None
+                if since_per_project:
+                    since = since_per_project.get(project_name, None)
+
+                download_url = self._GetIssuesURL(project_name, since=since)
+                future = executor.submit(self._DownloadPageContent, download_url)
+                pending_futures[future] = (project_name, 1, download_url)
+
+            while pending_futures:
+                done_futures, _ = concurrent.futures.wait(
+                    pending_futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done_futures:
+                    project_name, page_number, download_url = pending_futures.pop(
+                        future
+                    )
+                    issues_data, response = future.result()
+                    if not issues_data:
+                        if page_number > 1:
+                            logging.error(
+                                f"Missing issues page content: {download_url:s}"
+                            )
+                        failed_projects.add(project_name)
+                        continue
+
+                    pages_per_project[project_name][page_number] = json.loads(
+                        issues_data
+                    )
 
-            if remaining_count > 0:
-                break
+                    if page_number > 1:
+                        continue
+
+                    if not response:
+                        logging.error("Missing HTTP response message.")
+                        continue
+
+                    page_urls = self._GetPageURLs(response)
+                    for next_page_number, page_url in enumerate(page_urls, start=2):
+                        page_future = executor.submit(
+                            self._DownloadPageContent, page_url
+                        )
+                        pending_futures[page_future] = (
+                            project_name,
+                            next_page_number,
+                            page_url,
+                        )
+
+        issues_per_project = {}
+        for project_name, pages in pages_per_project.items():
+            if project_name in failed_projects:
+                continue
 
-            current_timestamp = int(time.time())
-            if current_timestamp > reset_timestamp:
-                break
+            issues_per_project[project_name] = []
+            for _, issues_json in sorted(pages.items()):
+                issues_per_project[project_name].extend(issues_json)
 
-            reset_timestamp -= current_timestamp
-            logging.info(
-                f"Rate limiting calls to Github API - sleeping for {reset_timestamp:d} "
-                f"seconds."
-            )
-            time.sleep(reset_timestamp)
+        return issues_per_project
 
     def _WriteHeader(self, output_writer):
         """Writes a header to CSV.
@@ -266,7 +652,7 @@ class GithubIssueHelper:
           output_writer (OutputWriter): an output writer.
         """
         csv_keys = "\t".join([f"{key:s}:" for key in self._KEYS])
-        output_writer.Write("project:\t{csv_keys:s}\n")
+        output_writer.Write(f"project:\t{csv_keys:s}\n")
 
     def _WriteIssue(self, project_name, issue_json, output_writer):
         """Writes an issue to CSV.
@@ -334,17 +720,62 @@ class GithubIssueHelper:
 
         output_writer.Write(csv_line)
 
-    def ListIssues(self, project_names, output_writer):
+    def ListIssues(self, project_names, output_writer, incremental=False):
         """Lists the issues of projects.
 
         Args:
           project_names (list[str]): names of the projects to list.
           output_writer (OutputWriter): an output writer.
+          incremental (Optional[bool]): True if only the issues that were
+              updated since the previous run should be downloaded and merged
+              into the issues store. Requires a cache directory.
         """
         self._WriteHeader(output_writer)
 
+        if not incremental or not self._cache_directory:
+            issues_per_project = self._ListIssuesOfProjects(project_names)
+
+        else:
+            issues_store_path = os.path.join(
+                self._cache_directory,
+                "issues2csv",
+                f"issues-{self._organization:s}.json",
+            )
+            issues_store = IssuesStore(issues_store_path)
+            issues_store.Read()
+
+            since_per_project = {
+                project_name: issues_store.GetLastSynchronizationTime(project_name)
+                for project_name in project_names
+            }
+
+            # Use the time before the requests are made, so that issues that
+            # are updated during synchronization are requested the next time.
+            synchronization_time = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+            updated_issues_per_project = self._ListIssuesOfProjects(
+                project_names, since_per_project=since_per_project
+            )
+            # Projects that failed to download keep their previously stored
+            # issues and synchronization time.
+            for project_name, issues_json in updated_issues_per_project.items():
+                issues_store.MergeIssues(
+                    project_name,
+                    issues_json,
+                    synchronization_time,
+                    not since_per_project[project_name],
+                )
+
+            issues_store.Write()
+
+            issues_per_project = {
+                project_name: issues_store.GetIssues(project_name)
+                for project_name in project_names
+            }
+
         for project_name in project_names:
-            self._ListIssuesForProject(project_name, output_writer)
+            for issue_json in issues_per_project.get(project_name, []):
+                self._WriteIssue(project_name, issue_json, output_writer)
 
         output_writer.Write("\n")
 
@@ -428,6 +859,43 @@ def Main():
         default="projects.ini",
         help=("The overview generation configuration file."),
     )
+    argument_parser.add_argument(
+        "--api-url",
+        "--api_url",
+        dest="api_url",
+        action="store",
+        metavar="URL",
+        default="https://api.github.com",
+        help="URL of the Github API.",
+    )
+    argument_parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=False,
+        help=(
+            "only download the issues that were updated since the previous run "
+            "and merge them into the locally stored issues."
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=4,
+        help="number of concurrent requests to the Github API.",
+    )
+    argument_parser.add_argument(
+        "--no-cache",
+        "--no_cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help="do not use the cached responses and locally stored issues.",
+    )
     argument_parser.add_argument(
         "-o",
         "--output",
@@ -488,8 +956,24 @@ def Main():
         print("")
         return 1
 
-    issue_helper = GithubIssueHelper("libyal")
-    issue_helper.ListIssues(project_names, output_writer)
+    if options.incremental and not options.use_cache:
+        print("Incremental synchronization requires the cache.")
+        print("")
+        return 1
+
+    cache_directory = None
+    if options.use_cache:
+        cache_directory = cache.GetCacheDirectory()
+
+    issue_helper = GithubIssueHelper(
+        "libyal",
+        api_url=options.api_url,
+        cache_directory=cache_directory,
+        maximum_number_of_requests=options.number_of_jobs,
+    )
+    issue_helper.ListIssues(
+        project_names, output_writer, incremental=options.incremental
+    )
 
     return 0
 
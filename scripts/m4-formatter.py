@@ -3,16 +3,241 @@
 """Script to format autotools m4 scripts."""
 
 import argparse
+import glob
+import hashlib
+import io
 import json
 import logging
+import multiprocessing
 import os
 import sys
 
+import ply
 import ply.lex as lex
 import ply.yacc as yacc
 
 from typing import Dict, Any, List
 
+try:
+    from yaldevtools import cache
+except ImportError:
+    # The yaldevtools package is only used for caching, without it the script
+    # can still be run standalone.
+    cache = None
+
+
+class AutotoolsM4Node:
+    """Autotools m4 abstract syntax tree node."""
+
+    __slots__ = ()
+
+    TYPE = None
+
+    def CopyToDict(self) -> Dict[str, Any]:
+        """Copies the node and its descendants to a dictionary.
+
+        Returns:
+          dict[str, object]: node and its descendants, in the JSON
+              representation of the abstract syntax tree.
+        """
+        # Use a stack instead of recursion to support deeply nested scripts.
+        json_dict = {}
+        stack = [(self, json_dict)]
+        while stack:
+            node, node_dict = stack.pop()
+            node_dict["type"] = node.TYPE
+
+            if isinstance(node, (AutotoolsM4CommentBlock, AutotoolsM4TextLiteral)):
+                node_dict["value"] = node.value
+                continue
+
+            if isinstance(node, AutotoolsM4MacroCall):
+                node_dict["name"] = node.name
+                node_dict["arguments"] = []
+                for argument in node.arguments:
+                    argument_list = []
+                    node_dict["arguments"].append(argument_list)
+                    for sub_node in argument:
+                        sub_node_dict = {}
+                        argument_list.append(sub_node_dict)
+                        stack.append((sub_node, sub_node_dict))
+                continue
+
+            node_dict["body"] = []
+            for sub_node in node.body:
+                sub_node_dict = {}
+                node_dict["body"].append(sub_node_dict)
+                stack.append((sub_node, sub_node_dict))
+
+        return json_dict
+
+    @classmethod
+    def CreateFromDict(cls, json_dict: Dict[str, Any]) -> "AutotoolsM4Node":
+        """Creates a node and its descendants from a dictionary.
+
+        Args:
+          json_dict (dict[str, object]): node and its descendants, in the JSON
+              representation of the abstract syntax tree.
+
+        Returns:
+          AutotoolsM4Node: node.
+
+        Raises:
+          ValueError: if the dictionary contains an unsupported node type.
+        """
+        # Use a stack instead of recursion to support deeply nested scripts.
+        # Nodes are appended to their parent list when popped from the stack,
+        # hence the sub nodes are pushed in reverse order.
+        result = []
+        stack = [(json_dict, result)]
+        while stack:
+            node_dict, parent_list = stack.pop()
+            node_type = node_dict.get("type", None)
+
+            node_class = _NODE_CLASSES.get(node_type, None)
+            if not node_class:
+                raise ValueError(f"Unsupported node type: {node_type!s}")
+
+            if node_class in (AutotoolsM4CommentBlock, AutotoolsM4TextLiteral):
+                node = node_class(node_dict.get("value", ""))
+
+            elif node_class == AutotoolsM4MacroCall:
+                node = node_class(node_dict.get("name", ""), [])
+                for argument_list in node_dict.get("arguments", []):
+                    argument = []
+                    node.arguments.append(argument)
+                    for sub_node_dict in reversed(argument_list):
+                        stack.append((sub_node_dict, argument))
+
+            else:
+                node = node_class([])
+                for sub_node_dict in reversed(node_dict.get("body", [])):
+                    stack.append((sub_node_dict, node.body))
+
+            parent_list.append(node)
+
+        return result[0]
+
+
+class AutotoolsM4CommentBlock(AutotoolsM4Node):
+    """Autotools m4 comment block (dnl) node.
+
+    Attributes:
+      value (str): comment, including the dnl.
+    """
+
+    __slots__ = ("value",)
+
+    TYPE = "CommentBlock"
+
+    def __init__(self, value: str):
+        """Initializes a comment block node.
+
+        Args:
+          value (str): comment, including the dnl.
+        """
+        super().__init__()
+        self.value = value
+
+
+class AutotoolsM4MacroCall(AutotoolsM4Node):
+    """Autotools m4 macro call node.
+
+    Attributes:
+      arguments (list[list[AutotoolsM4Node]]): nodes per argument.
+      name (str): name of the macro.
+    """
+
+    __slots__ = ("arguments", "name")
+
+    TYPE = "MacroCall"
+
+    def __init__(self, name: str, arguments: List[List[AutotoolsM4Node]]):
+        """Initializes a macro call node.
+
+        Args:
+          name (str): name of the macro.
+          arguments (list[list[AutotoolsM4Node]]): nodes per argument.
+        """
+        super().__init__()
+        self.arguments = arguments
+        self.name = name
+
+
+class AutotoolsM4QuotedBlock(AutotoolsM4Node):
+    """Autotools m4 quoted block node.
+
+    Attributes:
+      body (list[AutotoolsM4Node]): nodes within the quotes.
+    """
+
+    __slots__ = ("body",)
+
+    TYPE = "QuotedBlock"
+
+    def __init__(self, body: List[AutotoolsM4Node]):
+        """Initializes a quoted block node.
+
+        Args:
+          body (list[AutotoolsM4Node]): nodes within the quotes.
+        """
+        super().__init__()
+        self.body = body
+
+
+class AutotoolsM4Script(AutotoolsM4Node):
+    """Autotools m4 script node.
+
+    Attributes:
+      body (list[AutotoolsM4Node]): nodes of the script.
+    """
+
+    __slots__ = ("body",)
+
+    TYPE = "Script"
+
+    def __init__(self, body: List[AutotoolsM4Node]):
+        """Initializes a script node.
+
+        Args:
+          body (list[AutotoolsM4Node]): nodes of the script.
+        """
+        super().__init__()
+        self.body = body
+
+
+class AutotoolsM4TextLiteral(AutotoolsM4Node):
+    """Autotools m4 text literal node.
+
+    Attributes:
+      value (str): text.
+    """
+
+    __slots__ = ("value",)
+
+    TYPE = "TextLiteral"
+
+    def __init__(self, value: str):
+        """Initializes a text literal node.
+
+        Args:
+          value (str): text.
+        """
+        super().__init__()
+        self.value = value
+
+
+_NODE_CLASSES = {
+    node_class.TYPE: node_class
+    for node_class in (
+        AutotoolsM4CommentBlock,
+        AutotoolsM4MacroCall,
+        AutotoolsM4QuotedBlock,
+        AutotoolsM4Script,
+        AutotoolsM4TextLiteral,
+    )
+}
+
 
 class AutotoolsM4Lexer:
     """Autotools m4 script lexer."""
@@ -44,6 +269,7 @@ class AutotoolsM4Lexer:
         """Sets the input."""
         self.paren_depth = 0
         self.bracket_depth = 0
+        self.lexer.begin("INITIAL")
         self.lexer.lineno = 1
         self.lexer.input(data)
 
@@ -172,21 +398,97 @@ class AutotoolsM4Lexer:
 
 
 class AutotoolsM4Parser:
-    """Autotools m4 script parser."""
+    """Autotools m4 script parser.
 
-    def __init__(self):
-        """Initializes a parser."""
+    The parser and lexer are created once and can be used to parse multiple
+    scripts.
+    """
+
+    def __init__(self, cache_directory: str = None):
+        """Initializes a parser.
+
+        Args:
+          cache_directory (Optional[str]): path of the directory in which the
+              parser tables are cached, where None represents no caching.
+        """
         super().__init__()
         # Note that self.tokens must be set before self.parser
         self.tokens = AutotoolsM4Lexer.tokens
-        self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
+        self.grammar_hash = self._GetGrammarHash()
+        self.lexer = AutotoolsM4Lexer()
+        self.parser = self._CreateParser(cache_directory)
+
+    def _CreateParser(self, cache_directory: str):
+        """Creates the parser.
 
-    def parse(self, data: str) -> Dict[str, Any]:
+        Building the LALR parser tables from the grammar is expensive, hence
+        the tables are stored in a cache file that is named after a hash of
+        the grammar and reused by subsequent invocations.
+
+        Args:
+          cache_directory (str): path of the directory in which the parser
+              tables are cached, where None represents no caching.
+
+        Returns:
+          ply.yacc.LRParser: parser.
+        """
+        if not cache_directory:
+            return yacc.yacc(module=self, debug=False, write_tables=False)
+
+        cache_path = os.path.join(
+            cache_directory, f"m4-formatter-parsetab-{self.grammar_hash:s}.pickle"
+        )
+        if os.path.exists(cache_path):
+            try:
+                return yacc.yacc(
+                    module=self, debug=False, write_tables=False, picklefile=cache_path
+                )
+
+            except Exception:  # pylint: disable=broad-exception-caught
+                logging.warning(f"Unable to read parser tables from: {cache_path:s}")
+
+        # Write the parser tables to a temporary file first so that concurrent
+        # invocations do not read partially written tables.
+        temporary_path = f"{cache_path:s}.{os.getpid():d}"
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+        except OSError:
+            return yacc.yacc(module=self, debug=False, write_tables=False)
+
+        parser = yacc.yacc(
+            module=self, debug=False, write_tables=False, picklefile=temporary_path
+        )
+        try:
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        return parser
+
+    def _GetGrammarHash(self) -> str:
+        """Retrieves a hash of the grammar.
+
+        Returns:
+          str: SHA-256 hexadecimal digest of the grammar rules, the tokens and
+              the version of PLY.
+        """
+        hash_context = hashlib.sha256()
+        hash_context.update(ply.__version__.encode("utf8"))
+        hash_context.update(" ".join(self.tokens).encode("utf8"))
+
+        for name in sorted(dir(self)):
+            if name.startswith("p_") and name != "p_error":
+                docstring = getattr(self, name).__doc__ or ""
+                hash_context.update(f"{name:s}: {docstring:s}\n".encode("utf8"))
+
+        return hash_context.hexdigest()
+
+    def parse(self, data: str) -> AutotoolsM4Script:
         """Parses a string."""
-        lexer_instance = AutotoolsM4Lexer()
-        return self.parser.parse(data, lexer=lexer_instance.lexer)
+        return self.parser.parse(data, lexer=self.lexer)
 
-    def parse_file(self, file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
+    def parse_file(self, file_path: str, encoding: str = "utf-8") -> AutotoolsM4Script:
         """Parses a file."""
         with open(file_path, encoding=encoding) as file_object:
             file_content = file_object.read()
@@ -194,7 +496,7 @@ class AutotoolsM4Parser:
 
     def p_script(self, p):
         """script : expressions_opt"""
-        p[0] = {"type": "Script", "body": p[1]}
+        p[0] = AutotoolsM4Script(p[1])
 
     def p_expressions_opt(self, p):
         """expressions_opt : expressions
@@ -205,7 +507,8 @@ class AutotoolsM4Parser:
         """expressions : expressions expression
         | expression"""
         if len(p) == 3:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
@@ -214,16 +517,16 @@ class AutotoolsM4Parser:
         | quoted_block
         | TEXT
         | DNL_COMMENT"""
-        if isinstance(p[1], dict):
+        if isinstance(p[1], AutotoolsM4Node):
             p[0] = p[1]
         elif p.slice[1].type == "DNL_COMMENT":
-            p[0] = {"type": "CommentBlock", "value": p[1]}
+            p[0] = AutotoolsM4CommentBlock(p[1])
         else:
-            p[0] = {"type": "TextLiteral", "value": p[1]}
+            p[0] = AutotoolsM4TextLiteral(p[1])
 
     def p_macro_call(self, p):
         """macro_call : MACRO_NAME LPAREN arguments_opt RPAREN"""
-        p[0] = {"type": "MacroCall", "name": p[1], "arguments": p[3]}
+        p[0] = AutotoolsM4MacroCall(p[1], p[3])
 
     def p_arguments_opt(self, p):
         """arguments_opt : arguments
@@ -234,7 +537,8 @@ class AutotoolsM4Parser:
         """arguments : arguments COMMA argument
         | argument"""
         if len(p) == 4:
-            p[0] = p[1] + [p[3]]
+            p[1].append(p[3])
+            p[0] = p[1]
         else:
             p[0] = [p[1]]
 
@@ -244,7 +548,7 @@ class AutotoolsM4Parser:
 
     def p_quoted_block(self, p):
         """quoted_block : LBRACKET expressions_opt RBRACKET"""
-        p[0] = {"type": "QuotedBlock", "body": p[2]}
+        p[0] = AutotoolsM4QuotedBlock(p[2])
 
     def p_empty(self, p):
         "empty :"
@@ -259,59 +563,277 @@ class AutotoolsM4Parser:
                 f"{p.lineno:d}"
             )
 
-        raise SyntaxError("Unexpected end of file")
+        raise SyntaxError(message)
 
 
 class AutotoolsM4Generator:
     """Generates autotools m4 script from an abstract syntax tree."""
 
     @staticmethod
-    def generate(node: Dict[str, Any]) -> str:
+    def _IsEmptyArgument(argument: List[AutotoolsM4Node]) -> bool:
+        """Determines if a macro call argument generates no output.
+
+        Args:
+          argument (list[AutotoolsM4Node]): nodes of the argument.
+
+        Returns:
+          bool: True if the argument generates no output.
+        """
+        for node in argument:
+            if not isinstance(node, AutotoolsM4TextLiteral) or node.value:
+                return False
+
+        return True
+
+    @staticmethod
+    def generate(node: AutotoolsM4Node) -> str:
         """Generates m4 script."""
-        if not node:
-            return ""
+        output_writer = io.StringIO()
+        AutotoolsM4Generator.write(node, output_writer)
+        return output_writer.getvalue()
 
-        node_type = node.get("type")
+    @staticmethod
+    def write(node: AutotoolsM4Node, output_writer):
+        """Generates m4 script and writes it to a file-like object.
 
-        if node_type == "CommentBlock":
-            comment = node.get("value", "")
-            return f"{comment:s}\n"
+        The abstract syntax tree is traversed with a stack instead of
+        recursion, so that deeply nested scripts are supported.
 
-        if node_type == "MacroCall":
-            macro_name = node.get("name", "")
-            ast_arguments: List[List[Dict[str, Any]]] = node.get("arguments", [])
+        Args:
+          node (AutotoolsM4Node): node of the abstract syntax tree.
+          output_writer (file): file-like object to write the m4 script to.
+        """
+        # The stack contains nodes that still need to be generated and strings
+        # that still need to be written, in reverse order.
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
 
-            m4_arguments = []
-            for ast_argument in ast_arguments:
-                m4_argument = "".join(
-                    AutotoolsM4Generator.generate(token) for token in ast_argument
-                )
-                m4_arguments.append(m4_argument)
+            if isinstance(node, str):
+                output_writer.write(node)
 
-            if not m4_arguments or (len(m4_arguments) == 1 and m4_arguments[0] == ""):
-                return macro_name
+            elif isinstance(node, AutotoolsM4TextLiteral):
+                output_writer.write(node.value)
 
-            arguments_string = ",".join(m4_arguments)
-            return f"{macro_name:s}({arguments_string:s})"
+            elif isinstance(node, AutotoolsM4CommentBlock):
+                output_writer.write(f"{node.value:s}\n")
 
-        if node_type == "Script":
-            return "".join(
-                AutotoolsM4Generator.generate(sub_node)
-                for sub_node in node.get("body", [])
-            )
+            elif isinstance(node, AutotoolsM4MacroCall):
+                output_writer.write(node.name)
+
+                arguments = node.arguments
+                if not arguments or (
+                    len(arguments) == 1
+                    and AutotoolsM4Generator._IsEmptyArgument(arguments[0])
+                ):
+                    continue
+
+                stack.append(")")
+                for argument_index in range(len(arguments) - 1, -1, -1):
+                    stack.extend(reversed(arguments[argument_index]))
+                    if argument_index > 0:
+                        stack.append(",")
+
+                stack.append("(")
+
+            elif isinstance(node, AutotoolsM4QuotedBlock):
+                stack.append("]")
+                stack.extend(reversed(node.body))
+                stack.append("[")
+
+            elif isinstance(node, AutotoolsM4Script):
+                stack.extend(reversed(node.body))
+
+
+class AutotoolsM4ScriptFormatter:
+    """Formats autotools m4 scripts.
+
+    The abstract syntax trees of the scripts are stored in a cache, keyed by
+    a hash of the grammar and the content of the script, so that unchanged
+    scripts do not need to be parsed again.
+    """
+
+    def __init__(self, cache_directory: str = None):
+        """Initializes an autotools m4 script formatter.
+
+        Args:
+          cache_directory (Optional[str]): path of the directory in which the
+              parser tables and abstract syntax trees are cached, where None
+              represents no caching.
+        """
+        super().__init__()
+        self._abstract_syntax_trees_directory = None
+        self._parser = AutotoolsM4Parser(cache_directory=cache_directory)
 
-        if node_type == "QuotedBlock":
-            block_content = "".join(
-                AutotoolsM4Generator.generate(sub_node)
-                for sub_node in node.get("body", [])
+        if cache_directory:
+            self._abstract_syntax_trees_directory = os.path.join(
+                cache_directory, "m4-formatter"
             )
-            return f"[{block_content:s}]"
 
-        if node_type == "TextLiteral":
-            value = node.get("value", "")
-            return value
+    def _GetCachePath(self, content: str) -> str:
+        """Retrieves the path of the cached abstract syntax tree of a script.
+
+        Args:
+          content (str): content of the script.
+
+        Returns:
+          str: path of the cached abstract syntax tree or None if not caching.
+        """
+        if not self._abstract_syntax_trees_directory:
+            return None
+
+        hash_context = hashlib.sha256()
+        hash_context.update(self._parser.grammar_hash.encode("utf8"))
+        hash_context.update(content.encode("utf8"))
+        content_hash = hash_context.hexdigest()
+
+        return os.path.join(
+            self._abstract_syntax_trees_directory, f"{content_hash:s}.json"
+        )
+
+    def _ReadCachedAbstractSyntaxTree(self, path: str) -> AutotoolsM4Script:
+        """Reads a cached abstract syntax tree.
+
+        Args:
+          path (str): path of the cached abstract syntax tree.
+
+        Returns:
+          AutotoolsM4Script: abstract syntax tree or None if not available.
+        """
+        try:
+            with open(path, encoding="utf-8") as file_object:
+                json_dict = json.load(file_object)
+
+            return AutotoolsM4Node.CreateFromDict(json_dict)
+
+        except (AttributeError, IndexError, OSError, TypeError, ValueError):
+            return None
+
+    def _WriteCachedAbstractSyntaxTree(
+        self, path: str, abstract_syntax_tree: AutotoolsM4Script
+    ):
+        """Writes a cached abstract syntax tree.
+
+        Args:
+          path (str): path of the cached abstract syntax tree.
+          abstract_syntax_tree (AutotoolsM4Script): abstract syntax tree.
+        """
+        json_string = json.dumps(abstract_syntax_tree.CopyToDict())
+        cache.WriteCacheFile(path, json_string.encode("utf-8"))
+
+    def FormatFile(
+        self, path: str, output_format: str = "m4", check_only: bool = False
+    ):
+        """Formats an autotools m4 script file.
+
+        Args:
+          path (str): path of the m4 script file.
+          output_format (Optional[str]): output format, either "json" or "m4".
+          check_only (Optional[bool]): True if the m4 script file should only
+              be checked and not be changed.
+
+        Returns:
+          tuple[str, bool, str]: formatted output, True if the formatted m4
+              script differs from the m4 script file, and an error message
+              or None if the file was formatted successfully.
+        """
+        try:
+            with open(path, encoding="utf-8") as file_object:
+                content = file_object.read()
+
+        except (OSError, UnicodeDecodeError) as exception:
+            return None, False, f"Unable to read file with error: {exception!s}"
+
+        cache_path = self._GetCachePath(content)
+
+        abstract_syntax_tree = None
+        if cache_path:
+            abstract_syntax_tree = self._ReadCachedAbstractSyntaxTree(cache_path)
+
+        if abstract_syntax_tree is None:
+            try:
+                abstract_syntax_tree = self._parser.parse(content)
+            except SyntaxError as exception:
+                return None, False, f"{exception!s}"
+
+            if cache_path:
+                self._WriteCachedAbstractSyntaxTree(cache_path, abstract_syntax_tree)
+
+        m4_output = AutotoolsM4Generator.generate(abstract_syntax_tree)
+        is_changed = m4_output != content
+
+        if output_format == "json" and not check_only:
+            output = json.dumps(abstract_syntax_tree.CopyToDict(), indent=4)
+        else:
+            output = m4_output
+
+        return output, is_changed, None
 
-        return ""
+
+# The formatter of a worker process.
+_worker_formatter = None
+
+
+def _InitializeWorker(cache_directory):
+    """Initializes a worker process.
+
+    Args:
+      cache_directory (str): path of the directory in which the parser tables
+          and abstract syntax trees are cached, where None represents no
+          caching.
+    """
+    global _worker_formatter  # pylint: disable=global-statement
+    _worker_formatter = AutotoolsM4ScriptFormatter(cache_directory=cache_directory)
+
+
+def _FormatFileInWorker(path, output_format, check_only):
+    """Formats an autotools m4 script file in a worker process.
+
+    Args:
+      path (str): path of the m4 script file.
+      output_format (str): output format, either "json" or "m4".
+      check_only (bool): True if the m4 script file should only be checked
+          and not be changed.
+
+    Returns:
+      tuple[str, str, bool, str]: path of the m4 script file, formatted
+          output, True if the formatted m4 script differs from the m4 script
+          file and an error message or None if the file was formatted
+          successfully.
+    """
+    output, is_changed, error_message = _worker_formatter.FormatFile(
+        path, output_format=output_format, check_only=check_only
+    )
+    return path, output, is_changed, error_message
+
+
+def GetM4ScriptFilePaths(paths):
+    """Retrieves the paths of m4 script files.
+
+    Args:
+      paths (list[str]): paths of m4 script files, directories that contain
+          m4 script files or glob patterns.
+
+    Returns:
+      list[str]: paths of the m4 script files, sorted and without duplicates.
+    """
+    m4_script_file_paths = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for filename in os.listdir(path):
+                file_path = os.path.join(path, filename)
+                if filename.endswith(".m4") and os.path.isfile(file_path):
+                    m4_script_file_paths.add(file_path)
+
+        elif os.path.isfile(path):
+            m4_script_file_paths.add(path)
+
+        else:
+            for glob_path in glob.glob(path, recursive=True):
+                if os.path.isfile(glob_path):
+                    m4_script_file_paths.add(glob_path)
+
+    return sorted(m4_script_file_paths)
 
 
 def Main():
@@ -323,6 +845,16 @@ def Main():
     argument_parser = argparse.ArgumentParser(
         description="Formats autotools m4 scripts."
     )
+    argument_parser.add_argument(
+        "--check",
+        dest="check_only",
+        action="store_true",
+        default=False,
+        help=(
+            "only check if the m4 script files are formatted, the exit code "
+            "is 1 if one or more m4 script files are not formatted."
+        ),
+    )
     argument_parser.add_argument(
         "-f",
         "--format",
@@ -342,39 +874,93 @@ def Main():
         default=False,
         help="in place update the m4 script file.",
     )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help=(
+            "number of m4 script files to format in parallel, where the "
+            "default is the number of CPUs."
+        ),
+    )
+    argument_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help=(
+            "do not cache parser tables and abstract syntax trees. Caching "
+            "requires the yaldevtools package and is disabled without it."
+        ),
+    )
     argument_parser.add_argument("-o", "--output", help="Path to the output file.")
     argument_parser.add_argument(
-        "m4_script_file",
+        "m4_script_files",
         action="store",
         metavar="PATH",
-        default="script.m4",
-        help="path of the m4 script file.",
+        nargs="+",
+        help="path of a m4 script file, a directory or a glob pattern.",
     )
     options = argument_parser.parse_args()
 
-    if not options.m4_script_file:
-        print("M4 script file missing.")
+    m4_script_file_paths = GetM4ScriptFilePaths(options.m4_script_files)
+    if not m4_script_file_paths:
+        print("No m4 script files found.")
         print("")
         argument_parser.print_help()
         print("")
         return 1
 
-    if not os.path.exists(options.m4_script_file):
-        print(f"No such m4 script file: {options.m4_script_file:s}")
+    if len(m4_script_file_paths) > 1 and not (options.in_place or options.check_only):
+        print("Multiple m4 script files require --in-place or --check.")
         print("")
         return 1
 
-    try:
-        compiler = AutotoolsM4Parser()
-        abstract_syntax_tree = compiler.parse_file(options.m4_script_file)
+    cache_directory = None
+    if options.use_cache and cache:
+        cache_directory = cache.GetCacheDirectory()
 
-        if options.in_place or options.output_format == "m4":
-            output = AutotoolsM4Generator.generate(abstract_syntax_tree)
-        else:
-            output = json.dumps(abstract_syntax_tree, indent=4)
+    output_format = options.output_format
+    if options.in_place:
+        output_format = "m4"
+
+    arguments = [
+        (path, output_format, options.check_only) for path in m4_script_file_paths
+    ]
+
+    if len(arguments) > 1 and options.number_of_jobs != 1:
+        with multiprocessing.Pool(
+            processes=options.number_of_jobs,
+            initializer=_InitializeWorker,
+            initargs=(cache_directory,),
+        ) as pool:
+            results = pool.starmap(_FormatFileInWorker, arguments)
+    else:
+        _InitializeWorker(cache_directory)
+        results = [_FormatFileInWorker(*argument) for argument in arguments]
+
+    result = 0
+    for path, output, is_changed, error_message in results:
+        if error_message:
+            print(f"{path:s}: {error_message:s}")
+            result = 1
+            continue
+
+        if options.check_only:
+            if is_changed:
+                print(f"Not formatted: {path:s}")
+                result = 1
+            continue
 
         if options.in_place:
-            output_path = options.m4_script_file
+            if not is_changed:
+                continue
+
+            output_path = path
         else:
             output_path = options.output
 
@@ -384,11 +970,7 @@ def Main():
             with open(output_path, "w", encoding="utf-8") as file_object:
                 file_object.write(output)
 
-    except SyntaxError as exception:
-        print(f"{exception!s}")
-        return 1
-
-    return 0
+    return result
 
 
 if __name__ == "__main__":
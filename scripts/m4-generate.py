@@ -7,6 +7,7 @@ import logging
 import os
 import sys
 
+from yaldevtools import cache
 from yaldevtools import configuration
 
 
@@ -66,7 +67,9 @@ def Main():
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
     project_configuration = configuration.ProjectConfiguration()
-    project_configuration.ReadFromFile(options.configuration_file)
+    project_configuration.ReadFromFile(
+        options.configuration_file, cache_directory=cache.GetCacheDirectory()
+    )
 
     libyal_directory = os.path.abspath(__file__)
     libyal_directory = os.path.dirname(libyal_directory)
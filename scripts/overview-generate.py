@@ -4,13 +4,18 @@
 
 import abc
 import argparse
+import concurrent.futures
 import configparser
 import glob
 import json
 import logging
 import os
+import sqlite3
 import string
 import sys
+import threading
+
+from yaldevtools import cache
 
 
 class Project:
@@ -132,7 +137,7 @@ class ConfigureAcFile:
         """
         with open(self._path, encoding="utf8") as file_object:
             line_count = 0
-            for line in file_object.readlines():
+            for line in file_object:
                 line = line.strip()
                 if line_count == 2:
                     version = line[1:-2]
@@ -182,7 +187,7 @@ class DefinitionsHeaderFile:
         version_line = f"#define {library_name_upper:s}_VERSION"
 
         with open(self._path, encoding="utf8") as file_object:
-            for line in file_object.readlines():
+            for line in file_object:
                 line = line.strip()
                 if line.startswith(version_line):
                     _, _, version = line.rpartition(version_line)
@@ -223,7 +228,7 @@ class M4ScriptFile:
           bool: True if the version was read from the file.
         """
         with open(self._path, encoding="utf8") as file_object:
-            for line in file_object.readlines():
+            for line in file_object:
                 line = line.strip()
                 if line.startswith("dnl Version: "):
                     _, _, version = line.rpartition("dnl Version: ")
@@ -263,7 +268,7 @@ class ScriptFile:
           bool: True if the version was read from the file.
         """
         with open(self._path, encoding="utf8") as file_object:
-            for line in file_object.readlines():
+            for line in file_object:
                 line = line.strip()
                 if line.startswith("# Version: "):
                     _, _, version = line.rpartition("# Version: ")
@@ -276,6 +281,425 @@ class ScriptFile:
         return False
 
 
+class VersionsIndex:
+    """Persistent index of the versions read from files.
+
+    The versions are stored in a SQLite database together with the
+    modification time and size of the file, so that a file is only read
+    again when it has changed.
+    """
+
+    _CREATE_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS versions ("
+        "path TEXT, probe TEXT, modification_time INTEGER, size INTEGER, "
+        "version TEXT, PRIMARY KEY (path, probe))"
+    )
+
+    _INSERT_QUERY = "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?, ?)"
+
+    _SELECT_QUERY = (
+        "SELECT version FROM versions WHERE path = ? AND probe = ? AND "
+        "modification_time = ? AND size = ?"
+    )
+
+    def __init__(self):
+        """Initializes a versions index."""
+        super().__init__()
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def Close(self):
+        """Closes the versions index."""
+        with self._lock:
+            if self._connection:
+                try:
+                    self._connection.commit()
+                except sqlite3.Error as exception:
+                    logging.warning(
+                        f"Unable to write versions index with error: {exception!s}"
+                    )
+
+                self._connection.close()
+                self._connection = None
+
+    def GetVersion(self, path, probe, file_stat):
+        """Retrieves the version of a file from the index.
+
+        Args:
+          path (str): path of the file.
+          probe (str): name of the probe that reads the version.
+          file_stat (os.stat_result): stat information of the file.
+
+        Returns:
+          str: version or None if the file is not in the index or has changed.
+        """
+        with self._lock:
+            if not self._connection:
+                return None
+
+            try:
+                cursor = self._connection.execute(
+                    self._SELECT_QUERY,
+                    (path, probe, file_stat.st_mtime_ns, file_stat.st_size),
+                )
+                row = cursor.fetchone()
+
+            except sqlite3.Error:
+                return None
+
+        return row[0] if row else None
+
+    def Open(self, path):
+        """Opens the versions index.
+
+        Failure to open the versions index is ignored, since it only affects
+        the time needed to read the versions.
+
+        Args:
+          path (str): path of the versions index database file.
+
+        Returns:
+          bool: True if the versions index was opened.
+        """
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute(self._CREATE_TABLE_QUERY)
+
+        except (OSError, sqlite3.Error) as exception:
+            logging.warning(f"Unable to open versions index with error: {exception!s}")
+            return False
+
+        with self._lock:
+            self._connection = connection
+
+        return True
+
+    def SetVersion(self, path, probe, file_stat, version):
+        """Sets the version of a file in the index.
+
+        Args:
+          path (str): path of the file.
+          probe (str): name of the probe that read the version.
+          file_stat (os.stat_result): stat information of the file.
+          version (str): version.
+        """
+        with self._lock:
+            if not self._connection:
+                return
+
+            try:
+                self._connection.execute(
+                    self._INSERT_QUERY,
+                    (path, probe, file_stat.st_mtime_ns, file_stat.st_size, version),
+                )
+            except sqlite3.Error:
+                pass
+
+
+class ProjectVersions:
+    """Versions of the files of a project.
+
+    Attributes:
+      configure_ac_version (str): version in the configure.ac file of the
+          project, "missing" if the file has no version or None if the project
+          has no configure.ac file.
+      name (str): name of the project.
+      versions_per_category (dict[str, dict[str, str]]): versions per file
+          name per category of file, such as "m4_script".
+    """
+
+    def __init__(self, name):
+        """Initializes project versions.
+
+        Args:
+          name (str): name of the project.
+        """
+        super().__init__()
+        self.configure_ac_version = None
+        self.name = name
+        self.versions_per_category = {
+            file_category: {} for file_category in ProjectsScanner.FILE_CATEGORIES
+        }
+
+
+class ProjectsScanResults:
+    """Results of scanning the projects.
+
+    Attributes:
+      reference_versions (dict[str, dict[str, str]]): versions per file name
+          per category of file, of the files in the data directory.
+      versions_per_project (dict[str, ProjectVersions]): versions per project
+          name.
+    """
+
+    def __init__(self):
+        """Initializes projects scan results."""
+        super().__init__()
+        self.reference_versions = {}
+        self.versions_per_project = {}
+
+
+class ProjectsScanner:
+    """Scans the project directories for the versions of their files.
+
+    Every project directory is scanned once, for all categories of files,
+    and the project directories are scanned concurrently.
+    """
+
+    FILE_CATEGORIES = (
+        "configuration",
+        "library",
+        "m4_script",
+        "py_script",
+        "script",
+        "test_script",
+    )
+
+    # TODO: handle yal and pyyal place holders.
+    _IGNORED_TEST_SCRIPTS = frozenset(["test_pyyal_set_ascii_codepage.sh"])
+
+    def __init__(
+        self,
+        data_directory,
+        projects_path,
+        maximum_number_of_threads=None,
+        versions_index=None,
+    ):
+        """Initializes a projects scanner.
+
+        Args:
+          data_directory (str): path of the data directory.
+          projects_path (str): path of the directory that contains the project
+              directories.
+          maximum_number_of_threads (Optional[int]): maximum number of threads
+              to scan the project directories, where None represents the
+              default of concurrent.futures.ThreadPoolExecutor.
+          versions_index (Optional[VersionsIndex]): index of the versions read
+              from files, where None represents no index.
+        """
+        super().__init__()
+        self._data_directory = data_directory
+        self._maximum_number_of_threads = maximum_number_of_threads
+        self._projects_path = projects_path
+        self._versions_index = versions_index
+
+    def _ListDirectory(self, path):
+        """Lists the names of the entries in a directory.
+
+        Args:
+          path (str): path of the directory.
+
+        Returns:
+          set[str]: names of the entries in the directory, which is empty if
+              the directory does not exist.
+        """
+        try:
+            return set(os.listdir(path))
+        except OSError:
+            return set()
+
+    def _ReadVersion(self, file_class, path):
+        """Reads the version of a file.
+
+        Args:
+          file_class (type): class of the file, such as M4ScriptFile.
+          path (str): path of the file.
+
+        Returns:
+          str: version or "missing" if the file has no version.
+        """
+        file_stat = None
+        if self._versions_index:
+            file_stat = os.stat(path)
+            version = self._versions_index.GetVersion(
+                path, file_class.__name__, file_stat
+            )
+            if version:
+                return version
+
+        version_file = file_class(path)
+
+        logging.info(f"Reading: {path:s}")
+        if version_file.ReadVersion() and version_file.version:
+            version = version_file.version
+        else:
+            version = "missing"
+
+        if self._versions_index:
+            self._versions_index.SetVersion(
+                path, file_class.__name__, file_stat, version
+            )
+
+        return version
+
+    def _ScanDataDirectory(self):
+        """Scans the data directory for the versions of the reference files.
+
+        Returns:
+          dict[str, dict[str, str]]: versions per file name per category of
+              file.
+        """
+        reference_versions = {
+            file_category: {} for file_category in self.FILE_CATEGORIES
+        }
+
+        # TODO: define list of auto-generated configs to gather versions of.
+        configs_directory = os.path.join(self._data_directory, "configs")
+        if os.path.isdir(configs_directory):
+            for directory_entry in os.listdir(configs_directory):
+                path = os.path.join(configs_directory, directory_entry)
+                reference_versions["configuration"][directory_entry] = (
+                    self._ReadVersion(ScriptFile, path)
+                )
+
+        m4_script_glob = os.path.join(self._data_directory, "m4", "*.m4")
+        for path in glob.glob(m4_script_glob):
+            if not os.path.isfile(path):
+                continue
+
+            name = os.path.basename(path)
+            reference_versions["m4_script"][name] = self._ReadVersion(
+                M4ScriptFile, path
+            )
+
+        script_glob = os.path.join(self._data_directory, "scripts", "*.*")
+        for path in glob.glob(script_glob):
+            if not os.path.isfile(path):
+                continue
+
+            name = os.path.basename(path)
+            version = self._ReadVersion(ScriptFile, path)
+
+            reference_versions["script"][name] = version
+            if name.endswith(".py"):
+                reference_versions["py_script"][name] = version
+
+        # TODO: determine if Python glob supports "*.{ps1,sh}".
+        for extension in ("ps1", "sh"):
+            script_glob = os.path.join(
+                self._data_directory, "source", "tests", f"*.{extension:s}"
+            )
+            for path in glob.glob(script_glob):
+                # Skip directories with template files, such as test_tools.ps1.
+                if not os.path.isfile(path):
+                    continue
+
+                name = os.path.basename(path)
+                version = self._ReadVersion(ScriptFile, path)
+
+                if name not in self._IGNORED_TEST_SCRIPTS:
+                    reference_versions["test_script"][name] = version
+
+        return reference_versions
+
+    def _ScanProject(self, project_name, project_names, reference_versions):
+        """Scans a project directory for the versions of its files.
+
+        Args:
+          project_name (str): name of the project.
+          project_names (set[str]): names of all projects.
+          reference_versions (dict[str, dict[str, str]]): versions per file
+              name per category of file, of the files in the data directory.
+
+        Returns:
+          ProjectVersions: versions of the files of the project.
+        """
+        project_versions = ProjectVersions(project_name)
+        versions_per_category = project_versions.versions_per_category
+
+        project_path = os.path.join(self._projects_path, project_name)
+        project_entries = self._ListDirectory(project_path)
+
+        if "configure.ac" in project_entries:
+            path = os.path.join(project_path, "configure.ac")
+            project_versions.configure_ac_version = self._ReadVersion(
+                ConfigureAcFile, path
+            )
+
+        for file_category in ("configuration", "script"):
+            for name in reference_versions[file_category]:
+                if name in project_entries:
+                    path = os.path.join(project_path, name)
+                    versions_per_category[file_category][name] = self._ReadVersion(
+                        ScriptFile, path
+                    )
+
+        # The py scripts are a subset of the scripts.
+        for name, version in versions_per_category["script"].items():
+            if name in reference_versions["py_script"]:
+                versions_per_category["py_script"][name] = version
+
+        if "m4" in project_entries:
+            m4_scripts_path = os.path.join(project_path, "m4")
+            m4_scripts_entries = self._ListDirectory(m4_scripts_path)
+            for name in reference_versions["m4_script"]:
+                if name in m4_scripts_entries:
+                    path = os.path.join(m4_scripts_path, name)
+                    versions_per_category["m4_script"][name] = self._ReadVersion(
+                        M4ScriptFile, path
+                    )
+
+        if "tests" in project_entries:
+            test_scripts_path = os.path.join(project_path, "tests")
+            test_scripts_entries = self._ListDirectory(test_scripts_path)
+            for name in reference_versions["test_script"]:
+                if name in test_scripts_entries:
+                    path = os.path.join(test_scripts_path, name)
+                    versions_per_category["test_script"][name] = self._ReadVersion(
+                        ScriptFile, path
+                    )
+
+        # Local copies of other libraries are stored in a sub directory named
+        # after the library.
+        for library in sorted(project_entries.intersection(project_names)):
+            if library == project_name:
+                continue
+
+            path = os.path.join(project_path, library, f"{library:s}_definitions.h")
+            if os.path.exists(path):
+                versions_per_category["library"][library] = self._ReadVersion(
+                    DefinitionsHeaderFile, path
+                )
+
+        return project_versions
+
+    def ScanProjects(self, projects):
+        """Scans the project directories for the versions of their files.
+
+        Args:
+          projects (list[Project]): projects.
+
+        Returns:
+          ProjectsScanResults: results of scanning the projects.
+        """
+        scan_results = ProjectsScanResults()
+        scan_results.reference_versions = self._ScanDataDirectory()
+
+        project_names = set(project.name for project in projects)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._maximum_number_of_threads
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._ScanProject,
+                    project.name,
+                    project_names,
+                    scan_results.reference_versions,
+                )
+                for project in projects
+            ]
+            for future in futures:
+                project_versions = future.result()
+                scan_results.versions_per_project[project_versions.name] = (
+                    project_versions
+                )
+
+        return scan_results
+
+
 class WikiPageGenerator:
     """Generates wiki pages."""
 
@@ -482,6 +906,18 @@ class OverviewWikiPageGenerator(WikiPageGenerator):
 class StatusWikiPageGenerator(WikiPageGenerator):
     """Generates the "Status" wiki page."""
 
+    def __init__(self, data_directory, templates_path, versions_index_path=None):
+        """Initialize a wiki page generator.
+
+        Args:
+          data_directory (str): path of the data directory.
+          templates_path (str): path of the directory containing the template files.
+          versions_index_path (Optional[str]): path of the versions index
+              database file, where None represents no index.
+        """
+        super().__init__(data_directory, templates_path)
+        self._versions_index_path = versions_index_path
+
     def _FormatProjectNames(self, project_groups, project_names):
         """Formats the project names.
 
@@ -508,74 +944,64 @@ class StatusWikiPageGenerator(WikiPageGenerator):
 
         return "<br>".join(lines)
 
-    def _GetVersionsPerConfigurationFile(self, projects):
-        """Retrieves the versions per configuration file.
+    def _GetVersionsPerFile(self, projects, scan_results, file_category):
+        """Retrieves the versions per file of a specific category.
 
         Args:
-          projects list[Project]: projects.
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
+          file_category (str): category of the files, such as "m4_script".
 
         Returns:
-          dict[str, object]: configuration files, their versions and the the names
-              of the project that use the specific version. In the form:
-              { configuration_name: {
-                  configuration_version: [ project_name, ... ], ... },
+          dict[str, object]: files, their versions and the the names of the
+              project that use the specific version. In the form:
+              { file_name: {
+                  file_version: [ project_name, ... ], ... },
                   ... }
         """
-        versions_per_configuration = {}
-
-        # TODO: define list of auto-generated configs to gather versions of.
-        configs_directory = os.path.join(self._data_directory, "configs")
-        if not os.path.isdir(configs_directory):
-            return versions_per_configuration
-
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
-        for directory_entry in os.listdir(configs_directory):
-            path = os.path.join(configs_directory, directory_entry)
-            configuration_file = ScriptFile(path)
-
-            version = None
-            logging.info(f"Reading: {path:s}")
-            if configuration_file.ReadVersion():
-                version = configuration_file.version
-            if not version:
-                version = "missing"
-
-            versions_per_configuration[configuration_file.name] = {version: []}
+        versions_per_file = {
+            name: {version: []}
+            for name, version in scan_results.reference_versions[file_category].items()
+        }
 
         for project in projects:
-            project_configurations_path = os.path.join(projects_path, project.name)
+            project_versions = scan_results.versions_per_project[project.name]
+            versions = project_versions.versions_per_category[file_category]
 
-            for configuration in versions_per_configuration:
-                configuration_path = os.path.join(
-                    project_configurations_path, configuration
-                )
-                if not os.path.exists(configuration_path):
+            for name, projects_per_version in versions_per_file.items():
+                version = versions.get(name, None)
+                if version is None:
                     continue
 
-                configuration_file = ScriptFile(configuration_path)
-
-                version = None
-                logging.info(f"Reading: {configuration_path:s}")
-                if configuration_file.ReadVersion():
-                    version = configuration_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_configuration[configuration]
                 if version not in projects_per_version:
                     projects_per_version[version] = []
 
                 projects_per_version[version].append(project.name)
 
-        return versions_per_configuration
+        return versions_per_file
+
+    def _GetVersionsPerConfigurationFile(self, projects, scan_results):
+        """Retrieves the versions per configuration file.
+
+        Args:
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
+
+        Returns:
+          dict[str, object]: configuration files, their versions and the the names
+              of the project that use the specific version. In the form:
+              { configuration_name: {
+                  configuration_version: [ project_name, ... ], ... },
+                  ... }
+        """
+        return self._GetVersionsPerFile(projects, scan_results, "configuration")
 
-    def _GetVersionsPerLibrary(self, projects, category):
+    def _GetVersionsPerLibrary(self, projects, scan_results, category):
         """Retrieves the versions per library.
 
         Args:
           projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
           category (str): category.
 
         Returns:
@@ -585,54 +1011,28 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                   library_version: [ project_name, ... ], ... },
                   ... }
         """
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
         versions_per_library = {}
         for project in projects:
             if project.category != category:
                 continue
 
-            configure_ac_path = os.path.join(
-                projects_path, project.name, "configure.ac"
-            )
-            if not os.path.exists(configure_ac_path):
+            project_versions = scan_results.versions_per_project[project.name]
+            if project_versions.configure_ac_version is None:
                 continue
 
-            configure_ac_file = ConfigureAcFile(configure_ac_path)
-
-            version = None
-            logging.info(f"Reading: {configure_ac_path:s}")
-            if configure_ac_file.ReadVersion():
-                version = configure_ac_file.version
-            if not version:
-                version = "missing"
-
-            versions_per_library[project.name] = {version: []}
+            versions_per_library[project.name] = {
+                project_versions.configure_ac_version: []
+            }
 
         for project in projects:
-            project_path = os.path.join(projects_path, project.name)
-
-            for library in versions_per_library:
-                if project.name == library:
-                    continue
+            project_versions = scan_results.versions_per_project[project.name]
+            versions = project_versions.versions_per_category["library"]
 
-                definitions_header_path = os.path.join(
-                    project_path, library, f"{library:s}_definitions.h"
-                )
-                if not os.path.exists(definitions_header_path):
+            for library, projects_per_version in versions_per_library.items():
+                version = versions.get(library, None)
+                if version is None or project.name == library:
                     continue
 
-                definitions_header_file = DefinitionsHeaderFile(definitions_header_path)
-
-                version = None
-                logging.info(f"Reading: {definitions_header_path:s}")
-                if definitions_header_file.ReadVersion():
-                    version = definitions_header_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_library[library]
                 if version not in projects_per_version:
                     projects_per_version[version] = []
 
@@ -640,11 +1040,12 @@ class StatusWikiPageGenerator(WikiPageGenerator):
 
         return versions_per_library
 
-    def _GetVersionsPerM4Script(self, projects):
+    def _GetVersionsPerM4Script(self, projects, scan_results):
         """Retrieves the versions per m4 script.
 
         Args:
-          projects list[Project]: projects.
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
 
         Returns:
           dict[str, object]: m4 scripts, their versions and the the names of the
@@ -653,53 +1054,14 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                   m4_script_version: [ project_name, ... ], ... },
                   ... }
         """
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
-        m4_script_glob = os.path.join(self._data_directory, "m4", "*.m4")
-        versions_per_m4_script = {}
-        for path in glob.glob(m4_script_glob):
-            m4_script_file = M4ScriptFile(path)
+        return self._GetVersionsPerFile(projects, scan_results, "m4_script")
 
-            version = None
-            logging.info(f"Reading: {path:s}")
-            if m4_script_file.ReadVersion():
-                version = m4_script_file.version
-            if not version:
-                version = "missing"
-
-            versions_per_m4_script[m4_script_file.name] = {version: []}
-
-        for project in projects:
-            project_m4_scripts_path = os.path.join(projects_path, project.name, "m4")
-
-            for m4_script in versions_per_m4_script:
-                m4_script_path = os.path.join(project_m4_scripts_path, m4_script)
-                if not os.path.exists(m4_script_path):
-                    continue
-
-                m4_script_file = M4ScriptFile(m4_script_path)
-
-                version = None
-                logging.info(f"Reading: {m4_script_path:s}")
-                if m4_script_file.ReadVersion():
-                    version = m4_script_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_m4_script[m4_script]
-                if version not in projects_per_version:
-                    projects_per_version[version] = []
-
-                projects_per_version[version].append(project.name)
-
-        return versions_per_m4_script
-
-    def _GetVersionsPerPyScript(self, projects):
+    def _GetVersionsPerPyScript(self, projects, scan_results):
         """Retrieves the versions per py script.
 
         Args:
-          projects list[Project]: projects.
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
 
         Returns:
           dict[str, object]: py scripts, their versions and the the names of the
@@ -708,53 +1070,14 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                   py_script_version: [ project_name, ... ], ... },
                   ... }
         """
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
-        py_script_glob = os.path.join(self._data_directory, "scripts", "*.py")
-        versions_per_py_script = {}
-        for path in glob.glob(py_script_glob):
-            py_script_file = ScriptFile(path)
-
-            version = None
-            logging.info(f"Reading: {path:s}")
-            if py_script_file.ReadVersion():
-                version = py_script_file.version
-            if not version:
-                version = "missing"
+        return self._GetVersionsPerFile(projects, scan_results, "py_script")
 
-            versions_per_py_script[py_script_file.name] = {version: []}
-
-        for project in projects:
-            project_py_scripts_path = os.path.join(projects_path, project.name)
-
-            for py_script in versions_per_py_script:
-                py_script_path = os.path.join(project_py_scripts_path, py_script)
-                if not os.path.exists(py_script_path):
-                    continue
-
-                py_script_file = ScriptFile(py_script_path)
-
-                version = None
-                logging.info(f"Reading: {py_script_path:s}")
-                if py_script_file.ReadVersion():
-                    version = py_script_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_py_script[py_script]
-                if version not in projects_per_version:
-                    projects_per_version[version] = []
-
-                projects_per_version[version].append(project.name)
-
-        return versions_per_py_script
-
-    def _GetVersionsPerScript(self, projects):
+    def _GetVersionsPerScript(self, projects, scan_results):
         """Retrieves the versions per script.
 
         Args:
-          projects list[Project]: projects.
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
 
         Returns:
           dict[str, object]: scripts, their versions and the the names of the
@@ -763,53 +1086,14 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                   script_version: [ project_name, ... ], ... },
                   ... }
         """
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
-        script_glob = os.path.join(self._data_directory, "scripts", "*.*")
-        versions_per_script = {}
-        for path in glob.glob(script_glob):
-            script_file = ScriptFile(path)
-
-            version = None
-            logging.info(f"Reading: {path:s}")
-            if script_file.ReadVersion():
-                version = script_file.version
-            if not version:
-                version = "missing"
+        return self._GetVersionsPerFile(projects, scan_results, "script")
 
-            versions_per_script[script_file.name] = {version: []}
-
-        for project in projects:
-            project_scripts_path = os.path.join(projects_path, project.name)
-
-            for script in versions_per_script:
-                script_path = os.path.join(project_scripts_path, script)
-                if not os.path.exists(script_path):
-                    continue
-
-                script_file = ScriptFile(script_path)
-
-                version = None
-                logging.info(f"Reading: {script_path:s}")
-                if script_file.ReadVersion():
-                    version = script_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_script[script]
-                if version not in projects_per_version:
-                    projects_per_version[version] = []
-
-                projects_per_version[version].append(project.name)
-
-        return versions_per_script
-
-    def _GetVersionsPerTestScript(self, projects):
+    def _GetVersionsPerTestScript(self, projects, scan_results):
         """Retrieves the versions per test script.
 
         Args:
-          projects list[Project]: projects.
+          projects (list[Project]): projects.
+          scan_results (ProjectsScanResults): results of scanning the projects.
 
         Returns:
           dict[str, object]: scripts, their versions and the the names of the
@@ -818,59 +1102,7 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                   script_version: [ project_name, ... ], ... },
                   ... }
         """
-        projects_path = os.path.dirname(self._data_directory)
-        projects_path = os.path.dirname(projects_path)
-
-        # TODO: determine if Python glob supports "*.{ps1,sh}".
-        versions_per_script = {}
-        for extension in ("ps1", "sh"):
-            script_glob = os.path.join(
-                self._data_directory, "source", "tests", f"*.{extension:s}"
-            )
-            for path in glob.glob(script_glob):
-                script_file = ScriptFile(path)
-
-                version = None
-                logging.info(f"Reading: {path:s}")
-                if script_file.ReadVersion():
-                    version = script_file.version
-                if not version:
-                    version = "missing"
-
-                # TODO: handle yal and pyyal place holders.
-                if script_file.name == "test_pyyal_set_ascii_codepage.sh":
-                    continue
-
-                versions_per_script[script_file.name] = {version: []}
-
-        for project in projects:
-            project_test_scripts_path = os.path.join(
-                projects_path, project.name, "tests"
-            )
-
-            for script in versions_per_script:
-                # TODO: handle yal and pyyal place holders.
-
-                script_path = os.path.join(project_test_scripts_path, script)
-                if not os.path.exists(script_path):
-                    continue
-
-                script_file = ScriptFile(script_path)
-
-                version = None
-                logging.info(f"Reading: {script_path:s}")
-                if script_file.ReadVersion():
-                    version = script_file.version
-                if not version:
-                    version = "missing"
-
-                projects_per_version = versions_per_script[script]
-                if version not in projects_per_version:
-                    projects_per_version[version] = []
-
-                projects_per_version[version].append(project.name)
-
-        return versions_per_script
+        return self._GetVersionsPerFile(projects, scan_results, "test_script")
 
     def Generate(self, projects, output_writer):
         """Generates a wiki page.
@@ -881,10 +1113,32 @@ class StatusWikiPageGenerator(WikiPageGenerator):
         """
         self._GenerateSection("introduction.txt", {}, output_writer)
 
-        versions_per_configuration = self._GetVersionsPerConfigurationFile(projects)
-        versions_per_m4_script = self._GetVersionsPerM4Script(projects)
-        versions_per_script = self._GetVersionsPerScript(projects)
-        versions_per_test_script = self._GetVersionsPerTestScript(projects)
+        projects_path = os.path.dirname(self._data_directory)
+        projects_path = os.path.dirname(projects_path)
+
+        versions_index = None
+        if self._versions_index_path:
+            versions_index = VersionsIndex()
+            if not versions_index.Open(self._versions_index_path):
+                versions_index = None
+
+        projects_scanner = ProjectsScanner(
+            self._data_directory, projects_path, versions_index=versions_index
+        )
+        try:
+            scan_results = projects_scanner.ScanProjects(projects)
+        finally:
+            if versions_index:
+                versions_index.Close()
+
+        versions_per_configuration = self._GetVersionsPerConfigurationFile(
+            projects, scan_results
+        )
+        versions_per_m4_script = self._GetVersionsPerM4Script(projects, scan_results)
+        versions_per_script = self._GetVersionsPerScript(projects, scan_results)
+        versions_per_test_script = self._GetVersionsPerTestScript(
+            projects, scan_results
+        )
 
         projects_per_category = {}
         for project in projects:
@@ -923,7 +1177,9 @@ class StatusWikiPageGenerator(WikiPageGenerator):
                 f"* [{category_title:s}](Status#{catergory_reference:s})"
             )
             for project in projects_per_category[category]:
-                table_of_contents.append(f"  * [{project.name:s}](Status#{0:s})")
+                table_of_contents.append(
+                    f"  * [{project.name:s}](Status#{project.name:s})"
+                )
 
         table_of_contents.append("* [Test scripts](Status#test-scripts)")
         for script in sorted(versions_per_test_script):
@@ -1021,7 +1277,9 @@ class StatusWikiPageGenerator(WikiPageGenerator):
             }
             self._GenerateSection("category.txt", template_mappings, output_writer)
 
-            versions_per_library = self._GetVersionsPerLibrary(projects, category)
+            versions_per_library = self._GetVersionsPerLibrary(
+                projects, scan_results, category
+            )
             for library, projects_per_version in sorted(versions_per_library.items()):
                 template_mappings = {
                     "title": library,
@@ -1143,6 +1401,13 @@ def Main():
         default="projects.ini",
         help=("The overview generation configuration file."),
     )
+    argument_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help=("do not use the index of versions read from files by previous runs."),
+    )
     argument_parser.add_argument(
         "-o",
         "--output",
@@ -1188,14 +1453,26 @@ def Main():
         print("")
         return 1
 
+    versions_index_path = None
+    if options.use_cache:
+        versions_index_path = os.path.join(
+            cache.GetCacheDirectory(), "overview-versions.db"
+        )
+
     wiki_pages = [
-        ("Overview", OverviewWikiPageGenerator),
-        ("Status", StatusWikiPageGenerator),
+        ("Overview", OverviewWikiPageGenerator, {}),
+        (
+            "Status",
+            StatusWikiPageGenerator,
+            {"versions_index_path": versions_index_path},
+        ),
     ]
-    for page_name, page_generator_class in wiki_pages:
+    for page_name, page_generator_class, page_generator_kwargs in wiki_pages:
         data_directory = os.path.join(libyal_directory, "data")
         templates_path = os.path.join(data_directory, "wiki", page_name)
-        wiki_page = page_generator_class(data_directory, templates_path)
+        wiki_page = page_generator_class(
+            data_directory, templates_path, **page_generator_kwargs
+        )
 
         if options.output_directory:
             output_file = os.path.join(options.output_directory, f"{page_name:s}.md")
@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 # pylint: disable=invalid-name
-"""Script to format a source file."""
+"""Script to format source files."""
 
 import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
 import sys
 
+import yaldevtools
+
+from yaldevtools import cache
 from yaldevtools import source_formatter
 
 
@@ -47,6 +55,167 @@ class SourceFileParser:
                         group = []
 
 
+class FormattedFilesCache:
+    """Cache of the content hashes of formatted source files.
+
+    The cache is used to skip source files that were formatted by a previous
+    run and have not changed since.
+    """
+
+    def __init__(self, path):
+        """Initializes a formatted files cache.
+
+        Args:
+          path (str): path of the cache file.
+        """
+        super().__init__()
+        self._content_hashes = {}
+        self._path = path
+
+    def GetContentHash(self, path):
+        """Retrieves the content hash of a formatted source file.
+
+        Args:
+          path (str): path of the source file.
+
+        Returns:
+          str: content hash of the formatted source file or None if not available.
+        """
+        return self._content_hashes.get(path, None)
+
+    def Read(self):
+        """Reads the cache file.
+
+        A cache file that is missing, unreadable or created by a different
+        version of yaldevtools is ignored.
+        """
+        try:
+            with open(self._path, encoding="utf8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(json_dict, dict):
+            return
+
+        if json_dict.get("version", None) == yaldevtools.__version__:
+            self._content_hashes = json_dict.get("content_hashes", None) or {}
+
+    def SetContentHash(self, path, content_hash):
+        """Sets the content hash of a formatted source file.
+
+        Args:
+          path (str): path of the source file.
+          content_hash (str): content hash of the formatted source file.
+        """
+        self._content_hashes[path] = content_hash
+
+    def Write(self):
+        """Writes the cache file.
+
+        Entries of source files that no longer exist are not written.
+        """
+        content_hashes = {
+            path: content_hash
+            for path, content_hash in self._content_hashes.items()
+            if os.path.exists(path)
+        }
+        json_dict = {
+            "content_hashes": content_hashes,
+            "version": yaldevtools.__version__,
+        }
+
+        json_string = json.dumps(json_dict)
+        cache.WriteCacheFile(self._path, json_string.encode("utf8"))
+
+
+def FormatSourceFile(path, check_only=False):
+    """Formats a source file.
+
+    Args:
+      path (str): path of the source file.
+      check_only (Optional[bool]): True if the source file should only be
+          checked and not be changed.
+
+    Returns:
+      tuple[str, bool, str, str]: path of the source file, True if the source
+          file was not formatted, content hash of the formatted source file or
+          None if the source file was not formatted and error message or None
+          if the source file could be read and written.
+    """
+    try:
+        with open(path, encoding="utf8") as file_object:
+            file_content = file_object.read()
+
+    except (OSError, UnicodeDecodeError) as exception:
+        return path, False, None, f"{exception!s}"
+
+    lines = file_content.split("\n")
+
+    formatter = source_formatter.SourceFormatter()
+    formatted_lines = formatter.FormatSource(lines)
+    formatted_file_content = "\n".join(formatted_lines)
+
+    is_changed = formatted_file_content != file_content
+    if is_changed and check_only:
+        return path, is_changed, None, None
+
+    if is_changed:
+        try:
+            with open(path, "w", encoding="utf8") as file_object:
+                file_object.write(formatted_file_content)
+
+        except OSError as exception:
+            return path, is_changed, None, f"{exception!s}"
+
+    content_hash = GetContentHash(formatted_file_content.encode("utf8"))
+
+    return path, is_changed, content_hash, None
+
+
+def GetContentHash(data):
+    """Retrieves the content hash of data.
+
+    Args:
+      data (bytes): data.
+
+    Returns:
+      str: SHA-256 hexadecimal digest of the data.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def GetSourceFilePaths(paths):
+    """Retrieves the paths of source files.
+
+    Args:
+      paths (list[str]): paths of source files, directories that contain
+          source files or glob patterns.
+
+    Returns:
+      list[str]: absolute paths of the source files, sorted and without
+          duplicates.
+    """
+    source_file_paths = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for directory_path, _, filenames in os.walk(path):
+                for filename in filenames:
+                    if filename.endswith(".c") or filename.endswith(".h"):
+                        source_file_paths.add(os.path.join(directory_path, filename))
+
+        elif os.path.isfile(path):
+            source_file_paths.add(path)
+
+        else:
+            for glob_path in glob.glob(path, recursive=True):
+                if os.path.isfile(glob_path):
+                    source_file_paths.add(glob_path)
+
+    return sorted(os.path.abspath(path) for path in source_file_paths)
+
+
 def Main():
     """Entry point of console script.
 
@@ -57,16 +226,47 @@ def Main():
         description=("Formats source files of the libyal libraries.")
     )
     argument_parser.add_argument(
-        "source_file",
+        "--check",
+        dest="check_only",
+        action="store_true",
+        default=False,
+        help=(
+            "only check if the source files are formatted, the exit code is 1 "
+            "if one or more source files are not formatted."
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help=(
+            "number of source files to format in parallel, where the default "
+            "is the number of CPUs."
+        ),
+    )
+    argument_parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help="do not skip source files that were formatted by a previous run.",
+    )
+    argument_parser.add_argument(
+        "source_paths",
         action="store",
         metavar="PATH",
-        default="libyal.ini",
-        help="path of the source file.",
+        nargs="+",
+        help="path of a source file, a directory or a glob pattern.",
     )
     options = argument_parser.parse_args()
 
-    if not options.source_file:
-        print("Source file missing.")
+    source_file_paths = GetSourceFilePaths(options.source_paths)
+    if not source_file_paths:
+        print("No source files found.")
         print("")
         argument_parser.print_help()
         print("")
@@ -77,19 +277,63 @@ def Main():
     # parser = SourceFileParser()
     # parser.ReadFile(options.source_file)
 
-    with open(options.source_file, encoding="utf8") as file_object:
-        file_content = file_object.read()
+    formatted_files_cache = None
+    if options.use_cache:
+        cache_path = os.path.join(cache.GetCacheDirectory(), "source-format.json")
+        formatted_files_cache = FormattedFilesCache(cache_path)
+        formatted_files_cache.Read()
 
-    lines = file_content.split("\n")
+    paths_to_format = []
+    for path in source_file_paths:
+        if formatted_files_cache:
+            # A source file that cannot be read is reported by FormatSourceFile.
+            try:
+                with open(path, "rb") as file_object:
+                    content_hash = GetContentHash(file_object.read())
 
-    formatter = source_formatter.SourceFormatter()
-    formatted_lines = formatter.FormatSource(lines)
-    formatted_file_content = "\n".join(formatted_lines)
+            except OSError:
+                content_hash = None
+
+            if (
+                content_hash
+                and formatted_files_cache.GetContentHash(path) == content_hash
+            ):
+                continue
+
+        paths_to_format.append(path)
+
+    arguments = [(path, options.check_only) for path in paths_to_format]
+
+    if len(arguments) > 1 and options.number_of_jobs != 1:
+        with multiprocessing.Pool(processes=options.number_of_jobs) as pool:
+            results = pool.starmap(FormatSourceFile, arguments)
+    else:
+        results = [FormatSourceFile(*argument) for argument in arguments]
+
+    result = 0
+    unformatted_paths = []
+    for path, is_changed, content_hash, error in results:
+        if error:
+            print(f"Unable to format: {path:s} with error: {error:s}")
+            result = 1
+
+        if is_changed:
+            unformatted_paths.append(path)
+
+        if formatted_files_cache and content_hash:
+            formatted_files_cache.SetContentHash(path, content_hash)
+
+    if formatted_files_cache:
+        formatted_files_cache.Write()
+
+    if options.check_only:
+        for path in unformatted_paths:
+            print(f"Not formatted: {path:s}")
 
-    with open(options.source_file, "w", encoding="utf8") as file_object:
-        file_object.write(formatted_file_content)
+        if unformatted_paths:
+            return 1
 
-    return 0
+    return result
 
 
 if __name__ == "__main__":
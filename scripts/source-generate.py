@@ -7,6 +7,7 @@ import logging
 import os
 import sys
 
+from yaldevtools import cache
 from yaldevtools import configuration
 from yaldevtools import output_writers
 from yaldevtools.source_generators import common
@@ -38,6 +39,19 @@ def Main():
         default="all",
         help="names of the generators to run.",
     )
+    argument_parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=False,
+        help=(
+            "reuse test functions in existing test source files whose function "
+            "prototype, templates, template values and test data are unchanged "
+            "since they were last generated. The fingerprints of the test "
+            "functions are stored in the cache directory, hence the first "
+            "incremental run regenerates all test functions."
+        ),
+    )
     argument_parser.add_argument(
         "-o",
         "--output",
@@ -85,7 +99,9 @@ def Main():
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
     project_configuration = configuration.ProjectConfiguration()
-    project_configuration.ReadFromFile(options.configuration_file)
+    project_configuration.ReadFromFile(
+        options.configuration_file, cache_directory=cache.GetCacheDirectory()
+    )
 
     libyal_directory = os.path.abspath(__file__)
     libyal_directory = os.path.dirname(libyal_directory)
@@ -123,11 +139,20 @@ def Main():
             continue
 
         template_directory = os.path.join(sources_directory, source_category)
-        source_generator_object = source_generator_class(
-            projects_directory,
-            data_directory,
-            template_directory,
-        )
+        if source_category == "tests":
+            source_generator_object = source_generator_class(
+                projects_directory,
+                data_directory,
+                template_directory,
+                cache_directory=cache.GetCacheDirectory(),
+                incremental=options.incremental,
+            )
+        else:
+            source_generator_object = source_generator_class(
+                projects_directory,
+                data_directory,
+                template_directory,
+            )
         if options.output_directory:
             output_writer = output_writers.FileWriter(options.output_directory)
         else:
@@ -4,11 +4,16 @@
 
 import abc
 import argparse
+import configparser
+import io
+import logging
+import multiprocessing
 import os
 import re
 import string
 import sys
 
+from yaldevtools import cache
 from yaldevtools import configuration
 
 
@@ -82,6 +87,7 @@ class WikiPageGenerator:
           templates_path (str): path of the directory containing the template files.
         """
         super().__init__()
+        self._template_strings = {}
         self._templates_path = templates_path
 
     def _GenerateSection(self, template_filename, template_mappings, output_writer):
@@ -926,12 +932,20 @@ class WikiPageGenerator:
     def _ReadTemplateFile(self, filename):
         """Reads a template string from file.
 
+        The template string is read once and reused on subsequent calls, so
+        that the wiki pages of multiple projects can be generated without
+        re-reading the template files.
+
         Args:
           filename (str): path of the file containing the template string.
 
         Returns:
           TemplateString: template string.
         """
+        template_string = self._template_strings.get(filename, None)
+        if template_string:
+            return template_string
+
         path = os.path.join(self._templates_path, filename)
 
         # Read with binary mode to make sure end of line characters are not
@@ -941,7 +955,10 @@ class WikiPageGenerator:
 
         file_data = file_data.decode("utf8")
 
-        return TemplateString(file_data)
+        template_string = TemplateString(file_data)
+        self._template_strings[filename] = template_string
+
+        return template_string
 
     @abc.abstractmethod
     def Generate(self, project_configuration, output_writer):
@@ -1426,6 +1443,299 @@ class StdoutWriter:
         print(data, end="")
 
 
+class StringWriter:
+    """Class that defines a string output writer."""
+
+    def __init__(self):
+        """Initializes an output writer."""
+        super().__init__()
+        self._string_io = io.StringIO()
+
+    def Open(self):
+        """Opens the output writer object.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        return True
+
+    def Close(self):
+        """Closes the output writer object."""
+        return
+
+    def GetValue(self):
+        """Retrieves the data written to the output writer.
+
+        Returns:
+          str: data written.
+        """
+        return self._string_io.getvalue()
+
+    def Write(self, data):
+        """Writes the data to the string.
+
+        Args:
+          data (str): data to write.
+        """
+        self._string_io.write(data)
+
+
+class WikiPagesGenerator:
+    """Generates all the wiki pages of projects."""
+
+    # TODO: generate more wiki pages.
+    _WIKI_PAGES = [
+        ("Building", BuildingPageGenerator),
+        ("Development", DevelopmentPageGenerator),
+        ("Home", HomePageGenerator),
+        ("Mounting", MountingPageGenerator),
+        ("C-development", CDevelopmentPageGenerator),
+        ("Python-development", PythonDevelopmentPageGenerator),
+        ("Testing", TestingPageGenerator),
+        ("Troubleshooting", TroubleshootingPageGenerator),
+    ]
+
+    def __init__(self, templates_path):
+        """Initializes a wiki pages generator.
+
+        Args:
+          templates_path (str): path of the directory containing the template
+              directories of the wiki pages.
+        """
+        super().__init__()
+        self._page_generators = [
+            (page_name, page_generator_class(os.path.join(templates_path, page_name)))
+            for page_name, page_generator_class in self._WIKI_PAGES
+        ]
+
+    def GeneratePages(self, project_configuration):
+        """Generates the wiki pages of a project.
+
+        Args:
+          project_configuration (ProjectConfiguration): project configuration.
+
+        Yields:
+          tuple[str, str]: name and content of the wiki page.
+        """
+        for page_name, page_generator in self._page_generators:
+            if not page_generator.HasContent(project_configuration):
+                continue
+
+            output_writer = StringWriter()
+            page_generator.Generate(project_configuration, output_writer)
+
+            yield page_name, output_writer.GetValue()
+
+    def WritePages(self, project_configuration, output_directory):
+        """Writes the wiki pages of a project.
+
+        Wiki pages of which the content has not changed are not written, so
+        that the modification time of the file is preserved.
+
+        Args:
+          project_configuration (ProjectConfiguration): project configuration.
+          output_directory (str): path of the directory to write the wiki pages
+              to.
+
+        Returns:
+          list[str]: names of the wiki pages that were written.
+        """
+        written_page_names = []
+        for page_name, page_content in self.GeneratePages(project_configuration):
+            output_file = os.path.join(output_directory, f"{page_name:s}.md")
+
+            try:
+                with open(output_file, encoding="utf8", newline="") as file_object:
+                    if file_object.read() == page_content:
+                        continue
+
+            except (OSError, UnicodeDecodeError):
+                pass
+
+            output_writer = FileWriter(output_file)
+            output_writer.Open()
+            output_writer.Write(page_content)
+            output_writer.Close()
+
+            written_page_names.append(page_name)
+
+        return written_page_names
+
+
+def ReadProjectConfiguration(configuration_file):
+    """Reads a project configuration and the project description.
+
+    Args:
+      configuration_file (str): path of the project configuration file.
+
+    Returns:
+      ProjectConfiguration: project configuration.
+    """
+    project_configuration = configuration.ProjectConfiguration()
+    project_configuration.ReadFromFile(
+        configuration_file, cache_directory=cache.GetCacheDirectory()
+    )
+
+    readme_file = os.path.join(os.path.dirname(configuration_file), "README")
+
+    LINK_RE = re.compile(r"\* (.*): (http[s]://.*)")
+
+    last_line_was_header = False
+
+    project_description = []
+    if os.path.exists(readme_file):
+        with open(readme_file, encoding="utf8") as file_object:
+            for line in file_object.readlines():
+                if line.startswith("For more information see:"):
+                    project_description.pop()
+                    break
+
+                if last_line_was_header:
+                    last_line_was_header = False
+                    if line != "\n":
+                        # Add an empty line to make sure unnumbered list are formatted
+                        # correctly by most markdown parsers.
+                        project_description.append("\n")
+
+                line = LINK_RE.sub(r"* [\1](\2)", line)
+                project_description.append(line)
+
+                if line.endswith(":\n"):
+                    last_line_was_header = True
+
+    project_configuration.project_description = "".join(project_description)
+
+    return project_configuration
+
+
+def ReadProjectNames(projects_file):
+    """Reads the names of the projects from the projects file.
+
+    Args:
+      projects_file (str): path of the projects file, such as
+          data/projects.ini.
+
+    Returns:
+      list[str]: names of the projects.
+    """
+    config_parser = configparser.ConfigParser(interpolation=None)
+    config_parser.read([projects_file])
+
+    return config_parser.sections()
+
+
+# The wiki pages generator of a worker process.
+_worker_generator = None
+
+
+def _InitializeWorker(templates_path):
+    """Initializes a worker process.
+
+    Args:
+      templates_path (str): path of the directory containing the template
+          directories of the wiki pages.
+    """
+    global _worker_generator  # pylint: disable=global-statement
+    _worker_generator = WikiPagesGenerator(templates_path)
+
+
+def _WritePagesInWorker(project_name, configuration_file, output_directory):
+    """Writes the wiki pages of a project in a worker process.
+
+    Args:
+      project_name (str): name of the project.
+      configuration_file (str): path of the project configuration file.
+      output_directory (str): path of the directory to write the wiki pages to.
+
+    Returns:
+      tuple[str, list[str], str]: name of the project, names of the wiki pages
+          that were written and an error message or None if the wiki pages
+          were generated successfully.
+    """
+    try:
+        project_configuration = ReadProjectConfiguration(configuration_file)
+
+        os.makedirs(output_directory, exist_ok=True)
+
+        written_page_names = _worker_generator.WritePages(
+            project_configuration, output_directory
+        )
+
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        return project_name, [], f"{exception!s}"
+
+    return project_name, written_page_names, None
+
+
+def GenerateProjectsWikiPages(
+    templates_path,
+    projects_file,
+    projects_directory,
+    output_directory,
+    number_of_jobs=None,
+):
+    """Generates the wiki pages of all projects in a projects file.
+
+    The wiki pages of a project are written to a directory named
+    "<project_name>.wiki" in the output directory. Projects without a project
+    configuration file "<projects_directory>/<project_name>/<project_name>.ini"
+    are skipped.
+
+    Args:
+      templates_path (str): path of the directory containing the template
+          directories of the wiki pages.
+      projects_file (str): path of the projects file.
+      projects_directory (str): path of the directory containing the project
+          directories.
+      output_directory (str): path of the directory to write the wiki
+          directories to.
+      number_of_jobs (Optional[int]): number of projects to generate in
+          parallel, where None represents the number of CPUs.
+
+    Returns:
+      bool: True if the wiki pages of all projects were generated successfully.
+    """
+    arguments = []
+    for project_name in ReadProjectNames(projects_file):
+        configuration_file = os.path.join(
+            projects_directory, project_name, f"{project_name:s}.ini"
+        )
+        if not os.path.isfile(configuration_file):
+            logging.info(f"Skipping project: {project_name:s} without configuration")
+            continue
+
+        project_output_directory = os.path.join(
+            output_directory, f"{project_name:s}.wiki"
+        )
+        arguments.append((project_name, configuration_file, project_output_directory))
+
+    if len(arguments) > 1 and number_of_jobs != 1:
+        with multiprocessing.Pool(
+            processes=number_of_jobs,
+            initializer=_InitializeWorker,
+            initargs=(templates_path,),
+        ) as pool:
+            results = pool.starmap(_WritePagesInWorker, arguments)
+    else:
+        _InitializeWorker(templates_path)
+        results = [_WritePagesInWorker(*argument) for argument in arguments]
+
+    result = True
+    for project_name, written_page_names, error_message in results:
+        if error_message:
+            logging.error(
+                f"Unable to generate wiki pages of project: {project_name:s} with "
+                f"error: {error_message:s}"
+            )
+            result = False
+
+        elif written_page_names:
+            page_names = ", ".join(written_page_names)
+            logging.info(f"Updated wiki pages of: {project_name:s}: {page_names:s}")
+
+    return result
+
+
 def Main():
     """Entry point of console script.
 
@@ -1440,7 +1750,23 @@ def Main():
         action="store",
         metavar="CONFIGURATION_FILE",
         default="project-wiki.ini",
-        help="The wiki generation configuration file.",
+        help=(
+            "The wiki generation configuration file or in batch mode the "
+            "projects file, such as data/projects.ini."
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="number_of_jobs",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help=(
+            "number of projects to generate in parallel in batch mode, where "
+            "the default is the number of CPUs."
+        ),
     )
     argument_parser.add_argument(
         "-o",
@@ -1449,7 +1775,23 @@ def Main():
         action="store",
         metavar="OUTPUT_DIRECTORY",
         default=None,
-        help="path of the output files to write to.",
+        help=(
+            "path of the output files to write to. In batch mode the wiki pages "
+            "of a project are written to OUTPUT_DIRECTORY/<project>.wiki, where "
+            "the default output directory is the projects directory."
+        ),
+    )
+    argument_parser.add_argument(
+        "--projects-directory",
+        "--projects_directory",
+        dest="projects_directory",
+        action="store",
+        metavar="PROJECTS_DIRECTORY",
+        default=None,
+        help=(
+            "path of the directory containing the project directories, which "
+            "enables batch mode where the configuration file is a projects file."
+        ),
     )
     options = argument_parser.parse_args()
 
@@ -1470,74 +1812,42 @@ def Main():
         print("")
         return 1
 
-    project_configuration = configuration.ProjectConfiguration()
-    project_configuration.ReadFromFile(options.configuration_file)
-
-    readme_file = os.path.join(os.path.dirname(options.configuration_file), "README")
-
-    LINK_RE = re.compile(r"\* (.*): (http[s]://.*)")
-
-    last_line_was_header = False
-
-    project_description = []
-    if os.path.exists(readme_file):
-        with open(readme_file, encoding="utf8") as file_object:
-            for line in file_object.readlines():
-                if line.startswith("For more information see:"):
-                    project_description.pop()
-                    break
-
-                if last_line_was_header:
-                    last_line_was_header = False
-                    if line != "\n":
-                        # Add an empty line to make sure unnumbered list are formatted
-                        # correctly by most markdown parsers.
-                        project_description.append("\n")
-
-                line = LINK_RE.sub(r"* [\1](\2)", line)
-                project_description.append(line)
-
-                if line.endswith(":\n"):
-                    last_line_was_header = True
-
-    project_configuration.project_description = "".join(project_description)
-
     libyal_directory = os.path.abspath(__file__)
     libyal_directory = os.path.dirname(libyal_directory)
     libyal_directory = os.path.dirname(libyal_directory)
 
-    # TODO: generate more wiki pages.
-    wiki_pages = [
-        ("Building", BuildingPageGenerator),
-        ("Development", DevelopmentPageGenerator),
-        ("Home", HomePageGenerator),
-        ("Mounting", MountingPageGenerator),
-        ("C-development", CDevelopmentPageGenerator),
-        ("Python-development", PythonDevelopmentPageGenerator),
-        ("Testing", TestingPageGenerator),
-        ("Troubleshooting", TroubleshootingPageGenerator),
-    ]
-    for page_name, page_generator_class in wiki_pages:
-        templates_path = os.path.join(libyal_directory, "data", "wiki", page_name)
-        wiki_page = page_generator_class(templates_path)
+    templates_path = os.path.join(libyal_directory, "data", "wiki")
 
-        if not wiki_page.HasContent(project_configuration):
-            continue
-
-        if options.output_directory:
-            output_file = os.path.join(options.output_directory, f"{page_name:s}.md")
-            output_writer = FileWriter(output_file)
-        else:
-            output_writer = StdoutWriter()
-
-        if not output_writer.Open():
-            print("Unable to open output writer.")
+    if options.projects_directory:
+        if not os.path.isdir(options.projects_directory):
+            print(f"No such projects directory: {options.projects_directory:s}")
             print("")
             return 1
 
-        wiki_page.Generate(project_configuration, output_writer)
+        logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+        result = GenerateProjectsWikiPages(
+            templates_path,
+            options.configuration_file,
+            options.projects_directory,
+            options.output_directory or options.projects_directory,
+            number_of_jobs=options.number_of_jobs,
+        )
+        return 0 if result else 1
+
+    project_configuration = ReadProjectConfiguration(options.configuration_file)
+
+    wiki_pages_generator = WikiPagesGenerator(templates_path)
 
-        output_writer.Close()
+    if options.output_directory:
+        wiki_pages_generator.WritePages(project_configuration, options.output_directory)
+
+    else:
+        output_writer = StdoutWriter()
+        for _, page_content in wiki_pages_generator.GeneratePages(
+            project_configuration
+        ):
+            output_writer.Write(page_content)
 
     # TODO: add support for Unicode templates.
 
@@ -0,0 +1,39 @@
+"""Tests for the cache files."""
+
+import os
+import tempfile
+import unittest
+
+from yaldevtools import cache
+
+from tests import test_lib
+
+
+class CacheTest(test_lib.BaseTestCase):
+    """Cache files tests."""
+
+    def testGetCacheDirectory(self):
+        """Tests the GetCacheDirectory function."""
+        cache_directory = cache.GetCacheDirectory()
+        self.assertEqual(os.path.basename(cache_directory), "yaldevtools")
+
+    def testWriteCacheFile(self):
+        """Tests the WriteCacheFile function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            cache_file_path = os.path.join(temporary_directory, "cache", "test.bin")
+
+            result = cache.WriteCacheFile(cache_file_path, b"data")
+            self.assertTrue(result)
+
+            with open(cache_file_path, "rb") as file_object:
+                self.assertEqual(file_object.read(), b"data")
+
+            self.assertEqual(os.listdir(os.path.dirname(cache_file_path)), ["test.bin"])
+
+            cache_file_path = os.path.join(cache_file_path, "test.bin")
+            result = cache.WriteCacheFile(cache_file_path, b"data")
+            self.assertFalse(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
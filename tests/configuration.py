@@ -0,0 +1,204 @@
+"""Tests for the project configuration."""
+
+import os
+import tempfile
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import errors
+
+from tests import test_lib
+
+
+class ProjectConfigurationTest(test_lib.BaseTestCase):
+    """Project configuration tests."""
+
+    # pylint: disable=protected-access
+
+    def testReadFromFile(self):
+        """Tests the ReadFromFile function."""
+        test_file_path = self._GetTestFilePath(["libyal.ini"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        project_configuration = configuration.ProjectConfiguration()
+        project_configuration.ReadFromFile(test_file_path)
+
+        self.assertEqual(project_configuration.library_name, "libyal")
+        self.assertEqual(project_configuration.library_name_suffix, "yal")
+        self.assertEqual(project_configuration.python_module_name, "pyyal")
+        self.assertEqual(project_configuration.python_module_year_of_creation, 2014)
+        self.assertEqual(project_configuration.mount_tool_path_prefix, "yal")
+        self.assertTrue(project_configuration.HasMountTool())
+        self.assertFalse(project_configuration.HasExportTool())
+
+    def testReadFromFileReadsSectionsOnDemand(self):
+        """Tests that ReadFromFile reads sections on demand."""
+        test_file_path = self._GetTestFilePath(["libyal.ini"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        project_configuration = configuration.ProjectConfiguration()
+        project_configuration.ReadFromFile(test_file_path)
+
+        self.assertNotIn("mount_tool_path_prefix", project_configuration.__dict__)
+        self.assertNotIn("mount_tool_source_type", project_configuration.__dict__)
+
+        self.assertEqual(project_configuration.mount_tool_path_prefix, "yal")
+        self.assertIn("mount_tool_source_type", project_configuration.__dict__)
+
+        project_configuration.dpkg_build_dependencies = ["bogus"]
+        self.assertEqual(project_configuration.rpm_build_dependencies, ["zlib-devel"])
+        self.assertEqual(project_configuration.dpkg_build_dependencies, ["bogus"])
+
+        project_configuration.ReadAllSections()
+        self.assertEqual(project_configuration.dpkg_build_dependencies, ["bogus"])
+
+        with self.assertRaises(AttributeError):
+            _ = project_configuration.bogus
+
+    def testReadFromFileWithCache(self):
+        """Tests the ReadFromFile function with a cache directory."""
+        test_file_path = self._GetTestFilePath(["libyal.ini"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            project_configuration = configuration.ProjectConfiguration()
+            project_configuration.ReadFromFile(
+                test_file_path, cache_directory=cache_directory
+            )
+
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+            cached_project_configuration = configuration.ProjectConfiguration()
+            cached_project_configuration.ReadFromFile(
+                test_file_path, cache_directory=cache_directory
+            )
+
+            self.assertEqual(
+                cached_project_configuration.library_name_suffix,
+                project_configuration.library_name_suffix,
+            )
+            self.assertEqual(
+                cached_project_configuration.tools_features,
+                project_configuration.tools_features,
+            )
+            self.assertEqual(
+                cached_project_configuration._configuration_file_path,
+                os.path.dirname(test_file_path),
+            )
+
+    def testReadFromFileWithCacheReadsSectionsOnDemand(self):
+        """Tests that ReadFromFile with a cache directory reads sections on demand."""
+        test_file_path = self._GetTestFilePath(["libyal.ini"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            project_configuration = configuration.ProjectConfiguration()
+            project_configuration.ReadFromFile(
+                test_file_path, cache_directory=cache_directory
+            )
+
+            cached_project_configuration = configuration.ProjectConfiguration()
+            cached_project_configuration.ReadFromFile(
+                test_file_path, cache_directory=cache_directory
+            )
+
+            # Attributes used by the tests source generator.
+            self.assertEqual(cached_project_configuration.library_name, "libyal")
+            self.assertTrue(cached_project_configuration.HasMountTool())
+            self.assertTrue(cached_project_configuration.HasPythonModule())
+            self.assertEqual(cached_project_configuration.python_module_name, "pyyal")
+            self.assertIsNotNone(cached_project_configuration.tests_profiles)
+            self.assertIsNotNone(cached_project_configuration.tools_names)
+
+            for read_method_name in (
+                "_ReadAppVeyorConfiguration",
+                "_ReadDPKGConfiguration",
+                "_ReadMinGWConfiguration",
+                "_ReadRPMConfiguration",
+                "_ReadVisualStudioConfiguration",
+            ):
+                self.assertIn(
+                    read_method_name, cached_project_configuration._unread_sections
+                )
+
+            self.assertEqual(
+                cached_project_configuration.dpkg_build_dependencies,
+                project_configuration.dpkg_build_dependencies,
+            )
+            self.assertNotIn(
+                "_ReadDPKGConfiguration",
+                cached_project_configuration._unread_sections,
+            )
+
+    def testReadFromFileWithChangedConfiguration(self):
+        """Tests the ReadFromFile function with a changed configuration file."""
+        test_file_path = self._GetTestFilePath(["libyal.ini"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with open(test_file_path, "r", encoding="utf8") as file_object:
+            file_data = file_object.read()
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            configuration_file = os.path.join(temporary_directory, "libyal.ini")
+            with open(configuration_file, "w", encoding="utf8") as file_object:
+                file_object.write(file_data)
+
+            cache_directory = os.path.join(temporary_directory, "cache")
+
+            project_configuration = configuration.ProjectConfiguration()
+            project_configuration.ReadFromFile(
+                configuration_file, cache_directory=cache_directory
+            )
+
+            cache_filenames = os.listdir(cache_directory)
+            self.assertEqual(len(cache_filenames), 1)
+
+            with open(configuration_file, "w", encoding="utf8") as file_object:
+                file_object.write(file_data.replace('name: "libyal"', 'name: "libfoo"'))
+
+            project_configuration = configuration.ProjectConfiguration()
+            project_configuration.ReadFromFile(
+                configuration_file, cache_directory=cache_directory
+            )
+            self.assertEqual(project_configuration.library_name, "libfoo")
+
+            changed_cache_filenames = os.listdir(cache_directory)
+            self.assertEqual(len(changed_cache_filenames), 1)
+            self.assertNotEqual(changed_cache_filenames, cache_filenames)
+
+            project_configuration = configuration.ProjectConfiguration()
+            project_configuration.ReadFromFile(
+                test_file_path, cache_directory=cache_directory
+            )
+            self.assertEqual(len(os.listdir(cache_directory)), 2)
+
+    def testReadFromFileWithInvalidConfiguration(self):
+        """Tests the ReadFromFile function with an invalid configuration."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "libyal.ini")
+            with open(test_file_path, "w", encoding="utf8") as file_object:
+                file_object.write(
+                    "\n".join(
+                        [
+                            "[project]",
+                            'name: "libyal"',
+                            'status: "alpha"',
+                            'year_of_creation: "bogus"',
+                            "",
+                        ]
+                    )
+                )
+
+            cache_directory = os.path.join(temporary_directory, "cache")
+
+            project_configuration = configuration.ProjectConfiguration()
+            with self.assertRaises(errors.ConfigurationError):
+                project_configuration.ReadFromFile(
+                    test_file_path, cache_directory=cache_directory
+                )
+
+            self.assertFalse(os.path.exists(cache_directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
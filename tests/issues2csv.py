@@ -0,0 +1,458 @@
+"""Tests for the script to convert github.com issues into CSV."""
+
+import hashlib
+import http.client
+import http.server
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from urllib import parse as urllib_parse
+
+from tests import test_lib
+
+_SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ImportIssues2CSV():
+    """Imports the issues2csv script as a module.
+
+    Returns:
+      module: issues2csv script module.
+    """
+    script_path = os.path.join(_SOURCE_DIRECTORY, "scripts", "issues2csv.py")
+    module_spec = importlib.util.spec_from_file_location(
+        "issues2csv_script", script_path
+    )
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[module_spec.name] = module
+    module_spec.loader.exec_module(module)
+    return module
+
+
+issues2csv = _ImportIssues2CSV()
+
+
+class GithubAPIRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler that serves issues like the Github API."""
+
+    # pylint: disable=invalid-name
+
+    def _SendJSON(self, json_object, headers):
+        """Sends a JSON response.
+
+        Args:
+          json_object (object): JSON object to send.
+          headers (dict[str, str]): additional response headers.
+        """
+        content = json.dumps(json_object).encode("utf8")
+        etag = hashlib.sha256(content).hexdigest()
+        etag = f'"{etag:s}"'
+
+        if self.headers.get("If-None-Match", None) == etag:
+            # Note that Github does not always send the Link header of a 304
+            # (Not Modified) response.
+            self.server.not_modified_paths.append(self.path)
+            self.send_response(304)
+            self._SendRateLimitHeaders()
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self._SendRateLimitHeaders()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", f"{len(content):d}")
+        self.send_header("ETag", etag)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _SendRateLimitHeaders(self):
+        """Sends the rate limit headers."""
+        reset_timestamp = int(time.time()) + 3600
+        self.send_header("X-RateLimit-Remaining", "4999")
+        self.send_header("X-RateLimit-Reset", f"{reset_timestamp:d}")
+
+    def do_GET(self):
+        """Handles a GET request."""
+        self.server.requested_paths.append(self.path)
+
+        url_parts = urllib_parse.urlsplit(self.path)
+        query = urllib_parse.parse_qs(url_parts.query)
+
+        path_segments = url_parts.path.split("/")
+        project_name = path_segments[3] if len(path_segments) == 5 else None
+
+        issues_json = self.server.issues_per_project.get(project_name, None)
+        if issues_json is None:
+            self.send_error(404)
+            return
+
+        since = query.get("since", [None])[0]
+        if since:
+            issues_json = [
+                issue_json
+                for issue_json in issues_json
+                if issue_json["updated_at"] >= since
+            ]
+        else:
+            issues_json = [
+                issue_json
+                for issue_json in issues_json
+                if issue_json["state"] == "open"
+            ]
+
+        page_size = self.server.page_size
+        number_of_pages = max(1, (len(issues_json) + page_size - 1) // page_size)
+        page_number = int(query.get("page", ["1"])[0], 10)
+
+        headers = {}
+        if number_of_pages > 1:
+            links = []
+            for relation, link_page_number in (
+                ("next", page_number + 1),
+                ("last", number_of_pages),
+            ):
+                if link_page_number > number_of_pages:
+                    continue
+
+                query["page"] = [f"{link_page_number:d}"]
+                link_query = urllib_parse.urlencode(query, doseq=True)
+                link_url = (
+                    f"http://{self.server.server_address[0]:s}:"
+                    f"{self.server.server_address[1]:d}{url_parts.path:s}?"
+                    f"{link_query:s}"
+                )
+                links.append(f'<{link_url:s}>; rel="{relation:s}"')
+
+            headers["Link"] = ", ".join(links)
+
+        page_offset = (page_number - 1) * page_size
+        self._SendJSON(issues_json[page_offset : page_offset + page_size], headers)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Suppresses logging of the requests."""
+        return
+
+
+class OutputWriter:
+    """Output writer that stores the data in memory."""
+
+    def __init__(self):
+        """Initializes an output writer."""
+        super().__init__()
+        self.data = []
+
+    def Write(self, data):
+        """Writes the data.
+
+        Args:
+          data (str): the data to write.
+        """
+        self.data.append(data)
+
+
+class IssuesTestCase(test_lib.BaseTestCase):
+    """Shared functionality for tests of issues."""
+
+    _UPDATED_AT = "2020-01-01T00:00:00Z"
+
+    def _CreateIssue(self, number, state="open", title=None, updated_at=None):
+        """Creates an issue formatted in JSON.
+
+        Args:
+          number (int): issue number.
+          state (Optional[str]): issue state.
+          title (Optional[str]): issue title.
+          updated_at (Optional[str]): ISO 8601 date and time the issue was
+              last updated.
+
+        Returns:
+          dict[str, object]: issue formatted in JSON.
+        """
+        return {
+            "assignee": None,
+            "created_at": self._UPDATED_AT,
+            "html_url": f"https://github.com/libyal/libfoo/issues/{number:d}",
+            "labels": [],
+            "milestone": None,
+            "number": number,
+            "state": state,
+            "title": title or f"Issue {number:d}",
+            "updated_at": updated_at or self._UPDATED_AT,
+        }
+
+
+class RateLimiterTest(test_lib.BaseTestCase):
+    """Tests for the rate limiter."""
+
+    # pylint: disable=protected-access
+
+    def testAcquireAndRelease(self):
+        """Tests the Acquire and Release functions."""
+        rate_limiter = issues2csv.RateLimiter()
+
+        rate_limiter.Acquire()
+        self.assertIsNone(rate_limiter._remaining)
+
+        headers = http.client.HTTPMessage()
+        headers["X-RateLimit-Remaining"] = "2"
+        headers["X-RateLimit-Reset"] = f"{int(time.time()) + 3600:d}"
+        rate_limiter.Update(headers)
+
+        rate_limiter.Acquire()
+        self.assertEqual(rate_limiter._remaining, 1)
+
+        rate_limiter.Release()
+        self.assertEqual(rate_limiter._remaining, 2)
+
+    def testAcquireAfterReset(self):
+        """Tests the Acquire function after the rate limit was reset."""
+        rate_limiter = issues2csv.RateLimiter()
+
+        headers = http.client.HTTPMessage()
+        headers["X-RateLimit-Remaining"] = "0"
+        headers["X-RateLimit-Reset"] = f"{int(time.time()) - 1:d}"
+        rate_limiter.Update(headers)
+
+        rate_limiter.Acquire()
+        self.assertIsNone(rate_limiter._remaining)
+
+    def testUpdate(self):
+        """Tests the Update function."""
+        rate_limiter = issues2csv.RateLimiter()
+        reset_timestamp = int(time.time()) + 3600
+
+        headers = http.client.HTTPMessage()
+        headers["X-RateLimit-Remaining"] = "10"
+        headers["X-RateLimit-Reset"] = f"{reset_timestamp:d}"
+        rate_limiter.Update(headers)
+        self.assertEqual(rate_limiter._remaining, 10)
+
+        # A response that arrives out of order does not increase the number of
+        # remaining requests within the same rate limit window.
+        headers.replace_header("X-RateLimit-Remaining", "12")
+        rate_limiter.Update(headers)
+        self.assertEqual(rate_limiter._remaining, 10)
+
+        headers.replace_header("X-RateLimit-Reset", f"{reset_timestamp + 3600:d}")
+        rate_limiter.Update(headers)
+        self.assertEqual(rate_limiter._remaining, 12)
+
+        rate_limiter.Update(http.client.HTTPMessage())
+        self.assertEqual(rate_limiter._remaining, 12)
+
+
+class IssuesStoreTest(IssuesTestCase):
+    """Tests for the issues store."""
+
+    def testMergeIssues(self):
+        """Tests the MergeIssues function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "issues.json")
+            issues_store = issues2csv.IssuesStore(path)
+
+            issues_json = [self._CreateIssue(number) for number in (1, 2, 10)]
+            issues_store.MergeIssues("libfoo", issues_json, self._UPDATED_AT, True)
+
+            issues_json = [
+                self._CreateIssue(2, state="closed"),
+                self._CreateIssue(3),
+            ]
+            issues_store.MergeIssues(
+                "libfoo", issues_json, "2020-01-02T00:00:00Z", False
+            )
+
+            issues_json = issues_store.GetIssues("libfoo")
+            self.assertEqual(
+                [issue_json["number"] for issue_json in issues_json], [10, 3, 1]
+            )
+            self.assertEqual(
+                issues_store.GetLastSynchronizationTime("libfoo"),
+                "2020-01-02T00:00:00Z",
+            )
+
+            issues_store.Write()
+
+            issues_store = issues2csv.IssuesStore(path)
+            issues_store.Read()
+
+            issues_json = issues_store.GetIssues("libfoo")
+            self.assertEqual(
+                [issue_json["number"] for issue_json in issues_json], [10, 3, 1]
+            )
+            self.assertEqual(issues_store.GetIssues("libbar"), [])
+            self.assertIsNone(issues_store.GetLastSynchronizationTime("libbar"))
+
+
+class ResponseCacheTest(test_lib.BaseTestCase):
+    """Tests for the response cache."""
+
+    def testGetAndSetResponse(self):
+        """Tests the GetResponse and SetResponse functions."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            response_cache = issues2csv.ResponseCache(temporary_directory)
+            url = "https://api.github.com/repos/libyal/libfoo/issues?state=open"
+
+            headers = http.client.HTTPMessage()
+            response_cache.SetResponse(url, b"[]", headers)
+            self.assertIsNone(response_cache.GetResponse(url))
+
+            headers["ETag"] = '"etag"'
+            headers["Link"] = '<https://api.github.com/?page=2>; rel="last"'
+            response_cache.SetResponse(url, b"[]", headers)
+
+            cached_response = response_cache.GetResponse(url)
+            self.assertIsNotNone(cached_response)
+            self.assertEqual(cached_response["content"], "[]")
+            self.assertEqual(cached_response["etag"], '"etag"')
+            self.assertIsNone(cached_response["last_modified"])
+            self.assertEqual(cached_response["link"], headers["Link"])
+
+            self.assertIsNone(response_cache.GetResponse(f"{url:s}&page=2"))
+
+
+class GithubIssueHelperTest(IssuesTestCase):
+    """Tests for the Github issue helper."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the test."""
+        self._server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), GithubAPIRequestHandler
+        )
+        self._server.issues_per_project = {}
+        self._server.not_modified_paths = []
+        self._server.page_size = 2
+        self._server.requested_paths = []
+
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self._server_thread.start()
+
+        host, port = self._server.server_address
+        self._api_url = f"http://{host:s}:{port:d}"
+
+    def tearDown(self):
+        """Cleans up the needed objects used throughout the test."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+
+    def testListIssuesOfProjects(self):
+        """Tests the _ListIssuesOfProjects function."""
+        self._server.issues_per_project["libfoo"] = [
+            self._CreateIssue(number) for number in range(5, 0, -1)
+        ]
+        self._server.issues_per_project["libbar"] = [self._CreateIssue(1)]
+
+        issue_helper = issues2csv.GithubIssueHelper("libyal", api_url=self._api_url)
+        with self.assertLogs(level="WARNING"):
+            issues_per_project = issue_helper._ListIssuesOfProjects(
+                ["libbar", "libfoo", "libmissing"]
+            )
+
+        # Projects that could not be downloaded are omitted.
+        self.assertEqual(sorted(issues_per_project.keys()), ["libbar", "libfoo"])
+
+        issue_numbers = [
+            issue_json["number"] for issue_json in issues_per_project["libfoo"]
+        ]
+        self.assertEqual(issue_numbers, [5, 4, 3, 2, 1])
+
+        issue_numbers = [
+            issue_json["number"] for issue_json in issues_per_project["libbar"]
+        ]
+        self.assertEqual(issue_numbers, [1])
+
+        requested_paths = [
+            path
+            for path in self._server.requested_paths
+            if path.startswith("/repos/libyal/libfoo/")
+        ]
+        self.assertEqual(
+            sorted(requested_paths),
+            [
+                "/repos/libyal/libfoo/issues?state=open",
+                "/repos/libyal/libfoo/issues?state=open&page=2",
+                "/repos/libyal/libfoo/issues?state=open&page=3",
+            ],
+        )
+
+    def testListIssuesOfProjectsWithNotModified(self):
+        """Tests the _ListIssuesOfProjects function with cached responses."""
+        self._server.issues_per_project["libfoo"] = [
+            self._CreateIssue(number) for number in range(5, 0, -1)
+        ]
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            issue_helper = issues2csv.GithubIssueHelper(
+                "libyal", api_url=self._api_url, cache_directory=temporary_directory
+            )
+            issues_per_project = issue_helper._ListIssuesOfProjects(["libfoo"])
+            self.assertEqual(self._server.not_modified_paths, [])
+
+            issue_helper = issues2csv.GithubIssueHelper(
+                "libyal", api_url=self._api_url, cache_directory=temporary_directory
+            )
+            cached_issues_per_project = issue_helper._ListIssuesOfProjects(["libfoo"])
+
+        # The 304 (Not Modified) responses lack the Link header, hence the
+        # subsequent pages are determined from the cached first page.
+        self.assertEqual(len(self._server.not_modified_paths), 3)
+        self.assertEqual(cached_issues_per_project, issues_per_project)
+
+    def testListIssuesIncremental(self):
+        """Tests the ListIssues function in incremental mode."""
+        issues_json = [self._CreateIssue(number) for number in range(5, 0, -1)]
+        self._server.issues_per_project["libfoo"] = issues_json
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            issue_helper = issues2csv.GithubIssueHelper(
+                "libyal", api_url=self._api_url, cache_directory=temporary_directory
+            )
+            output_writer = OutputWriter()
+            issue_helper.ListIssues(["libfoo"], output_writer, incremental=True)
+
+            self.assertEqual(len(output_writer.data), 7)
+
+            # Issues updated after the previous synchronization, including
+            # closed issues, are requested and merged into the stored issues.
+            updated_at = "2999-01-01T00:00:00Z"
+            issues_json[1] = self._CreateIssue(
+                4, title="Updated issue 4", updated_at=updated_at
+            )
+            issues_json[3] = self._CreateIssue(2, state="closed", updated_at=updated_at)
+            issues_json.insert(0, self._CreateIssue(6, updated_at=updated_at))
+
+            self._server.requested_paths = []
+
+            output_writer = OutputWriter()
+            issue_helper.ListIssues(["libfoo"], output_writer, incremental=True)
+
+        self.assertEqual(len(self._server.requested_paths), 2)
+        for path in self._server.requested_paths:
+            url_parts = urllib_parse.urlsplit(path)
+            query = urllib_parse.parse_qs(url_parts.query)
+            self.assertEqual(query["state"], ["all"])
+            self.assertIn("since", query)
+
+        csv_lines = output_writer.data[1:-1]
+        issue_numbers = [int(line.split("\t")[1], 10) for line in csv_lines]
+        self.assertEqual(issue_numbers, [6, 5, 4, 3, 1])
+
+        csv_values = csv_lines[2].split("\t")
+        self.assertEqual(csv_values[7], "Updated issue 4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,274 @@
+"""Tests for the autotools m4 script formatter script."""
+
+import glob
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    import ply
+except ImportError:
+    ply = None
+
+from tests import test_lib
+
+_SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_M4_SCRIPTS_PATH = os.path.join(_SOURCE_DIRECTORY, "data", "m4")
+
+
+def _ImportM4Formatter():
+    """Imports the m4-formatter script as a module.
+
+    Returns:
+      module: m4-formatter script module or None if PLY is not available.
+    """
+    if not ply:
+        return None
+
+    script_path = os.path.join(_SOURCE_DIRECTORY, "scripts", "m4-formatter.py")
+    module_spec = importlib.util.spec_from_file_location(
+        "m4_formatter_script", script_path
+    )
+    module = importlib.util.module_from_spec(module_spec)
+
+    # PLY looks up the module of the lexer and parser in sys.modules.
+    sys.modules[module_spec.name] = module
+    module_spec.loader.exec_module(module)
+    return module
+
+
+m4_formatter = _ImportM4Formatter()
+
+
+@unittest.skipIf(m4_formatter is None, "missing ply")
+class AutotoolsM4FormatterTest(test_lib.BaseTestCase):
+    """Autotools m4 script formatter tests."""
+
+    # pylint: disable=protected-access
+
+    @classmethod
+    def setUpClass(cls):
+        """Sets up the parser shared by the tests."""
+        cls._parser = m4_formatter.AutotoolsM4Parser()
+
+    def _GetM4ScriptFilePaths(self):
+        """Retrieves the paths of the m4 script files in the data directory.
+
+        Returns:
+          list[str]: paths of the m4 script files.
+        """
+        m4_script_file_paths = sorted(glob.glob(os.path.join(_M4_SCRIPTS_PATH, "*.m4")))
+        if not m4_script_file_paths:
+            raise unittest.SkipTest("missing m4 script files")
+
+        return m4_script_file_paths
+
+    def _ReadFile(self, path):
+        """Reads the content of a file.
+
+        Args:
+          path (str): path of the file.
+
+        Returns:
+          str: content of the file.
+        """
+        with open(path, encoding="utf-8") as file_object:
+            return file_object.read()
+
+    def _CreateNestedScript(self, depth):
+        """Creates a script with nested quoted blocks and macro calls.
+
+        Args:
+          depth (int): number of nested quoted blocks.
+
+        Returns:
+          AutotoolsM4Script: abstract syntax tree.
+        """
+        node = m4_formatter.AutotoolsM4TextLiteral("value")
+        for _ in range(depth):
+            macro_call = m4_formatter.AutotoolsM4MacroCall(
+                "AS_IF", [[m4_formatter.AutotoolsM4QuotedBlock([node])]]
+            )
+            node = m4_formatter.AutotoolsM4QuotedBlock([macro_call])
+
+        return m4_formatter.AutotoolsM4Script([node])
+
+    def testSlots(self):
+        """Tests that the nodes do not have an instance dictionary."""
+        nodes = [
+            m4_formatter.AutotoolsM4CommentBlock("dnl comment"),
+            m4_formatter.AutotoolsM4MacroCall("AC_DEFUN", []),
+            m4_formatter.AutotoolsM4QuotedBlock([]),
+            m4_formatter.AutotoolsM4Script([]),
+            m4_formatter.AutotoolsM4TextLiteral("text"),
+        ]
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"))
+
+            with self.assertRaises(AttributeError):
+                node.unsupported = True
+
+    def testGenerate(self):
+        """Tests that the m4 script files are generated unchanged."""
+        for path in self._GetM4ScriptFilePaths():
+            with self.subTest(path=os.path.basename(path)):
+                content = self._ReadFile(path)
+                abstract_syntax_tree = self._parser.parse(content)
+
+                output = m4_formatter.AutotoolsM4Generator.generate(
+                    abstract_syntax_tree
+                )
+                self.assertEqual(output, content)
+
+    def testGenerateNested(self):
+        """Tests the generate function with deeply nested nodes."""
+        abstract_syntax_tree = self._CreateNestedScript(5000)
+
+        output = m4_formatter.AutotoolsM4Generator.generate(abstract_syntax_tree)
+        self.assertEqual(output, "[AS_IF([" * 5000 + "value" + "])]" * 5000)
+
+    def testCopyToDictAndCreateFromDict(self):
+        """Tests the CopyToDict and CreateFromDict functions."""
+        for path in self._GetM4ScriptFilePaths():
+            with self.subTest(path=os.path.basename(path)):
+                content = self._ReadFile(path)
+                abstract_syntax_tree = self._parser.parse(content)
+
+                json_dict = abstract_syntax_tree.CopyToDict()
+                json_dict = json.loads(json.dumps(json_dict))
+                self.assertEqual(json_dict["type"], "Script")
+
+                copied_tree = m4_formatter.AutotoolsM4Node.CreateFromDict(json_dict)
+                self.assertIsInstance(copied_tree, m4_formatter.AutotoolsM4Script)
+                self.assertEqual(copied_tree.CopyToDict(), json_dict)
+
+                output = m4_formatter.AutotoolsM4Generator.generate(copied_tree)
+                self.assertEqual(output, content)
+
+    def testCopyToDictAndCreateFromDictNested(self):
+        """Tests the CopyToDict and CreateFromDict functions with nesting."""
+        abstract_syntax_tree = self._CreateNestedScript(5000)
+
+        json_dict = abstract_syntax_tree.CopyToDict()
+        copied_tree = m4_formatter.AutotoolsM4Node.CreateFromDict(json_dict)
+
+        output = m4_formatter.AutotoolsM4Generator.generate(copied_tree)
+        self.assertEqual(output, "[AS_IF([" * 5000 + "value" + "])]" * 5000)
+
+    def testCreateFromDictWithUnsupportedType(self):
+        """Tests the CreateFromDict function with an unsupported node type."""
+        with self.assertRaises(ValueError):
+            m4_formatter.AutotoolsM4Node.CreateFromDict({"type": "bogus"})
+
+    def testParserTablesCache(self):
+        """Tests that the parser tables are cached by grammar hash."""
+        path = os.path.join(_M4_SCRIPTS_PATH, "common.m4")
+        self._SkipIfPathNotExists(path)
+
+        content = self._ReadFile(path)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            parser = m4_formatter.AutotoolsM4Parser(cache_directory=temporary_directory)
+            cache_path = os.path.join(
+                temporary_directory,
+                f"m4-formatter-parsetab-{parser.grammar_hash:s}.pickle",
+            )
+            self.assertEqual(
+                os.listdir(temporary_directory), [os.path.basename(cache_path)]
+            )
+
+            cached_parser = m4_formatter.AutotoolsM4Parser(
+                cache_directory=temporary_directory
+            )
+            self.assertEqual(cached_parser.grammar_hash, parser.grammar_hash)
+
+            abstract_syntax_tree = cached_parser.parse(content)
+            self.assertEqual(
+                abstract_syntax_tree.CopyToDict(), parser.parse(content).CopyToDict()
+            )
+
+            # Unreadable parser tables are rebuilt.
+            with open(cache_path, "wb") as file_object:
+                file_object.write(b"bogus")
+
+            rebuilt_parser = m4_formatter.AutotoolsM4Parser(
+                cache_directory=temporary_directory
+            )
+            output = m4_formatter.AutotoolsM4Generator.generate(
+                rebuilt_parser.parse(content)
+            )
+            self.assertEqual(output, content)
+
+    def testFormatFileWithCache(self):
+        """Tests the FormatFile function with an abstract syntax tree cache."""
+        path = os.path.join(_M4_SCRIPTS_PATH, "common.m4")
+        self._SkipIfPathNotExists(path)
+
+        content = self._ReadFile(path)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            formatter = m4_formatter.AutotoolsM4ScriptFormatter(
+                cache_directory=temporary_directory
+            )
+            cache_path = formatter._GetCachePath(content)
+            self.assertEqual(
+                os.path.dirname(cache_path),
+                os.path.join(temporary_directory, "m4-formatter"),
+            )
+
+            output, is_changed, error_message = formatter.FormatFile(path)
+            self.assertIsNone(error_message)
+            self.assertFalse(is_changed)
+            self.assertEqual(output, content)
+            self.assertTrue(os.path.exists(cache_path))
+
+            # The cached abstract syntax tree is used instead of parsing.
+            formatter = m4_formatter.AutotoolsM4ScriptFormatter(
+                cache_directory=temporary_directory
+            )
+            formatter._parser.parse = None
+
+            output, is_changed, error_message = formatter.FormatFile(
+                path, output_format="json"
+            )
+            self.assertIsNone(error_message)
+            self.assertFalse(is_changed)
+
+            with open(cache_path, encoding="utf-8") as file_object:
+                json_dict = json.load(file_object)
+
+            self.assertEqual(json.loads(output), json_dict)
+
+    def testFormatFileWithInvalidCache(self):
+        """Tests the FormatFile function with an invalid cached tree."""
+        path = os.path.join(_M4_SCRIPTS_PATH, "common.m4")
+        self._SkipIfPathNotExists(path)
+
+        content = self._ReadFile(path)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            formatter = m4_formatter.AutotoolsM4ScriptFormatter(
+                cache_directory=temporary_directory
+            )
+            cache_path = formatter._GetCachePath(content)
+            os.makedirs(os.path.dirname(cache_path))
+
+            with open(cache_path, "w", encoding="utf-8") as file_object:
+                json.dump({"type": "bogus"}, file_object)
+
+            self.assertIsNone(formatter._ReadCachedAbstractSyntaxTree(cache_path))
+
+            output, is_changed, error_message = formatter.FormatFile(path)
+            self.assertIsNone(error_message)
+            self.assertFalse(is_changed)
+            self.assertEqual(output, content)
+
+            self.assertIsNotNone(formatter._ReadCachedAbstractSyntaxTree(cache_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for the source code classes."""
+
+import unittest
+
+from yaldevtools import definitions
+from yaldevtools import source_code
+
+from tests import test_lib
+
+
+class PythonTypeObjectFunctionPrototypeTest(test_lib.BaseTestCase):
+    """Python type object function prototype tests."""
+
+    def testName(self):
+        """Tests the name property."""
+        python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+            "pyfsext", "file_entry", "get_utf8_name"
+        )
+        self.assertEqual(python_function_prototype.name, "pyfsext_file_entry_get_name")
+
+    def testValueName(self):
+        """Tests the value_name property."""
+        python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+            "pyfsext", "file_entry", "get_utf8_name"
+        )
+        self.assertIsNone(python_function_prototype.value_name)
+
+        python_function_prototype.function_type = definitions.FUNCTION_TYPE_GET
+        self.assertEqual(python_function_prototype.value_name, "name")
+
+    def testGetDataTypeDescription(self):
+        """Tests the GetDataTypeDescription function."""
+        python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+            "pyfsext", "file_entry", "get_size"
+        )
+        python_function_prototype.data_type = definitions.DATA_TYPE_UINT64
+
+        self.assertTrue(python_function_prototype.DataTypeIsInteger())
+        self.assertEqual(python_function_prototype.GetDataTypeDescription(), "Integer")
+
+        python_function_prototype.return_values = set(["None", "True"])
+        self.assertEqual(
+            python_function_prototype.GetDataTypeDescription(), "Integer or None"
+        )
+
+    def testGetDescription(self):
+        """Tests the GetDescription function."""
+        python_function_prototype = source_code.PythonTypeObjectFunctionPrototype(
+            "pyfsext", "file_entry", "get_utf8_name"
+        )
+        python_function_prototype.function_type = definitions.FUNCTION_TYPE_GET
+
+        description = python_function_prototype.GetDescription()
+        self.assertEqual(description, ["Retrieves the name."])
+
+        description.append("Modified.")
+        self.assertEqual(
+            python_function_prototype.GetDescription(), ["Retrieves the name."]
+        )
+
+        python_function_prototype.value_description = "file entry name"
+        self.assertEqual(
+            python_function_prototype.GetDescription(),
+            ["Retrieves the file entry name."],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the source file classes."""
+
+import io
+import unittest
+
+from yaldevtools import configuration
+from yaldevtools import source_file
+
+from tests import test_lib
+
+
+class TestSourceFileTest(test_lib.BaseTestCase):
+    """Test source file tests."""
+
+    # pylint: disable=protected-access
+
+    _TEST_SOURCE = "\n".join(
+        [
+            "#include <common.h>",
+            "",
+            "/* Tests the libyal_item_free function",
+            " * Returns 1 if successful or 0 if not",
+            " */",
+            "int yal_test_item_free(",
+            "     void )",
+            "{",
+            "\treturn( 1 );",
+            "}",
+            "",
+            "#if defined( __GNUC__ ) && !defined( LIBYAL_DLL_IMPORT )",
+            "",
+            "/* Tests the libyal_item_get_size function",
+            " * Returns 1 if successful or 0 if not",
+            " */",
+            "int yal_test_item_get_size(",
+            "     void )",
+            "{",
+            "\treturn( 1 );",
+            "}",
+            "",
+            "#endif /* defined( __GNUC__ ) && !defined( LIBYAL_DLL_IMPORT ) */",
+            "",
+        ]
+    )
+
+    def testReadFileObject(self):
+        """Tests the _ReadFileObject function."""
+        project_configuration = configuration.ProjectConfiguration()
+        project_configuration.library_name_suffix = "yal"
+
+        test_source_file = source_file.TestSourceFile("yal_test_item.c")
+
+        file_object = io.StringIO(self._TEST_SOURCE)
+        test_source_file._ReadFileObject(project_configuration, file_object)
+
+        self.assertEqual(
+            sorted(test_source_file.functions.keys()),
+            ["yal_test_item_free", "yal_test_item_get_size"],
+        )
+
+        expected_function_lines = [
+            "/* Tests the libyal_item_get_size function",
+            " * Returns 1 if successful or 0 if not",
+            " */",
+            "int yal_test_item_get_size(",
+            "     void )",
+            "{",
+            "\treturn( 1 );",
+            "}",
+            "",
+            "",
+        ]
+        self.assertEqual(
+            test_source_file.functions["yal_test_item_get_size"],
+            expected_function_lines,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,68 @@ from yaldevtools import source_formatter
 from tests import test_lib
 
 
+class VariableTest(test_lib.BaseTestCase):
+    """C variable tests."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        variable = source_formatter.Variable("\tconst char *name = NULL;")
+        self.assertTrue(variable.is_pointer)
+        self.assertEqual(variable.modifiers, "const")
+        self.assertEqual(variable.name, "name")
+        self.assertEqual(variable.type, "char")
+        self.assertEqual(variable.sort_key, (False, 21, "", "name"))
+
+    def testGetSortKey(self):
+        """Tests the GetSortKey function."""
+        lines = [
+            "\tint result = 0;",
+            "\tlibyal_item_t *item = NULL;",
+            "\tuint8_t *data = NULL;",
+            "\tsize_t data_size = 0;",
+            "\tlibyal_error_t *error = NULL;",
+        ]
+        lines.sort(key=source_formatter.Variable.GetSortKey)
+
+        expected_lines = [
+            "\tlibyal_error_t *error = NULL;",
+            "\tlibyal_item_t *item = NULL;",
+            "\tuint8_t *data = NULL;",
+            "\tsize_t data_size = 0;",
+            "\tint result = 0;",
+        ]
+        self.assertEqual(lines, expected_lines)
+
+        variable = source_formatter.Variable("\tint result = 0;")
+        other_variable = source_formatter.Variable("\tint result = 1;")
+        self.assertEqual(variable, other_variable)
+        self.assertEqual(variable.Compare(other_variable), 0)
+
+
 class SourceFormatterTest(test_lib.BaseTestCase):
     """Libyal C source formatter tests."""
 
-    # TODO: add tests for FormatLineIndentation
+    def testFormatLineIndentation(self):
+        """Tests the FormatLineIndentation function."""
+        test_formatter = source_formatter.SourceFormatter()
+
+        test_lines = [
+            ("\treturn( 1 );", 1, "\treturn( 1 );"),
+            ("        return( 1 );", 1, "\treturn( 1 );"),
+            ("    \treturn( 1 );", 1, "\treturn( 1 );"),
+            ("            return( 1 );", 2, "\t    return( 1 );"),
+            ("        \treturn( 1 );", 1, "\t        return( 1 );"),
+            ("\t\t\tx = 1;\t/* c */", 1, "\t                x = 1;        /* c */"),
+            ("   return( 1 );", 1, "   return( 1 );"),
+            ("   ", 2, "\t"),
+            ("int\tvalue;", 0, "int        value;"),
+            ("\t\treturn( 1 );", 3, "\t\treturn( 1 );"),
+        ]
+        for line, indentation_level, expected_line in test_lines:
+            formatted_line = test_formatter.FormatLineIndentation(
+                line, indentation_level
+            )
+            self.assertEqual(formatted_line, expected_line)
 
     def testFormatSource(self):
         """Tests the FormatSource function."""
@@ -57,6 +115,54 @@ int myfunction(
 
         self.assertEqual(lines, expected_lines)
 
+    def testFormatSourceWithFile(self):
+        """Tests the FormatSource function with a source file."""
+        # The test file is data/source/libyal/libyal_bit_stream.c with part
+        # of the indentation and alignment of the assignments changed.
+        test_file_path = self._GetTestFilePath(["bit_stream.c"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        expected_test_file_path = self._GetTestFilePath(["bit_stream_formatted.c"])
+        self._SkipIfPathNotExists(expected_test_file_path)
+
+        with open(test_file_path, encoding="utf8") as file_object:
+            lines = file_object.read().split("\n")
+
+        with open(expected_test_file_path, encoding="utf8") as file_object:
+            expected_lines = file_object.read().split("\n")
+
+        test_formatter = source_formatter.SourceFormatter()
+        lines = test_formatter.FormatSource(lines)
+
+        self.assertEqual(lines, expected_lines)
+
+    def testFormatSourceWithoutEmptyLineAfterDeclarations(self):
+        """Tests the FormatSource function without empty line after declarations."""
+        test_formatter = source_formatter.SourceFormatter()
+
+        expected_lines = [
+            "int myfunction(",
+            "     void )",
+            "{",
+            "\tint first  = 0;",
+            "\tint second = 0;",
+            "\treturn( first + second );",
+            "}",
+        ]
+
+        lines = [
+            "int myfunction(",
+            "     void )",
+            "{",
+            "\tint second = 0;",
+            "\tint first = 0;",
+            "\treturn( first + second );",
+            "}",
+        ]
+
+        lines = test_formatter.FormatSource(lines)
+        self.assertEqual(lines, expected_lines)
+
     def testVerticalAlignEqualSigns(self):
         """Tests the VerticalAlignEqualSigns function."""
         test_formatter = source_formatter.SourceFormatter()
@@ -1,13 +1,107 @@
 """Tests for the source file generator interface."""
 
 import os
+import shutil
+import tempfile
 import unittest
 
+from yaldevtools import configuration
 from yaldevtools.source_generators import interface
 
 from tests import test_lib
 
 
+class AttributesMappingTest(test_lib.BaseTestCase):
+    """Attributes mapping tests."""
+
+    def testGetItem(self):
+        """Tests the __getitem__ function."""
+        project_configuration = configuration.ProjectConfiguration()
+        project_configuration.library_name = "libyal"
+
+        attributes_mapping = interface.AttributesMapping(project_configuration)
+
+        self.assertEqual(attributes_mapping["library_name"], "libyal")
+
+        with self.assertRaises(KeyError):
+            _ = attributes_mapping["_configuration_file_path"]
+
+        with self.assertRaises(KeyError):
+            _ = attributes_mapping["HasDebugOutput"]
+
+        with self.assertRaises(KeyError):
+            _ = attributes_mapping["bogus"]
+
+        self.assertIn("library_name", attributes_mapping)
+        self.assertNotIn("_configuration_file_path", list(attributes_mapping))
+
+        project_configuration.library_name = "libbogus"
+        self.assertEqual(attributes_mapping["library_name"], "libbogus")
+
+
+class BaseSourceFileGeneratorTest(test_lib.BaseTestCase):
+    """Base source files generator tests."""
+
+    # pylint: disable=protected-access
+
+    def testReadOperationsFile(self):
+        """Tests the _ReadOperationsFile function."""
+        test_file_path = self._GetTestFilePath(["operations.yaml"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        generator = interface.BaseSourceFileGenerator(os.path.dirname(test_file_path))
+
+        operations = generator._ReadOperationsFile(test_file_path)
+        self.assertIn("mount_fuse.h", operations)
+        self.assertEqual(operations["mount_fuse.h"].type, "group")
+
+        cached_operations = generator._ReadOperationsFile(test_file_path)
+        self.assertIs(cached_operations, operations)
+
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            operations_path = os.path.join(temporary_directory, "operations.yaml")
+            shutil.copyfile(test_file_path, operations_path)
+
+            operations = generator._ReadOperationsFile(operations_path)
+
+            stat_object = os.stat(operations_path)
+            os.utime(
+                operations_path,
+                ns=(stat_object.st_atime_ns, stat_object.st_mtime_ns + 1000000000),
+            )
+
+            changed_operations = generator._ReadOperationsFile(operations_path)
+            self.assertIsNot(changed_operations, operations)
+
+    def testReadTemplateFile(self):
+        """Tests the _ReadTemplateFile function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            template_path = os.path.join(temporary_directory, "template.h")
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("#define _${name}_H\n")
+
+            generator = interface.BaseSourceFileGenerator(temporary_directory)
+
+            template = generator._ReadTemplateFile(template_path)
+            self.assertIsNotNone(template)
+
+            cached_template = generator._ReadTemplateFile(template_path)
+            self.assertIs(cached_template, template)
+
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("#define _${name}_HEADER\n")
+
+            stat_object = os.stat(template_path)
+            os.utime(
+                template_path,
+                ns=(stat_object.st_atime_ns, stat_object.st_mtime_ns + 1000000000),
+            )
+
+            changed_template = generator._ReadTemplateFile(template_path)
+            self.assertIsNot(changed_template, template)
+            self.assertEqual(changed_template.template, "#define _${name}_HEADER\n")
+
+
 class SourceFileGeneratorTest(test_lib.BaseTestCase):
     """Source files generator tests."""
 
@@ -38,7 +132,6 @@ class SourceFileGeneratorTest(test_lib.BaseTestCase):
     # TODO: add tests for _GetTypeLibraryHeaderFile function.
     # TODO: add tests for _GetTypesIncludeHeaderFile function.
     # TODO: add tests for _HasTests function.
-    # TODO: add tests for _ReadTemplateFile function.
     # TODO: add tests for _SetSequenceValueNameInTemplateMappings function.
     # TODO: add tests for _SetTypeFunctionInTemplateMappings function.
     # TODO: add tests for _SetTypeNameInTemplateMappings function.
@@ -0,0 +1,174 @@
+"""Tests for the source file generator for test source files."""
+
+import os
+import tempfile
+import unittest
+
+from yaldevtools import output_writers
+from yaldevtools import source_code
+from yaldevtools import source_file
+from yaldevtools.source_generators import tests
+
+from tests import test_lib
+
+
+class TestSourceFileGeneratorTest(test_lib.BaseTestCase):
+    """Test source files generator tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateGenerator(self, cache_directory=None, incremental=False):
+        """Creates a test source file generator.
+
+        Args:
+          cache_directory (Optional[str]): path of the cache directory.
+          incremental (Optional[bool]): True if existing test functions that
+              are not affected should be reused.
+
+        Returns:
+          TestSourceFileGenerator: test source file generator.
+        """
+        source_directory = os.path.abspath(__file__)
+        source_directory = os.path.dirname(source_directory)
+        source_directory = os.path.dirname(source_directory)
+        source_directory = os.path.dirname(source_directory)
+
+        projects_directory = os.path.dirname(source_directory)
+        data_directory = os.path.join(source_directory, "data")
+        template_directory = os.path.join(data_directory, "source", "tests")
+
+        return tests.TestSourceFileGenerator(
+            projects_directory,
+            data_directory,
+            template_directory,
+            cache_directory=cache_directory,
+            incremental=incremental,
+        )
+
+    def _CreateHeaderFile(self, path, argument_strings):
+        """Creates a library header file with a single function prototype.
+
+        Args:
+          path (str): path of the header file.
+          argument_strings (list[str]): argument strings of the function.
+
+        Returns:
+          LibraryHeaderFile: library header file.
+        """
+        function_prototype = source_code.FunctionPrototype(
+            "libfoo_bar_initialize", "int"
+        )
+        for argument_string in argument_strings:
+            function_prototype.AddArgumentString(argument_string)
+
+        header_file = source_file.LibraryHeaderFile(path)
+        header_file.functions_per_name[function_prototype.name] = function_prototype
+        return header_file
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        generator = self._CreateGenerator()
+        self.assertIsNotNone(generator)
+
+    def testGenerateUnaffectedExistingFunction(self):
+        """Tests the _GenerateUnaffectedExistingFunction function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            cache_directory = os.path.join(temporary_directory, "cache")
+            template_path = os.path.join(temporary_directory, "function.c")
+            test_source_path = os.path.join(temporary_directory, "foo_test_bar.c")
+            output_path = os.path.join(temporary_directory, "output.c")
+
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("int ${prefix}_test_${type_name}_initialize(\n")
+
+            argument_strings = ["libfoo_bar_t **bar", "libfoo_error_t **error"]
+            header_file = self._CreateHeaderFile("libfoo_bar.h", argument_strings)
+
+            test_source_file = source_file.TestSourceFile(test_source_path)
+            test_source_file.functions["foo_test_bar_initialize"] = [
+                "int foo_test_bar_initialize(",
+                "     void )",
+                "{",
+                "\treturn( 1 );",
+                "}",
+                "",
+            ]
+            template_mappings = {
+                "library_version": "20260101",
+                "prefix": "foo",
+                "type_name": "bar",
+            }
+            output_writer = output_writers.FileWriter(temporary_directory)
+
+            def _GenerateFunction(generator, header_file, template_mappings):
+                return generator._GenerateUnaffectedExistingFunction(
+                    "libfoo_bar_initialize",
+                    "foo_test_bar_initialize",
+                    [template_path],
+                    template_mappings,
+                    header_file,
+                    test_source_file,
+                    output_writer,
+                    output_path,
+                )
+
+            generator = self._CreateGenerator(cache_directory=cache_directory)
+            result = _GenerateFunction(generator, header_file, template_mappings)
+            self.assertFalse(result)
+
+            # Without previous fingerprints the test function is regenerated.
+            generator = self._CreateGenerator(
+                cache_directory=cache_directory, incremental=True
+            )
+            result = _GenerateFunction(generator, header_file, template_mappings)
+            self.assertFalse(result)
+
+            generator._WriteTestFunctionFingerprints(test_source_path)
+            generator._previous_fingerprints = generator._ReadTestFunctionFingerprints(
+                test_source_path
+            )
+
+            result = _GenerateFunction(generator, header_file, template_mappings)
+            self.assertTrue(result)
+
+            with open(output_path, "r", encoding="utf8") as file_object:
+                output_data = file_object.read()
+
+            self.assertEqual(
+                output_data,
+                "int foo_test_bar_initialize(\n     void )\n{\n\treturn( 1 );\n}\n",
+            )
+
+            # A template mapping that is not used by the template does not
+            # affect the test function.
+            changed_template_mappings = dict(template_mappings)
+            changed_template_mappings["library_version"] = "20260102"
+            result = _GenerateFunction(
+                generator, header_file, changed_template_mappings
+            )
+            self.assertTrue(result)
+
+            changed_template_mappings = dict(template_mappings)
+            changed_template_mappings["prefix"] = "bar"
+            result = _GenerateFunction(
+                generator, header_file, changed_template_mappings
+            )
+            self.assertFalse(result)
+
+            changed_header_file = self._CreateHeaderFile(
+                "libfoo_bar.h", argument_strings[1:]
+            )
+            result = _GenerateFunction(
+                generator, changed_header_file, template_mappings
+            )
+            self.assertFalse(result)
+
+            with open(template_path, "a", encoding="utf8") as file_object:
+                file_object.write("     void )\n")
+
+            result = _GenerateFunction(generator, header_file, template_mappings)
+            self.assertFalse(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 """Tests for the template string generator."""
 
+import os
+import tempfile
 import unittest
 
 from yaldevtools import template_string
+from yaldevtools.source_generators import interface
 
 from tests import test_lib
 
@@ -10,11 +13,116 @@ from tests import test_lib
 class TemplateStringGeneratorTest(test_lib.BaseTestCase):
     """Template string generator tests."""
 
+    # pylint: disable=protected-access
+
     def testInitialize(self):
         """Tests the __init__ function."""
         generator = template_string.TemplateStringGenerator()
         self.assertIsNotNone(generator)
 
+    def testGenerateWithTemplateClass(self):
+        """Tests the Generate function with a template class."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            template_path = os.path.join(temporary_directory, "template.h")
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("#define _${name:upper_case}_H\n")
+
+            generator = template_string.TemplateStringGenerator()
+            with self.assertRaises(RuntimeError):
+                generator.Generate(template_path, {"name": "koi8_r"})
+
+            generator = template_string.TemplateStringGenerator(
+                template_class=interface.TemplateString
+            )
+            output_data = generator.Generate(template_path, {"name": "koi8_r"})
+            self.assertEqual(output_data, "#define _KOI8_R_H\n")
+
+    def testDiscard(self):
+        """Tests the Discard function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            template_path = os.path.join(temporary_directory, "template.h")
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("${name}\n")
+
+            output_path = os.path.join(temporary_directory, "output.h")
+
+            generator = template_string.TemplateStringGenerator()
+            generator.GenerateSection(template_path, {"name": "first"}, output_path)
+            generator.Discard()
+            generator.Flush()
+
+            self.assertFalse(os.path.exists(output_path))
+
+    def testGenerateSection(self):
+        """Tests the GenerateSection and Flush functions."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            template_path = os.path.join(temporary_directory, "template.h")
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("${name}\n")
+
+            output_path = os.path.join(temporary_directory, "output.h")
+
+            generator = template_string.TemplateStringGenerator()
+            generator.GenerateSection(template_path, {"name": "first"}, output_path)
+            generator.GenerateSection(
+                template_path, {"name": "second"}, output_path, access_mode="a"
+            )
+            self.assertFalse(os.path.exists(output_path))
+
+            generator.Flush()
+
+            with open(output_path, "r", encoding="utf8") as file_object:
+                output_data = file_object.read()
+
+            self.assertEqual(output_data, "first\nsecond\n")
+
+            generator.GenerateSection(
+                template_path, {"name": "third"}, output_path, access_mode="a"
+            )
+            generator.Flush(output_path=output_path)
+
+            with open(output_path, "r", encoding="utf8") as file_object:
+                output_data = file_object.read()
+
+            self.assertEqual(output_data, "first\nsecond\nthird\n")
+
+            generator.GenerateSection(template_path, {"name": "first"}, output_path)
+            generator.GenerateSection(template_path, {"name": "fourth"}, output_path)
+            generator.Flush()
+
+            with open(output_path, "r", encoding="utf8") as file_object:
+                output_data = file_object.read()
+
+            self.assertEqual(output_data, "fourth\n")
+
+    def testReadTemplateFile(self):
+        """Tests the _ReadTemplateFile function."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            template_path = os.path.join(temporary_directory, "template.h")
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("#define _${name}_H\n")
+
+            generator = template_string.TemplateStringGenerator()
+
+            template = generator._ReadTemplateFile(template_path)
+            self.assertIsNotNone(template)
+
+            cached_template = generator._ReadTemplateFile(template_path)
+            self.assertIs(cached_template, template)
+
+            with open(template_path, "w", encoding="utf8") as file_object:
+                file_object.write("#define _${name}_HEADER\n")
+
+            stat_object = os.stat(template_path)
+            os.utime(
+                template_path,
+                ns=(stat_object.st_atime_ns, stat_object.st_mtime_ns + 1000000000),
+            )
+
+            changed_template = generator._ReadTemplateFile(template_path)
+            self.assertIsNot(changed_template, template)
+            self.assertEqual(changed_template.template, "#define _${name}_HEADER\n")
+
 
 if __name__ == "__main__":
     unittest.main()
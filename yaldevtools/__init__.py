@@ -0,0 +1,3 @@
+"""libyal development tools."""
+
+__version__ = "20260516"
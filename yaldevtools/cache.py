@@ -0,0 +1,50 @@
+"""The cache files."""
+
+import os
+import threading
+
+
+def GetCacheDirectory():
+    """Retrieves the path of the yaldevtools cache directory.
+
+    Returns:
+      str: path of the cache directory.
+    """
+    cache_directory = os.environ.get("XDG_CACHE_HOME", None)
+    if not cache_directory:
+        cache_directory = os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(cache_directory, "yaldevtools")
+
+
+def WriteCacheFile(path, data):
+    """Writes a cache file.
+
+    The data is written to a temporary file first, which then replaces the
+    cache file, so that concurrent readers never see a partially written cache
+    file. Failure to write the cache file is ignored, since it only affects
+    the time needed by the next run.
+
+    Args:
+      path (str): path of the cache file.
+      data (bytes): data of the cache file.
+
+    Returns:
+      bool: True if the cache file was written, False otherwise.
+    """
+    temporary_path = f"{path:s}.{os.getpid():d}.{threading.get_ident():d}"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(temporary_path, "wb") as file_object:
+            file_object.write(data)
+
+        os.replace(temporary_path, path)
+
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+        return False
+
+    return True
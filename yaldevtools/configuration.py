@@ -1,9 +1,15 @@
 """The project configuration."""
 
 import configparser
+import glob
+import hashlib
 import json
 import os
+import pickle
 
+import yaldevtools
+
+from yaldevtools import cache
 from yaldevtools import errors
 
 
@@ -70,6 +76,15 @@ class DTFabricConfiguration(BaseConfiguration):
 class ProjectConfiguration(BaseConfiguration):
     """Project configuration.
 
+    The resolved configuration can be stored in a cache file, keyed by
+    the contents of the configuration file, the yaldevtools version and the
+    source of this module, so that subsequent reads of an unchanged
+    configuration file do not need to parse it again.
+
+    Only the project and library sections are read by ReadFromFile, the other
+    sections are read when one of their attributes is first accessed, also
+    when the configuration was read from a cache file.
+
     Attributes:
       appveyor_allow_failures (list[str]): AppVeyor test targets that are allowed to fail.
       cygwin_build_dependencies (str): Cygwin build dependencies.
@@ -198,13 +213,147 @@ class ProjectConfiguration(BaseConfiguration):
       tools_tests_with_input (list[str]): tools test with input names.
     """
 
+    # Attributes that depend on the location of the configuration file or
+    # that are only used while reading it and therefore are not stored in
+    # the cache file. The configuration parser is recreated from the cached
+    # configuration values when a section that has not been read yet is read.
+    _CACHE_EXCLUDED_ATTRIBUTES = frozenset(
+        [
+            "_config_parser",
+            "_configuration_file_path",
+            "_has_dpkg",
+            "_has_rpm",
+            "_has_tests",
+        ]
+    )
+
+    # Attributes per method that reads a section, where the section is read
+    # when one of these attributes is first accessed.
+    _SECTION_ATTRIBUTES = {
+        "_ReadAppVeyorConfiguration": ("appveyor_allow_failures",),
+        "_ReadCygwinConfiguration": (
+            "cygwin_build_dependencies",
+            "cygwin_dll_dependencies",
+            "cygwin_dll_filename",
+        ),
+        "_ReadDevelopmentConfiguration": (
+            "development_glob",
+            "development_item_object",
+            "development_item_path",
+            "development_main_object",
+            "development_main_object_filename",
+            "development_main_object_python_post_open",
+            "development_main_object_python_post_open_file_object",
+            "development_main_object_python_pre_open",
+            "development_main_object_size",
+            "development_pytsk3",
+        ),
+        "_ReadDotNetBindingsConfiguration": ("dotnet_bindings_name",),
+        "_ReadDPKGConfiguration": ("dpkg_build_dependencies",),
+        "_ReadDTFabricConfiguration": ("dtfabric_configuration",),
+        "_ReadExportToolConfiguration": (
+            "export_tool_features",
+            "export_tool_source_description",
+            "export_tool_source_type",
+        ),
+        "_ReadFreeBSDConfiguration": ("freebsd_build_dependencies",),
+        "_ReadGCCConfiguration": (
+            "gcc_build_dependencies",
+            "gcc_static_build_dependencies",
+        ),
+        "_ReadInfoToolConfiguration": (
+            "info_tool_features",
+            "info_tool_source_description",
+            "info_tool_source_type",
+        ),
+        "_ReadJavaBindingsConfiguration": ("java_bindings_name",),
+        "_ReadMinGWConfiguration": (
+            "mingw_build_dependencies",
+            "mingw_dll_dependencies",
+            "mingw_dll_filename",
+        ),
+        "_ReadMinGWMSYS2Configuration": ("mingw_msys2_build_dependencies",),
+        "_ReadMountToolConfiguration": (
+            "mount_tool_additional_arguments",
+            "mount_tool_base_type",
+            "mount_tool_features",
+            "mount_tool_file_entry_access_time_type",
+            "mount_tool_file_entry_access_time_value",
+            "mount_tool_file_entry_creation_time_type",
+            "mount_tool_file_entry_creation_time_value",
+            "mount_tool_file_entry_example",
+            "mount_tool_file_entry_inode_change_time_type",
+            "mount_tool_file_entry_inode_change_time_value",
+            "mount_tool_file_entry_modification_time_type",
+            "mount_tool_file_entry_modification_time_value",
+            "mount_tool_file_entry_type",
+            "mount_tool_file_entry_type_size_value",
+            "mount_tool_file_system_type",
+            "mount_tool_mounted_description",
+            "mount_tool_path_prefix",
+            "mount_tool_source",
+            "mount_tool_source_description",
+            "mount_tool_source_description_long",
+            "mount_tool_source_type",
+        ),
+        "_ReadPythonModuleConfiguration": (
+            "python_module_authors",
+            "python_module_name",
+            "python_module_tests",
+            "python_module_tests_with_input",
+            "python_module_year_of_creation",
+        ),
+        "_ReadRPMConfiguration": ("rpm_build_dependencies",),
+        "_ReadTestDataConfiguration": (
+            "test_data_files",
+            "test_data_path",
+            "test_data_repository",
+        ),
+        "_ReadTestsConfiguration": (
+            "tests_authors",
+            "tests_example_filename1",
+            "tests_example_filename2",
+            "tests_export_tool_option_sets",
+            "tests_export_tool_output",
+            "tests_export_tool_profiles",
+            "tests_glob_per_profile",
+            "tests_info_tool_option_sets",
+            "tests_info_tool_options",
+            "tests_info_tool_profiles",
+            "tests_option_sets",
+            "tests_options_per_profile",
+            "tests_profiles",
+            "tests_verify_tool_option_sets",
+            "tests_verify_tool_profiles",
+        ),
+        "_ReadToolsConfiguration": (
+            "tools_authors",
+            "tools_build_dependencies",
+            "tools_description",
+            "tools_directory",
+            "tools_features",
+            "tools_names",
+            "tools_tests",
+            "tools_tests_with_input",
+        ),
+        "_ReadTroubleshootingConfiguration": ("troubleshooting_example",),
+        "_ReadVisualStudioConfiguration": (
+            "msvscpp_build_dependencies",
+            "msvscpp_dll_dependencies",
+        ),
+    }
+
     def __init__(self):
         """Initializes a project configuration."""
         super().__init__()
+        self._config_parser = None
+        self._config_values = None
         self._configuration_file_path = None
         self._has_dpkg = None
         self._has_rpm = None
         self._has_tests = None
+        self._unread_attributes = {}
+        self._unread_sections = {}
 
         # Project configuration.
         self.project_authors = None
@@ -364,6 +513,142 @@ class ProjectConfiguration(BaseConfiguration):
         # AppVeyor specific configuration.
         self.appveyor_allow_failures = None
 
+    def __getattr__(self, name):
+        """Retrieves an attribute of a section that has not been read yet.
+
+        Args:
+          name (str): name of the attribute.
+
+        Returns:
+          object: value of the attribute.
+
+        Raises:
+          AttributeError: if the attribute does not exist.
+          ConfigurationError: if the section that defines the attribute is
+              not valid.
+        """
+        # Use __dict__ to prevent recursion when the instance has not been
+        # initialized, such as during unpickling.
+        unread_attributes = self.__dict__.get("_unread_attributes", None)
+        read_method_name = (unread_attributes or {}).get(name, None)
+        if not read_method_name:
+            raise AttributeError(
+                f"'{type(self).__name__:s}' object has no attribute '{name:s}'"
+            )
+
+        self._ReadSection(read_method_name)
+        return self.__dict__[name]
+
+    def _GetCacheFilePath(self, filename, cache_directory):
+        """Retrieves the path of the cache file of a configuration file.
+
+        The name of the cache file consists of a hash of the path of the
+        configuration file and a hash of the yaldevtools version, the source
+        of this module and the contents of the configuration file.
+
+        Args:
+          filename (str): path of the configuration file.
+          cache_directory (str): path of the cache directory.
+
+        Returns:
+          str: path of the cache file or None if the configuration file cannot
+              be read.
+        """
+        try:
+            with open(filename, "rb") as file_object:
+                file_data = file_object.read()
+
+            # The source of this module is part of the key, so that changes to
+            # how the configuration is read invalidate the cache file, even
+            # when the yaldevtools version has not changed.
+            with open(__file__, "rb") as file_object:
+                module_data = file_object.read()
+
+        except OSError:
+            return None
+
+        path_hash = hashlib.sha256(os.path.abspath(filename).encode("utf8"))
+
+        hasher = hashlib.sha256()
+        hasher.update(yaldevtools.__version__.encode("ascii"))
+        hasher.update(module_data)
+        hasher.update(file_data)
+
+        return os.path.join(
+            cache_directory,
+            (
+                f"project_configuration-{path_hash.hexdigest():s}-"
+                f"{hasher.hexdigest():s}.pickle"
+            ),
+        )
+
+    def _RemoveStaleCacheFiles(self, path):
+        """Removes cache files of previous versions of the configuration file.
+
+        Failure to remove a cache file is ignored.
+
+        Args:
+          path (str): path of the current cache file.
+        """
+        cache_directory, cache_filename = os.path.split(path)
+        prefix, _, _ = cache_filename.rpartition("-")
+
+        for stale_path in glob.glob(
+            os.path.join(glob.escape(cache_directory), f"{prefix:s}-*.pickle")
+        ):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+    def _ReadFromCacheFile(self, path):
+        """Reads the configuration from a cache file.
+
+        Args:
+          path (str): path of the cache file.
+
+        Returns:
+          bool: True if the configuration was read from the cache file, False if
+              the cache file does not exist or cannot be read.
+        """
+        # Unpickling an incompatible or corrupted cache file can raise various
+        # exceptions, which are all handled as a cache miss.
+        try:
+            with open(path, "rb") as file_object:
+                attributes = pickle.load(file_object)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return False
+
+        if not isinstance(attributes, dict):
+            return False
+
+        self.__dict__.update(attributes)
+
+        # Attributes of sections that have not been read yet are retrieved by
+        # __getattr__, which requires they are not instance attributes.
+        for name in self._unread_attributes:
+            self.__dict__.pop(name, None)
+
+        return True
+
+    def _WriteToCacheFile(self, path):
+        """Writes the configuration to a cache file.
+
+        Args:
+          path (str): path of the cache file.
+        """
+        attributes = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in self._CACHE_EXCLUDED_ATTRIBUTES
+        }
+
+        if cache.WriteCacheFile(
+            path, pickle.dumps(attributes, protocol=pickle.HIGHEST_PROTOCOL)
+        ):
+            self._RemoveStaleCacheFiles(path)
+
     def _ReadAppVeyorConfiguration(self, config_parser):
         """Reads the AppVeyor configuration.
 
@@ -463,6 +748,14 @@ class ProjectConfiguration(BaseConfiguration):
         """
         self.dotnet_bindings_name = f"{self.library_name_suffix:s}.net"
 
+    def _ReadDTFabricConfiguration(self, config_parser):
+        """Reads the dtFabric configuration.
+
+        Args:
+          config_parser (ConfigParser): configuration file parser.
+        """
+        self.dtfabric_configuration.ReadConfiguration(config_parser)
+
     def _ReadExportToolConfiguration(self, config_parser):
         """Reads the export tool configuration.
 
@@ -911,6 +1204,44 @@ class ProjectConfiguration(BaseConfiguration):
             name.split(" ")[0] for name in self.rpm_build_dependencies
         ]
 
+    def _ReadSection(self, read_method_name):
+        """Reads a section that has not been read yet.
+
+        Values of attributes of the section that were explicitly set before
+        the section was read are preserved.
+
+        Args:
+          read_method_name (str): name of the method that reads the section.
+
+        Raises:
+          ConfigurationError: if the section is not valid.
+        """
+        default_values = self._unread_sections.pop(read_method_name, None)
+        if default_values is None:
+            return
+
+        set_values = {}
+        for name, value in default_values.items():
+            del self._unread_attributes[name]
+            if name in self.__dict__:
+                set_values[name] = self.__dict__[name]
+            else:
+                setattr(self, name, value)
+
+        if self._config_parser is None:
+            self._config_parser = configparser.ConfigParser(interpolation=None)
+            self._config_parser.read_dict(self._config_values)
+
+        read_method = getattr(self, read_method_name)
+        read_method(self._config_parser)
+
+        for name, value in set_values.items():
+            setattr(self, name, value)
+
+        if not self._unread_sections:
+            self._config_parser = None
+            self._config_values = None
+
     def _ReadTestDataConfiguration(self, config_parser):
         """Reads the test data configuration.
 
@@ -1361,44 +1692,57 @@ class ProjectConfiguration(BaseConfiguration):
         """
         return "verify_tool" in self.tools_features
 
-    def ReadFromFile(self, filename):
+    def ReadAllSections(self):
+        """Reads all sections that have not been read yet.
+
+        Raises:
+          ConfigurationError: if a section is not valid.
+        """
+        for read_method_name in list(self._unread_sections.keys()):
+            self._ReadSection(read_method_name)
+
+    def ReadFromFile(self, filename, cache_directory=None):
         """Reads the configuration from file.
 
         Args:
           filename (str): path of the configuration file.
+          cache_directory (Optional[str]): path of the directory that contains
+              the cache files, where None represents the configuration file
+              should not be cached.
+
+        Raises:
+          ConfigurationError: if the project or library section is not valid.
         """
+        self._configuration_file_path = os.path.dirname(filename)
+
+        cache_file_path = None
+        if cache_directory:
+            cache_file_path = self._GetCacheFilePath(filename, cache_directory)
+
+        if cache_file_path and self._ReadFromCacheFile(cache_file_path):
+            return
+
         config_parser = configparser.ConfigParser(interpolation=None)
         config_parser.read([filename])
 
-        self._configuration_file_path = os.path.dirname(filename)
+        self._config_parser = config_parser
+        self._config_values = {
+            section_name: dict(config_parser.items(section_name, raw=True))
+            for section_name in config_parser.sections()
+        }
 
         self._ReadProjectConfiguration(config_parser)
-
-        self.dtfabric_configuration.ReadConfiguration(config_parser)
-
         self._ReadLibraryConfiguration(config_parser)
-        self._ReadPythonModuleConfiguration(config_parser)
-        self._ReadDotNetBindingsConfiguration(config_parser)
-        self._ReadJavaBindingsConfiguration(config_parser)
-        self._ReadToolsConfiguration(config_parser)
-        self._ReadTestDataConfiguration(config_parser)
-        self._ReadTestsConfiguration(config_parser)
-
-        self._ReadDevelopmentConfiguration(config_parser)
-        self._ReadTroubleshootingConfiguration(config_parser)
-
-        self._ReadCygwinConfiguration(config_parser)
-        self._ReadFreeBSDConfiguration(config_parser)
-        self._ReadGCCConfiguration(config_parser)
-        self._ReadMinGWConfiguration(config_parser)
-        self._ReadMinGWMSYS2Configuration(config_parser)
-        self._ReadVisualStudioConfiguration(config_parser)
-
-        self._ReadDPKGConfiguration(config_parser)
-        self._ReadRPMConfiguration(config_parser)
-
-        self._ReadExportToolConfiguration(config_parser)
-        self._ReadInfoToolConfiguration(config_parser)
-        self._ReadMountToolConfiguration(config_parser)
-
-        self._ReadAppVeyorConfiguration(config_parser)
+
+        for read_method_name, attribute_names in self._SECTION_ATTRIBUTES.items():
+            self._unread_sections[read_method_name] = {
+                name: self.__dict__.pop(name) for name in attribute_names
+            }
+            for name in attribute_names:
+                self._unread_attributes[name] = read_method_name
+
+        if cache_file_path:
+            # The cache file contains the project and library sections and the
+            # configuration values of the sections that have not been read yet,
+            # which are read on demand after the cache file is read.
+            self._WriteToCacheFile(cache_file_path)
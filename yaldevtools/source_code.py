@@ -272,11 +272,10 @@ class PythonTypeObjectFunctionPrototype:
           type_function (str): type function.
         """
         super().__init__()
-        self._name = None
+        self._cached_values = {}
         self._python_module_name = python_module_name
         self._type_function = type_function
         self._type_name = type_name
-        self._value_name = None
         self.arguments = []
         self.data_type = definitions.DATA_TYPE_NONE
         self.function_type = None
@@ -285,162 +284,40 @@ class PythonTypeObjectFunctionPrototype:
         self.value_description = None
         self.value_type = None
 
+    def __setattr__(self, name, value):
+        """Sets an attribute and invalidates the cached derived values.
+
+        Args:
+          name (str): name of the attribute.
+          value (object): value of the attribute.
+        """
+        if not name.startswith("_"):
+            self._cached_values.clear()
+
+        super().__setattr__(name, value)
+
     @property
     def name(self):
         """str: name."""
-        if self._name is None:
-            self._name = "_".join(
+        return self._GetCachedValue(
+            "name",
+            lambda: "_".join(
                 [self._python_module_name, self._type_name, self.type_function]
-            )
-
-        return self._name
+            ),
+        )
 
     @property
     def type_function(self):
         """str: type function."""
-        # TODO: make overrides more generic.
-        if self._type_function == "set_parent_file":
-            return "set_parent"
-
-        if self._type_function.startswith(
-            "copy_"
-        ) and not self._type_function.startswith("copy_from_"):
-            type_name = self._type_function[5]
-            return f"get_{type_name:s}"
-
-        if self._type_function.startswith(
-            "get_utf8_"
-        ) or self._type_function.startswith("set_utf8_"):
-            return "".join([self._type_function[:4], self._type_function[9:]])
-
-        if self._type_function.startswith("get_data_as_"):
-            _, _, type_function_suffix = self._type_function.partition("_data_as_")
-
-            if type_function_suffix in (
-                "16bit_integer",
-                "32bit_integer",
-                "64bit_integer",
-            ):
-                return "get_data_as_integer"
-
-            if type_function_suffix in ("filetime", "floatingtime"):
-                return "get_data_as_datetime"
-
-            if type_function_suffix == "utf8_string":
-                return "get_data_as_string"
-
-            return self._type_function
-
-        if self._type_function.startswith("get_"):
-            type_function_prefix, _, type_function_suffix = (
-                self._type_function.partition("_by_")
-            )
-
-            if type_function_suffix in ("entry", "index"):
-                return type_function_prefix
-
-            if type_function_suffix in ("utf8_name", "utf8_path"):
-                return "".join([self._type_function[:-10], self._type_function[-5:]])
-
-            if self._type_function.endswith("_utf8_string"):
-                return "".join([self._type_function[:-12], self._type_function[-7:]])
-
-            if self._type_function.endswith("_utf8_string_size"):
-                return "".join([self._type_function[:-17], self._type_function[-12:]])
-
-        return self._type_function
+        return self._GetCachedValue("type_function", self._DetermineTypeFunction)
 
     @property
     def value_name(self):
         """str: value name."""
-        if self._value_name is None:
-            # TODO: make overrides more generic.
-            if self.function_type == definitions.FUNCTION_TYPE_COPY:
-                if self._type_function.startswith("copy_"):
-                    self._value_name = self._type_function[5:]
-
-            elif self.function_type == definitions.FUNCTION_TYPE_COPY_FROM:
-                if self._type_function.startswith("copy_from_"):
-                    self._value_name = self._type_function[10:]
-
-            elif self.function_type == definitions.FUNCTION_TYPE_COPY_TO:
-                if self._type_function.startswith("get_"):
-                    self._value_name = self._type_function[4:]
-
-            elif self.function_type in (
-                definitions.FUNCTION_TYPE_GET,
-                definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
-                definitions.FUNCTION_TYPE_GET_BY_INDEX,
-                definitions.FUNCTION_TYPE_GET_BY_NAME,
-                definitions.FUNCTION_TYPE_GET_BY_PATH,
-            ):
-                type_function_prefix, _, _ = self._type_function.partition("_by_")
-
-                if type_function_prefix.startswith("get_"):
-                    type_function_prefix = type_function_prefix[4:]
-
-                if type_function_prefix.startswith("utf8_"):
-                    type_function_prefix = type_function_prefix[5:]
-
-                self._value_name = type_function_prefix
-
-            elif self.function_type == definitions.FUNCTION_TYPE_IS:
-                if self._type_function.startswith("is_"):
-                    self._value_name = self._type_function[3:]
-
-            elif self.function_type == definitions.FUNCTION_TYPE_SET:
-                if self._type_function.startswith("set_utf8_"):
-                    self._value_name = self._type_function[9:]
-
-                elif self._type_function.startswith("set_"):
-                    self._value_name = self._type_function[4:]
-
-        return self._value_name
-
-    def DataTypeIsDatetime(self):
-        """Determines if the data type is a datetime type.
-
-        Returns:
-          bool: True if the data type is a datetime type.
-        """
-        return self.data_type in (
-            definitions.DATA_TYPE_FAT_DATE_TIME,
-            definitions.DATA_TYPE_FILETIME,
-            definitions.DATA_TYPE_FLOATINGTIME,
-            definitions.DATA_TYPE_POSIX_TIME,
-        )
+        return self._GetCachedValue("value_name", self._DetermineValueName)
 
-    def DataTypeIsFloat(self):
-        """Determines if the data type is a floating-point type.
-
-        Returns:
-          bool: True if the data type is a floating-point type.
-        """
-        return self.data_type in (
-            definitions.DATA_TYPE_FLOAT,
-            definitions.DATA_TYPE_DOUBLE,
-        )
-
-    def DataTypeIsInteger(self):
-        """Determines if the data type is an integer type.
-
-        Returns:
-          bool: True if the data type is an integer type.
-        """
-        return self.data_type in (
-            definitions.DATA_TYPE_INT,
-            definitions.DATA_TYPE_INT32,
-            definitions.DATA_TYPE_OFF64,
-            definitions.DATA_TYPE_SIZE32,
-            definitions.DATA_TYPE_SIZE64,
-            definitions.DATA_TYPE_UINT8,
-            definitions.DATA_TYPE_UINT16,
-            definitions.DATA_TYPE_UINT32,
-            definitions.DATA_TYPE_UINT64,
-        )
-
-    def GetAttributeDescription(self):
-        """Retrieves the fuction as attribute description.
+    def _DetermineAttributeDescription(self):
+        """Determines the fuction as attribute description.
 
         Returns:
           str: function as attribute description.
@@ -487,8 +364,8 @@ class PythonTypeObjectFunctionPrototype:
 
         return description
 
-    def GetDataTypeDescription(self):
-        """Retrieves the data type description.
+    def _DetermineDataTypeDescription(self):
+        """Determines the data type description.
 
         Returns:
           str: data type description.
@@ -536,8 +413,8 @@ class PythonTypeObjectFunctionPrototype:
 
         return data_type_description
 
-    def GetDescription(self):
-        """Retrieves the description.
+    def _DetermineDescription(self):
+        """Determines the description.
 
         Returns:
           list[str]: lines of the description.
@@ -684,6 +561,213 @@ class PythonTypeObjectFunctionPrototype:
 
         return description
 
+    def _DetermineTypeFunction(self):
+        """Determines the type function.
+
+        Returns:
+          str: type function.
+        """
+        # TODO: make overrides more generic.
+        if self._type_function == "set_parent_file":
+            return "set_parent"
+
+        if self._type_function.startswith(
+            "copy_"
+        ) and not self._type_function.startswith("copy_from_"):
+            type_name = self._type_function[5]
+            return f"get_{type_name:s}"
+
+        if self._type_function.startswith(
+            "get_utf8_"
+        ) or self._type_function.startswith("set_utf8_"):
+            return "".join([self._type_function[:4], self._type_function[9:]])
+
+        if self._type_function.startswith("get_data_as_"):
+            _, _, type_function_suffix = self._type_function.partition("_data_as_")
+
+            if type_function_suffix in (
+                "16bit_integer",
+                "32bit_integer",
+                "64bit_integer",
+            ):
+                return "get_data_as_integer"
+
+            if type_function_suffix in ("filetime", "floatingtime"):
+                return "get_data_as_datetime"
+
+            if type_function_suffix == "utf8_string":
+                return "get_data_as_string"
+
+            return self._type_function
+
+        if self._type_function.startswith("get_"):
+            type_function_prefix, _, type_function_suffix = (
+                self._type_function.partition("_by_")
+            )
+
+            if type_function_suffix in ("entry", "index"):
+                return type_function_prefix
+
+            if type_function_suffix in ("utf8_name", "utf8_path"):
+                return "".join([self._type_function[:-10], self._type_function[-5:]])
+
+            if self._type_function.endswith("_utf8_string"):
+                return "".join([self._type_function[:-12], self._type_function[-7:]])
+
+            if self._type_function.endswith("_utf8_string_size"):
+                return "".join([self._type_function[:-17], self._type_function[-12:]])
+
+        return self._type_function
+
+    def _DetermineValueName(self):
+        """Determines the value name.
+
+        Returns:
+          str: value name or None if not available.
+        """
+        value_name = None
+
+        # TODO: make overrides more generic.
+        if self.function_type == definitions.FUNCTION_TYPE_COPY:
+            if self._type_function.startswith("copy_"):
+                value_name = self._type_function[5:]
+
+        elif self.function_type == definitions.FUNCTION_TYPE_COPY_FROM:
+            if self._type_function.startswith("copy_from_"):
+                value_name = self._type_function[10:]
+
+        elif self.function_type == definitions.FUNCTION_TYPE_COPY_TO:
+            if self._type_function.startswith("get_"):
+                value_name = self._type_function[4:]
+
+        elif self.function_type in (
+            definitions.FUNCTION_TYPE_GET,
+            definitions.FUNCTION_TYPE_GET_BY_IDENTIFIER,
+            definitions.FUNCTION_TYPE_GET_BY_INDEX,
+            definitions.FUNCTION_TYPE_GET_BY_NAME,
+            definitions.FUNCTION_TYPE_GET_BY_PATH,
+        ):
+            type_function_prefix, _, _ = self._type_function.partition("_by_")
+
+            if type_function_prefix.startswith("get_"):
+                type_function_prefix = type_function_prefix[4:]
+
+            if type_function_prefix.startswith("utf8_"):
+                type_function_prefix = type_function_prefix[5:]
+
+            value_name = type_function_prefix
+
+        elif self.function_type == definitions.FUNCTION_TYPE_IS:
+            if self._type_function.startswith("is_"):
+                value_name = self._type_function[3:]
+
+        elif self.function_type == definitions.FUNCTION_TYPE_SET:
+            if self._type_function.startswith("set_utf8_"):
+                value_name = self._type_function[9:]
+
+            elif self._type_function.startswith("set_"):
+                value_name = self._type_function[4:]
+
+        return value_name
+
+    def _GetCachedValue(self, key, function):
+        """Retrieves a derived value, determining it on first access.
+
+        Args:
+          key (str): key of the derived value.
+          function (Callable[[], object]): function to determine the derived
+              value.
+
+        Returns:
+          object: derived value.
+        """
+        if key not in self._cached_values:
+            self._cached_values[key] = function()
+
+        return self._cached_values[key]
+
+    def DataTypeIsDatetime(self):
+        """Determines if the data type is a datetime type.
+
+        Returns:
+          bool: True if the data type is a datetime type.
+        """
+        return self._GetCachedValue(
+            "data_type_is_datetime",
+            lambda: self.data_type
+            in (
+                definitions.DATA_TYPE_FAT_DATE_TIME,
+                definitions.DATA_TYPE_FILETIME,
+                definitions.DATA_TYPE_FLOATINGTIME,
+                definitions.DATA_TYPE_POSIX_TIME,
+            ),
+        )
+
+    def DataTypeIsFloat(self):
+        """Determines if the data type is a floating-point type.
+
+        Returns:
+          bool: True if the data type is a floating-point type.
+        """
+        return self._GetCachedValue(
+            "data_type_is_float",
+            lambda: self.data_type
+            in (
+                definitions.DATA_TYPE_FLOAT,
+                definitions.DATA_TYPE_DOUBLE,
+            ),
+        )
+
+    def DataTypeIsInteger(self):
+        """Determines if the data type is an integer type.
+
+        Returns:
+          bool: True if the data type is an integer type.
+        """
+        return self._GetCachedValue(
+            "data_type_is_integer",
+            lambda: self.data_type
+            in (
+                definitions.DATA_TYPE_INT,
+                definitions.DATA_TYPE_INT32,
+                definitions.DATA_TYPE_OFF64,
+                definitions.DATA_TYPE_SIZE32,
+                definitions.DATA_TYPE_SIZE64,
+                definitions.DATA_TYPE_UINT8,
+                definitions.DATA_TYPE_UINT16,
+                definitions.DATA_TYPE_UINT32,
+                definitions.DATA_TYPE_UINT64,
+            ),
+        )
+
+    def GetAttributeDescription(self):
+        """Retrieves the fuction as attribute description.
+
+        Returns:
+          str: function as attribute description.
+        """
+        return self._GetCachedValue(
+            "attribute_description", self._DetermineAttributeDescription
+        )
+
+    def GetDataTypeDescription(self):
+        """Retrieves the data type description.
+
+        Returns:
+          str: data type description.
+        """
+        return self._GetCachedValue(
+            "data_type_description", self._DetermineDataTypeDescription
+        )
+
+    def GetDescription(self):
+        """Retrieves the description.
+
+        Returns:
+          list[str]: lines of the description.
+        """
+        return list(self._GetCachedValue("description", self._DetermineDescription))
+
     def GetValueNameAndPrefix(self):
         """Determines the value name and its prefix.
 
@@ -886,7 +886,9 @@ class TestSourceFile:
           project_configuration (ProjectConfiguration): project configuration.
           source_file_object (file): source file-like object.
         """
-        test_function_prefix = "int {project_configuration.library_name_suffix:s}_test_"
+        test_function_prefix = (
+            f"int {project_configuration.library_name_suffix:s}_test_"
+        )
         in_comment = False
         in_function = False
 
@@ -903,7 +905,7 @@ class TestSourceFile:
                 if line == " */":
                     in_comment = False
 
-            if in_function:
+            elif in_function:
                 lines_function.append(line)
 
                 if line == "}":
@@ -913,12 +915,13 @@ class TestSourceFile:
 
                     self.functions[function_name] = function_lines
 
+                    lines_comment = []
                     in_function = False
 
             elif line.startswith("/* "):
                 lines_comment = [line]
 
-                in_comment = True
+                in_comment = not line.endswith("*/")
 
             elif line.startswith(test_function_prefix) and line.endswith("("):
                 _, _, function_name = line[:-1].partition(" ")
@@ -927,6 +930,9 @@ class TestSourceFile:
 
                 in_function = True
 
+            elif line:
+                lines_comment = []
+
     def Read(self, project_configuration):
         """Reads a source file.
 
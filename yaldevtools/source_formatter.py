@@ -41,6 +41,20 @@ class Variable:
         "void",
     ]
 
+    # Sort ranking per type, where 0 represents a type without ranking.
+    _TYPE_SORT_RANKINGS = {
+        name: ranking for ranking, name in enumerate(_TYPE_SORT_RANKING, start=1)
+    }
+
+    __slots__ = [
+        "is_pointer",
+        "modifiers",
+        "name",
+        "sort_key",
+        "type",
+        "type_sort_ranking",
+    ]
+
     def __init__(self, declaration):
         """Initializes a C variable.
 
@@ -56,12 +70,11 @@ class Variable:
         if is_pointer:
             _, _, name = name.rpartition("*")
 
-        try:
-            variable_type_sort_ranking = 1 + self._TYPE_SORT_RANKING.index(
-                variable_type
-            )
-        except ValueError:
-            variable_type_sort_ranking = 0
+        variable_type_sort_ranking = self._TYPE_SORT_RANKINGS.get(variable_type, 0)
+
+        # If no specific sort ranking use alphabetically ordering without
+        # the trailing '_t'.
+        variable_type_without_suffix, _, _ = variable_type.rpartition("_t")
 
         super().__init__()
         self.is_pointer = is_pointer
@@ -70,13 +83,23 @@ class Variable:
         self.type = variable_type
         self.type_sort_ranking = variable_type_sort_ranking
 
+        # TODO: handle modifiers like const, static
+
+        # Pointers are ranked before non-pointers.
+        self.sort_key = (
+            not is_pointer,
+            variable_type_sort_ranking,
+            variable_type_without_suffix,
+            name,
+        )
+
     def __eq__(self, other):
         """Checks if the variable equals another variable.
 
         Returns:
           bool: True if the variable equals another variable.
         """
-        return self.Compare(other) == 0
+        return self.sort_key == other.sort_key
 
     def __ge__(self, other):
         """Checks if the variable greater equals another variable.
@@ -84,7 +107,7 @@ class Variable:
         Returns:
           bool: True if the variable greater equals another variable.
         """
-        return self.Compare(other) >= 0
+        return self.sort_key >= other.sort_key
 
     def __gt__(self, other):
         """Checks if the variable is greater than another variable.
@@ -92,7 +115,7 @@ class Variable:
         Returns:
           bool: True if the variable is greater than another variable.
         """
-        return self.Compare(other) > 0
+        return self.sort_key > other.sort_key
 
     def __le__(self, other):
         """Checks if the variable less equals another variable.
@@ -100,7 +123,7 @@ class Variable:
         Returns:
           bool: True if the variable less equals another variable.
         """
-        return self.Compare(other) <= 0
+        return self.sort_key <= other.sort_key
 
     def __lt__(self, other):
         """Checks if the variable is less than another variable.
@@ -108,7 +131,7 @@ class Variable:
         Returns:
           bool: True if the variable is less than another variable.
         """
-        return self.Compare(other) < 0
+        return self.sort_key < other.sort_key
 
     def __ne__(self, other):
         """Checks if the variable not equals another variable.
@@ -116,7 +139,19 @@ class Variable:
         Returns:
           bool: True if the variable not equals another variable.
         """
-        return self.Compare(other) != 0
+        return self.sort_key != other.sort_key
+
+    @classmethod
+    def GetSortKey(cls, declaration):
+        """Retrieves the sort key of a C variable declaration.
+
+        Args:
+          declaration (str): C variable declaration.
+
+        Returns:
+          tuple[bool, int, str, str]: sort key of the C variable declaration.
+        """
+        return cls(declaration).sort_key
 
     def Compare(self, variable):
         """Compares the variable with another variable.
@@ -125,43 +160,97 @@ class Variable:
           int: -1 if self should be ranked earlier, 0 if both variables are
               ranked equally, 1 if self should be ranked later
         """
-        if self.is_pointer and not variable.is_pointer:
-            return -1
+        # (a > b) - (a < b) is a Python 3 compatable variant of cmp(a, b)
+        return (self.sort_key > variable.sort_key) - (self.sort_key < variable.sort_key)
 
-        if not self.is_pointer and variable.is_pointer:
-            return 1
 
-        if self.type_sort_ranking < variable.type_sort_ranking:
-            return -1
+class SourceFormatter:
+    """Libyal C source formatter."""
 
-        if self.type_sort_ranking > variable.type_sort_ranking:
-            return 1
+    def _AlignEqualSign(self, line, assignment, alignment_offset):
+        """Vertically aligns the equal sign of a C variable declaration.
 
-        # If no specific sort ranking use alphabetically ordering without
-        # the trailing '_t'.
-        self_type, _, _ = self.type.rpartition("_t")
-        variable_type, _, _ = variable.type.rpartition("_t")
+        Args:
+          line (str): C variable declaration.
+          assignment (tuple[str, str, int]): prefix, suffix and size of the
+              prefix of the assignment in the C variable declaration or None
+              if the declaration has no assignment.
+          alignment_offset (int): aligment offset.
 
-        # (a > b) - (a < b) is a Python 3 compatable variant of cmp(a, b)
-        variable_type_sort_ranking = (self_type > variable_type) - (
-            self_type < variable_type
+        Returns:
+          str: C variable declaration with aligned equal sign.
+        """
+        if not assignment:
+            return line
+
+        prefix, suffix, prefix_size = assignment
+        alignment = " " * (alignment_offset - prefix_size)
+
+        return f"{prefix:s}{alignment:s}={suffix:s}"
+
+    def _DetermineAlignmentOffset(self, assignments):
+        """Determines the alignment offset to vertically align the equal signs.
+
+        Args:
+          assignments (list[tuple[str, str, int]]): prefix, suffix and size of
+              the prefix of the assignments in C variable declarations.
+
+        Returns:
+          int: aligment offset or None if no equal sign was found.
+        """
+        prefix_sizes = [assignment[2] for assignment in assignments if assignment]
+        if not prefix_sizes:
+            return None
+
+        return max(prefix_sizes) + 1
+
+    def _FormatDeclarations(self, declarations, alignment_offset):
+        """Sorts C variable declarations and vertically aligns the equal signs.
+
+        Args:
+          declarations (list[tuple[str, tuple[str, str, int]]]): C variable
+              declarations and their assignments.
+          alignment_offset (int): aligment offset.
+
+        Returns:
+          list[str]: sorted C variable declarations with aligned equal signs.
+        """
+        sorted_declarations = sorted(
+            declarations, key=lambda declaration: Variable.GetSortKey(declaration[0])
         )
+        return [
+            self._AlignEqualSign(line, assignment, alignment_offset)
+            for line, assignment in sorted_declarations
+        ]
 
-        if variable_type_sort_ranking != 0:
-            return variable_type_sort_ranking
+    def _ParseAssignment(self, line):
+        """Parses the assignment in a C variable declaration.
 
-        # TODO: handle modifiers like const, static
+        Args:
+          line (str): C variable declaration.
 
-        # (a > b) - (a < b) is a Python 3 compatable variant of cmp(a, b)
-        return (self.name > variable.name) - (self.name < variable.name)
+        Returns:
+          tuple[str, str, int]: prefix, suffix and size of the prefix of the
+              assignment, where tabs count as 8 characters, or None if the
+              declaration has no assignment.
+        """
+        stripped_line = line.strip()
+        if "=" not in stripped_line or stripped_line.endswith(" = {"):
+            return None
 
+        prefix, _, suffix = line.rpartition("=")
+        prefix = prefix.rstrip()
+        prefix_size = len(prefix) + (prefix.count("\t") * 7)
 
-class SourceFormatter:
-    """Libyal C source formatter."""
+        return prefix, suffix, prefix_size
 
     def FormatLineIndentation(self, line, indentation_level):
         """Formats the identation for a line of C source.
 
+        Up to the indentation level, every tab or sequence of up to 8 spaces,
+        optionally followed by a tab, is replaced by a tab. Tabs after the
+        indentation are replaced by 8 spaces.
+
         Args:
           line (str): line of C source.
           indentation_level (int): the indentation level.
@@ -169,16 +258,21 @@ class SourceFormatter:
         Returns:
           str: line of C source with formatted indentation.
         """
+        # Fast path for lines that are already formatted.
+        if line[indentation_level:].find("\t") == -1 and line.startswith(
+            "\t" * indentation_level
+        ):
+            return line
+
         index = 0
         line_length = len(line)
+        number_of_tabs = 0
 
-        for _ in range(0, indentation_level):
+        while number_of_tabs < indentation_level and index < line_length:
             maximum_end_index = min(index + 8, line_length)
 
             end_index = index
-            while end_index < maximum_end_index:
-                if line[end_index] != " ":
-                    break
+            while end_index < maximum_end_index and line[end_index] == " ":
                 end_index += 1
 
             # Merge less than 8 spaces and a tab.
@@ -188,21 +282,14 @@ class SourceFormatter:
 
                 end_index += 1
 
-            indentation = set(line[index:end_index])
-            if indentation == set([" "]) or indentation == set([" ", "\t"]):
-                line = "\t".join([line[:index], line[end_index:]])
-                line_length = len(line)
-
-            index += 1
+            index = end_index
+            number_of_tabs += 1
 
-        while index < line_length:
-            if line[index] == "\t":
-                line = "        ".join([line[:index], line[index + 1 :]])
-                line_length = len(line)
+        remainder = line[index:]
+        if "\t" in remainder:
+            remainder = remainder.replace("\t", " " * 8)
 
-            index += 1
-
-        return line
+        return "".join(["\t" * number_of_tabs, remainder])
 
     def FormatSource(self, lines):
         """Formats lines of C source.
@@ -249,12 +336,17 @@ class SourceFormatter:
 
             # TODO: refactor to separate function
             if declaration_lines:
-                alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(
-                    declaration_lines
+                declarations = [
+                    (declaration_line, self._ParseAssignment(declaration_line))
+                    for declaration_line in declaration_lines
+                ]
+                alignment_offset = self._DetermineAlignmentOffset(
+                    [assignment for _, assignment in declarations]
                 )
 
-                block_of_declaration_lines = []
-                for declaration_line in declaration_lines:
+                block_of_declarations = []
+                for declaration in declarations:
+                    declaration_line, _ = declaration
                     stripped_declaration_line = declaration_line.strip()
                     if stripped_declaration_line and not (
                         stripped_declaration_line.startswith("#")
@@ -262,19 +354,26 @@ class SourceFormatter:
                         or stripped_declaration_line.startswith("*")
                         or stripped_declaration_line.startswith("*/")
                     ):
-                        block_of_declaration_lines.append(declaration_line)
+                        block_of_declarations.append(declaration)
                         continue
 
-                    if block_of_declaration_lines:
-                        block_of_declaration_lines.sort(key=Variable)
-                        block_of_declaration_lines = self.VerticalAlignEqualSigns(
-                            block_of_declaration_lines, alignment_offset
+                    if block_of_declarations:
+                        formatted_lines.extend(
+                            self._FormatDeclarations(
+                                block_of_declarations, alignment_offset
+                            )
                         )
-                        formatted_lines.extend(block_of_declaration_lines)
-                        block_of_declaration_lines = []
+                        block_of_declarations = []
 
                     formatted_lines.append(declaration_line)
 
+                if block_of_declarations:
+                    formatted_lines.extend(
+                        self._FormatDeclarations(
+                            block_of_declarations, alignment_offset
+                        )
+                    )
+
                 declaration_lines = []
 
             line = self.FormatLineIndentation(line, indentation_level)
@@ -313,12 +412,13 @@ class SourceFormatter:
         Returns:
           list[str]: formatted lines of C source.
         """
-        alignment_offset = self.VerticalAlignEqualSignsDetermineOffset(lines)
+        assignments = [self._ParseAssignment(line) for line in lines]
+        alignment_offset = self._DetermineAlignmentOffset(assignments)
 
         in_declaration_block = False
         formatted_lines = []
-        declaration_lines = []
-        for line in lines:
+        declarations = []
+        for line, assignment in zip(lines, assignments):
             striped_line = line.strip()
             if in_declaration_block:
                 if striped_line.endswith("};"):
@@ -337,24 +437,19 @@ class SourceFormatter:
                 and not striped_line.startswith("/*")
                 and not striped_line.startswith("*/")
             ):
-                declaration_lines.append(line)
+                declarations.append((line, assignment))
                 continue
 
-            declaration_lines.sort(key=Variable)
-            declaration_lines = self.VerticalAlignEqualSigns(
-                declaration_lines, alignment_offset
+            formatted_lines.extend(
+                self._FormatDeclarations(declarations, alignment_offset)
             )
-            formatted_lines.extend(declaration_lines)
             formatted_lines.append(line)
-            declaration_lines = []
+            declarations = []
 
-        if declaration_lines:
-            declaration_lines.sort(key=Variable)
-            declaration_lines = self.VerticalAlignEqualSigns(
-                declaration_lines, alignment_offset
+        if declarations:
+            formatted_lines.extend(
+                self._FormatDeclarations(declarations, alignment_offset)
             )
-            formatted_lines.extend(declaration_lines)
-            declaration_lines = []
 
         return formatted_lines
 
@@ -368,22 +463,10 @@ class SourceFormatter:
         Returns:
           list[str]: C variable declarations with aligned equal signs.
         """
-        aligned_lines = []
-        for line in lines:
-            stripped_line = line.strip()
-            if "=" in stripped_line and not stripped_line.endswith(" = {"):
-                prefix, _, suffix = line.rpartition("=")
-                prefix = prefix.rstrip()
-                formatted_prefix = prefix.replace("\t", " " * 8)
-
-                alignment_size = alignment_offset - len(formatted_prefix)
-                alignment = " " * alignment_size
-
-                line = f"{prefix:s}{alignment:s}={suffix:s}"
-
-            aligned_lines.append(line)
-
-        return aligned_lines
+        return [
+            self._AlignEqualSign(line, self._ParseAssignment(line), alignment_offset)
+            for line in lines
+        ]
 
     def VerticalAlignEqualSignsDetermineOffset(self, lines):
         """Determines the alignment offset to vertically align the equal signs.
@@ -394,21 +477,5 @@ class SourceFormatter:
         Returns:
           int: aligment offset or None if no equal sign was found.
         """
-        alignment_offset = None
-        for line in lines:
-            stripped_line = line.strip()
-            if "=" not in stripped_line or stripped_line.endswith(" = {"):
-                continue
-
-            prefix, _, _ = line.rpartition("=")
-            prefix = prefix.rstrip()
-            formatted_prefix = prefix.replace("\t", " " * 8)
-
-            equal_sign_offset = len(formatted_prefix) + 1
-
-            if alignment_offset is None:
-                alignment_offset = equal_sign_offset
-            else:
-                alignment_offset = max(alignment_offset, equal_sign_offset)
-
-        return alignment_offset
+        assignments = [self._ParseAssignment(line) for line in lines]
+        return self._DetermineAlignmentOffset(assignments)
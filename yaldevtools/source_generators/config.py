@@ -803,7 +803,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the brew build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: brew build dependencies.
@@ -836,7 +836,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the Cygwin build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: Cygwin build dependencies.
@@ -898,7 +898,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the dpkg build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: dpkg build dependencies.
@@ -911,7 +911,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the dpkg build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           list[str]: dpkg build dependencies.
@@ -999,7 +999,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the dpkg packaging dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: dpkg packaging dependencies.
@@ -1019,7 +1019,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the FreeBSD build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: FreeBSD build dependencies.
@@ -1061,7 +1061,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the MinGW-MSYS2 build dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: MinGW-MSYS2 build dependencies.
@@ -1105,7 +1105,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the Python module development status.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           str: Python module development status.
@@ -1127,7 +1127,7 @@ class ConfigurationFileGenerator(interface.SourceFileGenerator):
         """Retrieves the rpm packaging dependencies.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
 
         Returns:
           list[str]: rpm packaging dependencies.
@@ -1,6 +1,8 @@
 """The source file generator interface."""
 
 import abc
+import collections
+import collections.abc
 import datetime
 import logging
 import os
@@ -74,9 +76,68 @@ class TemplateString(string.Template):
         return self.pattern.sub(ConvertPlaceholder, self.template)
 
 
+class AttributesMapping(collections.abc.Mapping):
+    """Read-only mapping of the instance attributes of an object.
+
+    Values are retrieved from the object when they are looked up, instead of
+    being copied when the mapping is created.
+    """
+
+    def __init__(self, attributes_object):
+        """Initializes an attributes mapping.
+
+        Args:
+          attributes_object (object): object that contains the attributes.
+        """
+        super().__init__()
+        self._attributes_object = attributes_object
+
+    def __getitem__(self, name):
+        """Retrieves the value of an attribute.
+
+        Args:
+          name (str): name of the attribute.
+
+        Returns:
+          object: value of the attribute.
+
+        Raises:
+          KeyError: if the object has no instance attribute with the name.
+        """
+        if name.startswith("_") or hasattr(type(self._attributes_object), name):
+            raise KeyError(name)
+
+        try:
+            return getattr(self._attributes_object, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def __iter__(self):
+        """Iterates over the names of the attributes.
+
+        Yields:
+          str: name of the attribute.
+        """
+        for name in vars(self._attributes_object):
+            if not name.startswith("_"):
+                yield name
+
+    def __len__(self):
+        """Retrieves the number of attributes.
+
+        Returns:
+          int: number of attributes.
+        """
+        return sum(1 for _ in self)
+
+
 class BaseSourceFileGenerator:
     """Source file generator."""
 
+    # Globals used to evaluate conditions, where __builtins__ contains an empty
+    # dictionary so that conditions cannot use built-in functions.
+    _CONDITION_GLOBALS = {"__builtins__": {}}
+
     _PLACEHOLDER_VALUE_CALLBACKS = {}
 
     _SUPPORTED_MODIFIERS = frozenset(["remove_trailing_empty_lines", "sort_lines"])
@@ -88,6 +149,8 @@ class BaseSourceFileGenerator:
           templates_path (str): path of the directory containing the template files.
         """
         super().__init__()
+        self._operations_per_file = {}
+        self._template_strings = {}
         self._templates_path = templates_path
 
     def _GenerateSection(
@@ -151,7 +214,7 @@ class BaseSourceFileGenerator:
           operations_file_name (str): name of the operations file.
           generator_operation (GeneratorOperation): generator operation.
           operations (dict[str, GeneratorOperation]): operations per identifier.
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           templates_path (str): path of the directory containing the template files.
 
         Return:
@@ -229,7 +292,7 @@ class BaseSourceFileGenerator:
           operations_file_name (str): name of the operations file.
           group_operation (GeneratorOperation): group operation.
           operations (dict[str, GeneratorOperation]): operations per identifier.
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           templates_path (str): path of the directory containing the template files.
 
         Return:
@@ -239,7 +302,8 @@ class BaseSourceFileGenerator:
             expression = group_operation.GetConditionExpression()
 
             try:
-                result = eval(expression, namespace)  # pylint: disable=eval-used
+                # pylint: disable=eval-used
+                result = eval(expression, self._CONDITION_GLOBALS, namespace)
             except Exception as exception:  # pylint: disable=broad-exception-caught
                 logging.warning(
                     f"Unable to check condition for operation: "
@@ -289,11 +353,7 @@ class BaseSourceFileGenerator:
         """
         operations_file_path = os.path.join(self._templates_path, operations_file_name)
 
-        operations_file = yaml_operations_file.YAMLGeneratorOperationsFile()
-        operations = {
-            operation.identifier: operation
-            for operation in operations_file.ReadFromFile(operations_file_path)
-        }
+        operations = self._ReadOperationsFile(operations_file_path)
 
         main_operation = operations.get(main_operation_name, None)
         if not main_operation:
@@ -305,12 +365,14 @@ class BaseSourceFileGenerator:
 
         templates_path = os.path.dirname(operations_file_path)
 
-        namespace = {}
+        # The namespace consists of layers for the project configuration and
+        # the template configuration, which are not copied. Values set while
+        # generating are stored in the first layer.
+        namespace_layers = [{}, template_configuration]
         if project_configuration:
-            namespace.update(project_configuration.__dict__)
-        namespace.update(template_configuration)
-        # Make sure __builtins__ contains an empty dictionary.
-        namespace["__builtins__"] = {}
+            namespace_layers.append(AttributesMapping(project_configuration))
+
+        namespace = collections.ChainMap(*namespace_layers)
 
         output_data = self._GenerateSectionsFromGeneratorOperation(
             operations_file_name, main_operation, operations, namespace, templates_path
@@ -333,7 +395,7 @@ class BaseSourceFileGenerator:
           operations_file_name (str): name of the operations file.
           selection_operation (GeneratorOperation): selection operation.
           operations (dict[str, GeneratorOperation]): operations per identifier.
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           templates_path (str): path of the directory containing the template files.
 
         Return:
@@ -343,7 +405,8 @@ class BaseSourceFileGenerator:
             expression = selection_operation.GetConditionExpression()
 
             try:
-                result = eval(expression, namespace)  # pylint: disable=eval-used
+                # pylint: disable=eval-used
+                result = eval(expression, self._CONDITION_GLOBALS, namespace)
             except Exception as exception:  # pylint: disable=broad-exception-caught
                 logging.warning(
                     f"Unable to check condition for operation: "
@@ -396,7 +459,7 @@ class BaseSourceFileGenerator:
           operations_file_name (str): name of the operations file.
           sequence_operation (GeneratorOperation): sequence operation.
           operations (dict[str, GeneratorOperation]): operations per identifier.
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           templates_path (str): path of the directory containing the template files.
 
         Return:
@@ -406,7 +469,8 @@ class BaseSourceFileGenerator:
             expression = sequence_operation.GetConditionExpression()
 
             try:
-                result = eval(expression, namespace)  # pylint: disable=eval-used
+                # pylint: disable=eval-used
+                result = eval(expression, self._CONDITION_GLOBALS, namespace)
             except Exception as exception:  # pylint: disable=broad-exception-caught
                 logging.warning(
                     f"Unable to check condition for operation: "
@@ -430,6 +494,10 @@ class BaseSourceFileGenerator:
 
         output_data = ""
 
+        # Store the placeholder value in a separate layer to not overwrite
+        # values of the enclosing namespace.
+        namespace = namespace.new_child()
+
         for value in sequence_input:
             namespace[sequence_operation.placeholder] = value
 
@@ -451,8 +519,6 @@ class BaseSourceFileGenerator:
                 )
                 output_data = "".join([output_data, operation_output_data])
 
-        del namespace[sequence_operation.placeholder]
-
         return output_data
 
     def _GenerateSectionsFromTemplateOperation(
@@ -469,7 +535,7 @@ class BaseSourceFileGenerator:
           operations_file_name (str): name of the operations file.
           template_operation (GeneratorOperation): template operation.
           operations (dict[str, GeneratorOperation]): operations per identifier.
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           templates_path (str): path of the directory containing the template files.
 
         Return:
@@ -481,7 +547,8 @@ class BaseSourceFileGenerator:
             expression = template_operation.GetConditionExpression()
 
             try:
-                result = eval(expression, namespace)  # pylint: disable=eval-used
+                # pylint: disable=eval-used
+                result = eval(expression, self._CONDITION_GLOBALS, namespace)
             except Exception as exception:  # pylint: disable=broad-exception-caught
                 logging.warning(
                     f"Unable to check condition for operation: "
@@ -527,7 +594,7 @@ class BaseSourceFileGenerator:
         """Retrieves the value of a template placeholder.
 
         Args:
-          namespace (dict[str, object])): expression namespace.
+          namespace (Mapping[str, object]): expression namespace.
           identifier (str): identifier of the value in the template.
 
         Returns:
@@ -548,23 +615,63 @@ class BaseSourceFileGenerator:
 
         return value
 
+    def _ReadOperationsFile(self, path):
+        """Reads generator operations from file.
+
+        The operations are cached, so that compiled condition expressions are
+        reused by subsequent generated files, and only read again when the
+        modification time of the file has changed.
+
+        Args:
+          path (str): path of the generator operations file.
+
+        Returns:
+          dict[str, GeneratorOperation]: operations per identifier.
+        """
+        modification_time = os.stat(path).st_mtime_ns
+
+        cached_modification_time, operations = self._operations_per_file.get(
+            path, (None, None)
+        )
+        if cached_modification_time != modification_time:
+            operations_file = yaml_operations_file.YAMLGeneratorOperationsFile()
+            operations = {
+                operation.identifier: operation
+                for operation in operations_file.ReadFromFile(path)
+            }
+            self._operations_per_file[path] = (modification_time, operations)
+
+        return operations
+
     def _ReadTemplateFile(self, path):
         """Reads a template string from file.
 
+        The template string is cached and only read again when the
+        modification time of the file has changed.
+
         Args:
           path (str): path of the file containing the template string.
 
         Returns:
           TemplateString: template string.
         """
-        # Read with binary mode to make sure end of line characters are not
-        # converted.
-        with open(path, "rb") as file_object:
-            file_data = file_object.read()
+        modification_time = os.stat(path).st_mtime_ns
+
+        cached_modification_time, template_string = self._template_strings.get(
+            path, (None, None)
+        )
+        if cached_modification_time != modification_time:
+            # Read with binary mode to make sure end of line characters are not
+            # converted.
+            with open(path, "rb") as file_object:
+                file_data = file_object.read()
+
+            file_data = file_data.decode("utf8")
 
-        file_data = file_data.decode("utf8")
+            template_string = TemplateString(file_data)
+            self._template_strings[path] = (modification_time, template_string)
 
-        return TemplateString(file_data)
+        return template_string
 
     def _RemoveTrailingEmptyLines(self, text):
         """Removes trailing empty lines from text.
@@ -1,9 +1,12 @@
 """The source file generator for test source files."""
 
+import hashlib
+import json
 import logging
 import os
 import stat
 
+from yaldevtools import cache
 from yaldevtools import source_file
 from yaldevtools.source_generators import interface
 
@@ -16,6 +19,34 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
     # TODO: replace by type specific test scripts.
     _PYTHON_FUNCTION_WITH_INPUT_NAMES = ("file", "handle", "volume")
 
+    def __init__(
+        self,
+        projects_directory,
+        data_directory,
+        templates_path,
+        cache_directory=None,
+        incremental=False,
+    ):
+        """Initializes a test source file generator.
+
+        Args:
+          projects_directory (str): path of the projects directory.
+          data_directory (str): path of the data directory.
+          templates_path (str): path of the directory containing the template files.
+          cache_directory (Optional[str]): path of the directory in which the
+              fingerprints of the generated test functions are stored, where
+              None represents no test functions are reused.
+          incremental (Optional[bool]): True if test functions in existing test
+              source files that are not affected by changes in the function
+              prototype, the templates or the test data should be reused
+              instead of regenerated.
+        """
+        super().__init__(projects_directory, data_directory, templates_path)
+        self._cache_directory = cache_directory
+        self._incremental = incremental
+        self._previous_fingerprints = {}
+        self._test_function_fingerprints = {}
+
     def _FormatTestData(self, data):
         """Formats the test data as a C byte array.
 
@@ -258,6 +289,68 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         output_writer.WriteFile(output_filename, output_data, access_mode=access_mode)
         return True
 
+    def _GenerateUnaffectedExistingFunction(
+        self,
+        function_name,
+        test_function_name,
+        template_filenames,
+        template_mappings,
+        header_file,
+        test_source_file,
+        output_writer,
+        output_filename,
+        data_filenames=None,
+    ):
+        """Writes an existing function to the output if it is not affected.
+
+        In incremental mode an existing test function is considered affected
+        when its fingerprint differs from the fingerprint stored when the test
+        function was last generated or reused.
+
+        Args:
+          function_name (str): name of the library function.
+          test_function_name (str): name of the test function.
+          template_filenames (list[str]): paths of the template files used to
+              generate the test function.
+          template_mappings (dict[str, str]): template mappings, where the key
+              maps to the name of a template variable.
+          header_file (LibraryHeaderFile): library header file.
+          test_source_file (TestSourceFile): test source file.
+          output_writer (OutputWriter): output writer.
+          output_filename (str): path of the output file.
+          data_filenames (Optional[list[str]]): paths of the test data files
+              used by the test function.
+
+        Returns:
+          bool: True if the existing function was written, False otherwise.
+        """
+        if not self._incremental or not self._cache_directory:
+            return False
+
+        fingerprint = self._GetTestFunctionFingerprint(
+            function_name,
+            template_filenames,
+            template_mappings,
+            header_file,
+            data_filenames=data_filenames,
+        )
+        if not fingerprint:
+            return False
+
+        self._test_function_fingerprints[test_function_name] = fingerprint
+
+        previous_fingerprint = self._previous_fingerprints.get(test_function_name, None)
+        if fingerprint != previous_fingerprint:
+            return False
+
+        return self._GenerateExistingFunction(
+            test_function_name,
+            test_source_file,
+            output_writer,
+            output_filename,
+            access_mode="a",
+        )
+
     def _GenerateTestFunctions(
         self,
         project_configuration,
@@ -1620,6 +1713,22 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
                     output_writer,
                     output_filename,
                 )
+                if self._GenerateUnaffectedExistingFunction(
+                    function_name,
+                    test_function_name,
+                    [template_filename],
+                    template_mappings,
+                    header_file,
+                    test_source_file,
+                    output_writer,
+                    output_filename,
+                ):
+                    logging.info(
+                        f'Used existing tests source code for type: "{type_name:s}" '
+                        f'function: "{type_function:s}" since it is not affected'
+                    )
+                    return function_name, test_function_name, have_extern
+
                 logging.info(
                     f'Generating tests source code for type: "{type_name:s}" function: '
                     f'"{type_function:s}" with template: {function_template:s}'
@@ -1863,14 +1972,35 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
             output_writer,
             output_filename,
         )
-        names_string = ", ".join(template_names)
-        logging.info(
-            f'Generating tests source code for type: "{type_name:s}" function: '
-            f'"{type_function:s}" with templates: {names_string:s}'
-        )
-        self._GenerateSections(
-            template_filenames, template_mappings, output_filename, access_mode="a"
-        )
+        data_filenames = []
+        if test_data_size is not None:
+            data_filenames.append(os.path.join("tests", "data", f"{type_name:s}.1"))
+
+        if self._GenerateUnaffectedExistingFunction(
+            function_name,
+            test_function_name,
+            template_filenames,
+            template_mappings,
+            header_file,
+            test_source_file,
+            output_writer,
+            output_filename,
+            data_filenames=data_filenames,
+        ):
+            logging.info(
+                f'Used existing tests source code for type: "{type_name:s}" '
+                f'function: "{type_function:s}" since it is not affected'
+            )
+        else:
+            names_string = ", ".join(template_names)
+            logging.info(
+                f'Generating tests source code for type: "{type_name:s}" function: '
+                f'"{type_function:s}" with templates: {names_string:s}'
+            )
+            self._GenerateSections(
+                template_filenames, template_mappings, output_filename, access_mode="a"
+            )
+
         del template_mappings["function_name"]
         del template_mappings["function_variables"]
         del template_mappings["initialize_value_name"]
@@ -1977,6 +2107,22 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
             )
             return function_name, None, have_extern
 
+        if self._GenerateUnaffectedExistingFunction(
+            function_name,
+            test_function_name,
+            [template_filename],
+            template_mappings,
+            header_file,
+            test_source_file,
+            output_writer,
+            output_filename,
+        ):
+            logging.info(
+                f'Used existing tests source code for type: "{type_name:s}" '
+                f'function: "{type_function:s}" since it is not affected'
+            )
+            return function_name, test_function_name, have_extern
+
         self._GenerateSection(
             template_filename, template_mappings, output_filename, access_mode="a"
         )
@@ -2400,6 +2546,13 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
                 )
                 return False, False
 
+        self._previous_fingerprints = {}
+        self._test_function_fingerprints = {}
+        if test_source_file and self._incremental and self._cache_directory:
+            self._previous_fingerprints = self._ReadTestFunctionFingerprints(
+                output_filename
+            )
+
         type_size_name = self._GetTypeSizeName(project_configuration, type_name)
 
         templates_path = os.path.join(self._templates_path, "yal_test_type")
@@ -2838,6 +2991,9 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         self._SortIncludeHeaders(project_configuration, output_filename)
         self._SortVariableDeclarations(output_filename)
 
+        if self._incremental and self._cache_directory:
+            self._WriteTestFunctionFingerprints(output_filename)
+
         return True, with_read_file_io_handle_function
 
     # pylint: disable=too-many-arguments
@@ -3612,6 +3768,88 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         )
         return template_mappings
 
+    def _GetTestFunctionFingerprint(
+        self,
+        function_name,
+        template_filenames,
+        template_mappings,
+        header_file,
+        data_filenames=None,
+    ):
+        """Retrieves the fingerprint of a test function.
+
+        The fingerprint is a hash of the library function prototype, the
+        contents of the templates and test data files, and the values of the
+        template mappings used by the templates.
+
+        Args:
+          function_name (str): name of the library function.
+          template_filenames (list[str]): paths of the template files used to
+              generate the test function.
+          template_mappings (dict[str, str]): template mappings, where the key
+              maps to the name of a template variable.
+          header_file (LibraryHeaderFile): library header file.
+          data_filenames (Optional[list[str]]): paths of the test data files
+              used by the test function.
+
+        Returns:
+          str: SHA-256 hexadecimal digest of the test function or None if a
+              template or test data file cannot be read.
+        """
+        hasher = hashlib.sha256()
+
+        function_prototype = header_file.functions_per_name.get(function_name, None)
+        if function_prototype:
+            arguments_string = function_prototype.CopyToString()
+            hasher.update(
+                (
+                    f"{function_prototype.return_type!s} {function_prototype.name:s}"
+                    f"( {arguments_string:s} ) extern: "
+                    f"{function_prototype.have_extern!s}\n"
+                ).encode("utf8")
+            )
+
+        mapping_names = set()
+        for path in list(template_filenames) + list(data_filenames or []):
+            try:
+                with open(path, "rb") as file_object:
+                    file_data = file_object.read()
+            except OSError:
+                return None
+
+            hasher.update(f"{len(file_data):d}\n".encode("utf8"))
+            hasher.update(file_data)
+
+            if path in template_filenames:
+                template_string = self._ReadTemplateFile(path)
+                for match in template_string.pattern.finditer(template_string.template):
+                    identifier = match.group("named") or match.group("braced")
+                    if identifier:
+                        identifier, _, _ = identifier.partition(":")
+                        identifier, _, _ = identifier.partition(".")
+                        mapping_names.add(identifier)
+
+        for name in sorted(mapping_names):
+            value = template_mappings.get(name, None)
+            hasher.update(f"{name:s}: {value!r}\n".encode("utf8"))
+
+        return hasher.hexdigest()
+
+    def _GetTestFunctionFingerprintsPath(self, output_filename):
+        """Retrieves the path of the fingerprints file of a test source file.
+
+        Args:
+          output_filename (str): path of the test source file.
+
+        Returns:
+          str: path of the fingerprints file.
+        """
+        path = os.path.abspath(output_filename)
+        path_hash = hashlib.sha256(path.encode("utf8")).hexdigest()
+        return os.path.join(
+            self._cache_directory, "tests-fingerprints", f"{path_hash:s}.json"
+        )
+
     def _GetTestFunctionName(self, project_configuration, type_name, type_function):
         """Retrieves the test function name.
 
@@ -3805,6 +4043,49 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         with open(test_data_file, "rb") as file_object:
             return file_object.read()
 
+    def _ReadTestFunctionFingerprints(self, output_filename):
+        """Reads the fingerprints of the test functions of a test source file.
+
+        A missing or unreadable fingerprints file results in no fingerprints.
+
+        Args:
+          output_filename (str): path of the test source file.
+
+        Returns:
+          dict[str, str]: fingerprints per test function name.
+        """
+        path = self._GetTestFunctionFingerprintsPath(output_filename)
+        try:
+            with open(path, encoding="utf8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(json_dict, dict):
+            return {}
+
+        if json_dict.get("path", None) != os.path.abspath(output_filename):
+            return {}
+
+        return json_dict.get("fingerprints", None) or {}
+
+    def _WriteTestFunctionFingerprints(self, output_filename):
+        """Writes the fingerprints of the test functions of a test source file.
+
+        Args:
+          output_filename (str): path of the test source file.
+        """
+        json_dict = {
+            "fingerprints": self._test_function_fingerprints,
+            "path": os.path.abspath(output_filename),
+        }
+        json_string = json.dumps(json_dict)
+        cache.WriteCacheFile(
+            self._GetTestFunctionFingerprintsPath(output_filename),
+            json_string.encode("utf8"),
+        )
+
     def Generate(self, project_configuration, output_writer):
         """Generates tests source files.
 
@@ -3814,7 +4095,6 @@ class TestSourceFileGenerator(interface.SourceFileGenerator):
         """
         # TODO: fix fcache support of maximum_cache_entries
         # TODO: compare handle fdata and cdata differences, and includes
-        # TODO: weave existing test files?
         # TODO: use data files to generate test data tests/input/.data/<name>
         # TODO: add support for options in configuration file to set option sets.
         # TODO: fix creation of fwsi_test_file_entry_(item) when include header
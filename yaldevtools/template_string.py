@@ -1,24 +1,81 @@
 """Template string generator."""
 
+import os
 import string
 
 
 class TemplateStringGenerator:
     """Template string generator."""
 
+    def __init__(self, template_class=string.Template):
+        """Initializes a template string generator.
+
+        Args:
+          template_class (Optional[type]): template string class, such as
+              string.Template or a subclass that supports placeholder
+              modifiers.
+        """
+        super().__init__()
+        self._output_buffers = {}
+        self._template_class = template_class
+        self._templates = {}
+
     def _ReadTemplateFile(self, path):
         """Reads a template string from file.
 
+        The template string is cached and only read again when the
+        modification time of the file has changed.
+
         Args:
           path (str): path of the file containing the template string.
 
         Returns:
           string.Template: template string.
         """
-        with open(path, "r", encoding="utf8") as file_object:
-            file_data = file_object.read()
+        modification_time = os.stat(path).st_mtime_ns
+
+        cached_modification_time, template_string = self._templates.get(
+            path, (None, None)
+        )
+        if cached_modification_time != modification_time:
+            with open(path, "r", encoding="utf8") as file_object:
+                file_data = file_object.read()
+
+            template_string = self._template_class(file_data)
+            self._templates[path] = (modification_time, template_string)
+
+        return template_string
+
+    def Discard(self, output_path=None):
+        """Discards the buffered output without writing it to the output files.
+
+        Args:
+          output_path (Optional[str]): path of the output file, where None
+              represents all output files with buffered output.
+        """
+        if output_path is None:
+            self._output_buffers = {}
+        else:
+            self._output_buffers.pop(output_path, None)
+
+    def Flush(self, output_path=None):
+        """Writes the buffered output to the output files.
+
+        Args:
+          output_path (Optional[str]): path of the output file, where None
+              represents all output files with buffered output.
+        """
+        if output_path is None:
+            output_paths = list(self._output_buffers.keys())
+        elif output_path in self._output_buffers:
+            output_paths = [output_path]
+        else:
+            output_paths = []
 
-        return string.Template(file_data)
+        for path in output_paths:
+            access_mode, output_data = self._output_buffers.pop(path)
+            with open(path, access_mode, encoding="utf8") as file_object:
+                file_object.write("".join(output_data))
 
     def Generate(self, template_path, template_mappings):
         """Generates output based on the template string.
@@ -46,3 +103,29 @@ class TemplateStringGenerator:
                     f"{exception!s}"
                 )
             )
+
+    def GenerateSection(
+        self, template_path, template_mappings, output_path, access_mode="w"
+    ):
+        """Generates a section of an output file based on the template string.
+
+        The section is buffered in memory until Flush is called.
+
+        Args:
+          template_path (str): path of the template file.
+          template_mappings (dict[str, str]): template mappings, where the key
+              maps to the name of a template variable.
+          output_path (str): path of the output file.
+          access_mode (Optional[str]): output file access mode, where "w"
+              replaces previously generated sections and "a" appends to them.
+
+        Raises:
+          RuntimeError: if the template cannot be formatted.
+        """
+        output_data = self.Generate(template_path, template_mappings)
+
+        output_buffer = self._output_buffers.get(output_path, None)
+        if access_mode == "w" or not output_buffer:
+            self._output_buffers[output_path] = (access_mode, [output_data])
+        else:
+            output_buffer[1].append(output_data)